@@ -0,0 +1,31 @@
+"""Labelled sample write throughput."""
+
+from __future__ import annotations
+
+from itertools import count
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+pytest.importorskip("cv2")
+pytest.importorskip("textual")
+
+from midori_ai_hello.capture_screen import save_sample  # noqa: E402
+
+
+def bench_save_sample(benchmark, tmp_path: Path, synthetic_frame: np.ndarray) -> None:
+    subjects = (f"user{i}" for i in count())
+
+    def write() -> tuple[Path, Path]:
+        return save_sample(
+            synthetic_frame,
+            (10, 10, 100, 100),
+            (0, 0, 300, 400),
+            next(subjects),
+            "0",
+            tmp_path,
+        )
+
+    image_path, label_path = benchmark(write, rounds=50)
+    assert image_path.exists() and label_path.exists()
@@ -0,0 +1,33 @@
+"""Config parse and save cost."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from midori_ai_hello.config import Config
+
+
+def _config(tmp_path: Path) -> Config:
+    return Config(
+        dataset=str(tmp_path / "dataset"),
+        epochs=10,
+        batch=8,
+        idle_threshold=300,
+        model="yolov8n.pt",
+        cameras=[f"/dev/video{i}" for i in range(8)],
+        class_thresholds={"alice": 0.6, "bob": 0.5},
+    )
+
+
+def bench_config_save(benchmark, tmp_path: Path) -> None:
+    config = _config(tmp_path)
+    path = tmp_path / "config.yaml"
+    benchmark(config.save, path, rounds=100)
+    assert path.exists()
+
+
+def bench_config_load(benchmark, tmp_path: Path) -> None:
+    path = tmp_path / "config.yaml"
+    _config(tmp_path).save(path)
+    loaded = benchmark(Config.load, path, rounds=100)
+    assert len(loaded.cameras) == 8
@@ -0,0 +1,88 @@
+"""ScreenLockManager presence event handling under flapping input."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Callable
+
+from midori_ai_hello.fake_screensaver import FakeScreenSaverBus
+from midori_ai_hello.kde_lock import KDEScreenLocker
+from midori_ai_hello.screen_lock_manager import ScreenLockManager
+
+
+EVENTS = 1000
+
+
+class FakeLocker:
+    def __init__(self) -> None:
+        self._handler: Callable[[bool], Any] | None = None
+
+    async def add_active_changed_handler(self, handler: Callable[[bool], Any]) -> None:
+        self._handler = handler
+
+    async def lock(self) -> None:
+        if self._handler:
+            await self._handler(True)
+
+    async def set_active(self, active: bool, reply: bool = True) -> None:
+        if self._handler:
+            await self._handler(active)
+
+
+class FakePresence:
+    def __init__(self) -> None:
+        self.listeners: list[Callable[[bool], Any]] = []
+
+    def add_listener(self, cb: Callable[[bool], Any]) -> None:
+        self.listeners.append(cb)
+
+
+def bench_presence_flapping(benchmark) -> None:
+    events: list[tuple[str, object]] = []
+
+    async def run() -> None:
+        presence = FakePresence()
+        manager = ScreenLockManager(
+            FakeLocker(), presence, absent_timeout=60.0, notify=events.append
+        )
+        await manager.start()
+        (listener,) = presence.listeners
+        for i in range(EVENTS):
+            listener(i % 2 == 1)
+        await asyncio.sleep(0)
+
+    def flap() -> None:
+        events.clear()
+        asyncio.run(run())
+
+    benchmark(flap, rounds=20)
+    assert sum(1 for kind, _ in events if kind == "presence") == EVENTS
+
+
+def bench_lock_unlock_cycles(benchmark) -> None:
+    """Absence→lock→presence→unlock round trips through the fake bus."""
+
+    bus = FakeScreenSaverBus()
+    cycles = 100
+
+    async def run() -> None:
+        presence = FakePresence()
+        changed = asyncio.Event()
+
+        def notify(event: tuple[str, object]) -> None:
+            if event[0] == "lock":
+                changed.set()
+
+        manager = ScreenLockManager(
+            KDEScreenLocker(bus), presence, absent_timeout=0.0, notify=notify
+        )
+        await manager.start()
+        (listener,) = presence.listeners
+        for _ in range(cycles):
+            for present in (False, True):
+                changed.clear()
+                listener(present)
+                await changed.wait()
+
+    benchmark(lambda: asyncio.run(run()), rounds=10)
+    assert bus.calls["Lock"] >= cycles
@@ -0,0 +1,83 @@
+"""Presence scan throughput with synthetic cameras and a stub detector."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from midori_ai_hello.presence_service import CameraPresenceService
+
+
+class StubModel:
+    """Return a fixed set of unauthorised detections for every frame."""
+
+    def __init__(self, detections: int = 5) -> None:
+        boxes = SimpleNamespace(
+            cls=np.arange(detections, dtype=np.float32) % 2,
+            conf=np.linspace(0.3, 0.9, detections, dtype=np.float32),
+        )
+        self._results = [SimpleNamespace(names={0: "face", 1: "person"}, boxes=boxes)]
+
+    def __call__(self, frame: np.ndarray, **kwargs: object) -> list[SimpleNamespace]:
+        return self._results
+
+
+class CrowdModel(StubModel):
+    """Many people in frame, one of them authorised."""
+
+    def __init__(self, detections: int) -> None:
+        rows = np.zeros((detections, 6), dtype=np.float32)
+        rows[:, 2:4] = 100
+        rows[:, 4] = 0.8
+        rows[:, 5] = np.arange(detections) % 50 + 1
+        rows[-1, 5] = 0
+        names = {i: f"person{i}" for i in range(1, 51)}
+        names[0] = "alice"
+        self._results = [SimpleNamespace(names=names, boxes=SimpleNamespace(data=rows))]
+
+
+class StaticWhitelist:
+    def users(self) -> list[str]:
+        return ["alice"]
+
+
+def _cameras(count: int) -> list[str]:
+    # Distinct specs: warm cameras and per-camera state are keyed by spec.
+    return [f"synthetic:640x480#{i}" for i in range(count)]
+
+
+@pytest.mark.parametrize("cameras", [1, 5, 20])
+def bench_scan_once(benchmark, cameras: int) -> None:
+    service = CameraPresenceService(
+        _cameras(cameras),
+        Path("model.pt"),
+        StaticWhitelist(),  # type: ignore[arg-type]
+    )
+    score = benchmark(service._scan_once, StubModel(), rounds=50)
+    assert score == 0.0
+
+
+@pytest.mark.parametrize("cameras", [1, 5, 20])
+def bench_scan_locked(benchmark, cameras: int) -> None:
+    service = CameraPresenceService(
+        _cameras(cameras),
+        Path("model.pt"),
+        StaticWhitelist(),  # type: ignore[arg-type]
+    )
+    benchmark(service._scan_locked, StubModel(), rounds=50)
+    assert len(service._warm) == cameras
+    service._release_cameras()
+
+
+@pytest.mark.parametrize("detections", [10, 200])
+def bench_detect_crowd(benchmark, detections: int) -> None:
+    service = CameraPresenceService(
+        _cameras(1), Path("model.pt"), StaticWhitelist()  # type: ignore[arg-type]
+    )
+    authorised = service._authorised()
+    model = CrowdModel(detections)
+    score = benchmark(service._detect, model, None, "cam", authorised, rounds=200)
+    assert score == pytest.approx(0.8)
@@ -0,0 +1,47 @@
+"""Whitelist decryption cost as the model weights grow.
+
+``bench_decrypt`` measures a cold read (hash the weights, decrypt);
+``bench_users`` measures the cached path used on every presence scan.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from midori_ai_hello.whitelist import WhitelistManager
+
+
+MB = 1 << 20
+
+
+def _write_model(path: Path, size: int) -> None:
+    chunk = os.urandom(MB)
+    with path.open("wb") as fh:
+        for _ in range(size // MB):
+            fh.write(chunk)
+
+
+def _manager(tmp_path: Path, size_mb: int) -> WhitelistManager:
+    model = tmp_path / "model.pt"
+    _write_model(model, size_mb * MB)
+    manager = WhitelistManager(model, config_dir=tmp_path / "cfg")
+    manager.add_user("alice")
+    return manager
+
+
+@pytest.mark.parametrize("size_mb", [10, 100, 500])
+def bench_decrypt(benchmark, tmp_path: Path, size_mb: int) -> None:
+    manager = _manager(tmp_path, size_mb)
+    rounds = 20 if size_mb <= 10 else 5
+    users = benchmark(manager._read, rounds=rounds, warmup=1)
+    assert users == ["alice"]
+
+
+@pytest.mark.parametrize("size_mb", [10, 500])
+def bench_users(benchmark, tmp_path: Path, size_mb: int) -> None:
+    manager = _manager(tmp_path, size_mb)
+    users = benchmark(manager.users, rounds=100)
+    assert users == ["alice"]
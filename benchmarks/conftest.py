@@ -0,0 +1,142 @@
+"""Minimal benchmark harness for the ``benchmarks/`` suite.
+
+Each ``bench_*.py`` test receives a :class:`Benchmark` via the ``benchmark``
+fixture and calls it with the function to time. Results are written as JSON
+(``--bench-json``) and can be compared against a previous run
+(``--bench-compare``), failing the session when a median regresses by more
+than ``--bench-max-regression`` percent.
+"""
+
+from __future__ import annotations
+
+import json
+import platform
+import statistics
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+import pytest
+
+
+_RESULTS: list[dict[str, Any]] = []
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("benchmarks")
+    group.addoption(
+        "--bench-json",
+        default=str(Path(__file__).parent / ".results" / "latest.json"),
+        help="where to write benchmark results",
+    )
+    group.addoption("--bench-compare", help="previous results JSON to compare with")
+    group.addoption(
+        "--bench-max-regression",
+        type=float,
+        default=25.0,
+        help="fail when a median is this many percent slower than --bench-compare",
+    )
+    group.addoption(
+        "--bench-rounds", type=int, default=None, help="override rounds per benchmark"
+    )
+
+
+class Benchmark:
+    """Time a callable over several rounds after a warm-up."""
+
+    def __init__(self, name: str, rounds_override: int | None) -> None:
+        self.name = name
+        self._rounds_override = rounds_override
+        self.stats: dict[str, Any] | None = None
+
+    def __call__(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        rounds: int = 20,
+        warmup: int = 2,
+        **kwargs: Any,
+    ) -> Any:
+        rounds = self._rounds_override or rounds
+        for _ in range(warmup):
+            fn(*args, **kwargs)
+        timings: list[float] = []
+        result = None
+        for _ in range(rounds):
+            started = time.perf_counter()
+            result = fn(*args, **kwargs)
+            timings.append(time.perf_counter() - started)
+        self.stats = {
+            "name": self.name,
+            "rounds": rounds,
+            "min": min(timings),
+            "max": max(timings),
+            "mean": statistics.fmean(timings),
+            "median": statistics.median(timings),
+            "stdev": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        }
+        _RESULTS.append(self.stats)
+        return result
+
+
+@pytest.fixture
+def benchmark(request: pytest.FixtureRequest) -> Benchmark:
+    return Benchmark(request.node.nodeid, request.config.getoption("--bench-rounds"))
+
+
+@pytest.fixture
+def synthetic_frame() -> np.ndarray:
+    rng = np.random.default_rng(0)
+    return rng.integers(0, 255, size=(480, 640, 3), dtype=np.uint8)
+
+
+def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
+    if not _RESULTS:
+        return
+    config = session.config
+    out = Path(config.getoption("--bench-json"))
+    out.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "created": datetime.now(timezone.utc).isoformat(),
+        "machine": platform.machine(),
+        "python": platform.python_version(),
+        "benchmarks": _RESULTS,
+    }
+    out.write_text(json.dumps(payload, indent=2))
+
+    compare = config.getoption("--bench-compare")
+    if not compare:
+        return
+    previous = {
+        b["name"]: b for b in json.loads(Path(compare).read_text())["benchmarks"]
+    }
+    limit = config.getoption("--bench-max-regression")
+    regressions = []
+    for bench in _RESULTS:
+        old = previous.get(bench["name"])
+        if old is None or not old["median"]:
+            continue
+        change = (bench["median"] / old["median"] - 1) * 100
+        bench["change_pct"] = change
+        if change > limit:
+            bench["regressed"] = True
+            regressions.append(bench)
+    if regressions:
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+def pytest_terminal_summary(terminalreporter: Any) -> None:
+    if not _RESULTS:
+        return
+    terminalreporter.section("benchmarks")
+    for bench in _RESULTS:
+        line = "{:<70} median {:>10.3f} ms  (min {:.3f}, n={})".format(
+            bench["name"], bench["median"] * 1e3, bench["min"] * 1e3, bench["rounds"]
+        )
+        if "change_pct" in bench:
+            line += f"  {bench['change_pct']:+.1f}%"
+        if bench.get("regressed"):
+            line += "  REGRESSION"
+        terminalreporter.write_line(line)
@@ -3,41 +3,21 @@ from __future__ import annotations
 
 import argparse
 import asyncio
-import logging
 import os
-import yaml
 from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
 
-from .app import MidoriApp
 from .kde_lock import KDEScreenLocker, PowerInhibitor
-from .presence_service import CameraPresenceService
-from .screen_lock_manager import NullPresenceService
-from .whitelist import WhitelistManager
-from .config import load_config, update_config
+from .calibration import calibrate
+from .config import get_config_store
+from .control import default_socket_path
+from .daemon import PresenceDaemon, build_presence_service
+from .fake_screensaver import FakeScreenSaverBus
+from .logging_setup import configure_logging, parse_module_levels
+from .metrics import metrics
 from .yolo_train import YOLOTrainingScheduler
 
 
-def configure_logging(level: str) -> None:
-    """Configure root logger with console and file handlers."""
-    log_level = getattr(logging, level.upper(), logging.INFO)
-    log_path = Path("midori-ai-hello.log")
-    formatter = logging.Formatter(
-        "%(asctime)s %(levelname)s %(name)s: %(message)s"
-    )
-    root = logging.getLogger()
-    root.setLevel(logging.DEBUG)
-    file_handler = logging.FileHandler(log_path, encoding="utf-8")
-    file_handler.setLevel(logging.DEBUG)
-    file_handler.setFormatter(formatter)
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(log_level)
-    console_handler.setFormatter(formatter)
-    root.handlers.clear()
-    root.addHandler(file_handler)
-    root.addHandler(console_handler)
-
-
 def main(argv: list[str] | None = None) -> int:
     """Run the Midori-AI Hello Textual application."""
     parser = argparse.ArgumentParser(prog="midori-ai-hello")
@@ -46,15 +26,91 @@ def main(argv: list[str] | None = None) -> int:
     except PackageNotFoundError:
         pkg_version = "0.0.0"
     parser.add_argument("--log-level", default=os.getenv("LOG_LEVEL", "INFO"))
+    parser.add_argument(
+        "--log-module",
+        action="append",
+        default=[os.getenv("LOG_MODULES", "")],
+        metavar="NAME=LEVEL",
+        help="per-module log level, e.g. midori_ai_hello.presence_service=INFO",
+    )
     parser.add_argument("--version", action="version", version=pkg_version)
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="run presence locking and training without the TUI",
+    )
+    parser.add_argument(
+        "--socket",
+        default=os.getenv("MIDORI_AI_HELLO_SOCKET"),
+        help="control socket path (defaults to $XDG_RUNTIME_DIR)",
+    )
+    parser.add_argument(
+        "--metrics",
+        action="store_true",
+        help="record hot-path timings (served by the control socket)",
+    )
+    parser.add_argument(
+        "--metrics-file",
+        help="also write Prometheus metrics to this file periodically",
+    )
+    parser.add_argument(
+        "--fake-dbus",
+        action="store_true",
+        help="use an in-process ScreenSaver instead of the session bus (testing)",
+    )
+    parser.add_argument(
+        "--calibrate",
+        action="store_true",
+        help="benchmark model sizes on this host and save the best to config.yaml",
+    )
+    parser.add_argument(
+        "--target-latency",
+        type=float,
+        default=100.0,
+        metavar="MS",
+        help="per-scan latency the calibrated model must meet (default 100)",
+    )
+    parser.add_argument(
+        "--cpu-budget",
+        type=float,
+        default=0.25,
+        metavar="FRACTION",
+        help="share of host CPU presence scans may use (default 0.25)",
+    )
     args = parser.parse_args(argv)
-    configure_logging(args.log_level)
+    try:
+        module_levels = parse_module_levels(args.log_module)
+    except ValueError as exc:
+        parser.error(str(exc))
+    configure_logging(args.log_level, module_levels=module_levels)
+    metrics.enabled = bool(args.metrics or args.metrics_file)
+
+    def _locker() -> KDEScreenLocker:
+        if args.fake_dbus:
+            return KDEScreenLocker(FakeScreenSaverBus())
+        return KDEScreenLocker()
+
+    if args.calibrate:
+        return _calibrate(args.target_latency / 1000, args.cpu_budget)
+
+    if args.daemon:
+        asyncio.run(
+            PresenceDaemon(
+                "config.yaml",
+                socket_path=args.socket,
+                locker=_locker() if args.fake_dbus else None,
+                metrics_file=args.metrics_file,
+            ).run()
+        )
+        return 0
 
     async def _run() -> None:
+        # Imported lazily so ``--daemon`` never loads Textual.
+        from .app import MidoriApp
+
         config_path = Path("config.yaml")
-        raw: dict[str, object] = {}
-        if config_path.exists():
-            raw = yaml.safe_load(config_path.read_text()) or {}
+        store = get_config_store(config_path)
+        raw = store.raw
         missing = [k for k in ("device", "model_size") if k not in raw]
         if missing:
             try:
@@ -63,7 +119,10 @@ def main(argv: list[str] | None = None) -> int:
                 device = "cpu"
             try:
                 size = (
-                    input("Model size (n/s/m/l/xl) [n]: ").strip() or "n"
+                    input(
+                        "Model size (n/s/m/l/xl, or rerun with --calibrate) [n]: "
+                    ).strip()
+                    or "n"
                 )
             except (EOFError, OSError):
                 size = "n"
@@ -73,30 +132,69 @@ def main(argv: list[str] | None = None) -> int:
             if "model_size" not in raw:
                 updates["model_size"] = size
             if updates:
-                update_config(config_path, **updates)
-        config = load_config(config_path)
-        locker = KDEScreenLocker()
-        scheduler = YOLOTrainingScheduler(locker, config_path)
-        whitelist = WhitelistManager(Path(config.model))
-        presence: CameraPresenceService | NullPresenceService
-        if config.cameras:
-            presence = CameraPresenceService(
-                config.cameras, config.model, whitelist, device=config.device
-            )
-        else:
-            presence = NullPresenceService()
+                store.update(**updates)
+        locker = _locker()
+        scheduler = YOLOTrainingScheduler(locker, config_path, store=store)
+        presence = build_presence_service(store, locker)
         async with PowerInhibitor(locker, "midori-ai-hello running"):
             app = MidoriApp(
                 config_path,
                 scheduler=scheduler,
                 locker=locker,
                 presence_service=presence,
+                store=store,
+                control_socket=args.socket or default_socket_path(),
             )
-            await app.run_async()
+            export: asyncio.Task[None] | None = None
+            if args.metrics_file:
+                export = asyncio.create_task(metrics.export_loop(args.metrics_file))
+            try:
+                await app.run_async()
+            finally:
+                if export is not None:
+                    export.cancel()
 
     asyncio.run(_run())
     return 0
 
 
+def _calibrate(target_latency: float, cpu_budget: float) -> int:
+    """Run :func:`calibrate` and store the chosen ``model_size``.
+
+    ``model`` follows the new size only if it is the stock model for the
+    old one; a custom model path is kept.
+    """
+
+    try:
+        from ultralytics import YOLO  # type: ignore
+    except Exception:
+        print("Calibration requires the ultralytics package")
+        return 1
+    store = get_config_store(Path("config.yaml"))
+    best, results = calibrate(
+        YOLO,
+        device=store.config.device,
+        target_latency=target_latency,
+        cpu_budget=cpu_budget,
+    )
+    for result in results:
+        print(
+            f"{result.size:>2} {result.latency * 1000:8.1f} ms "
+            f"{'ok' if result.fits else 'over budget'}"
+        )
+    if best is None:
+        print(f"No model size fits; keeping model_size={store.config.model_size}")
+        return 1
+    config = store.config
+    if str(config.model) == f"yolo11{config.model_size}.pt":
+        store.update(model_size=best.size)
+    else:
+        # A custom model (e.g. a trained one) stays in use; only record the size.
+        store.update(model_size=best.size, model=config.model)
+        print(f"Keeping custom model {config.model}")
+    print(f"Saved model_size={best.size} to {store.path}")
+    return 0
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
@@ -3,26 +3,30 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from textual.app import App, ComposeResult
 from textual.reactive import reactive
 from textual.screen import Screen
+from textual.timer import Timer
 from textual.widgets import Static, Footer
 
+from . import camera_broker
 from .capture_screen import CaptureScreen, list_cameras
-from .config import load_config, Config
+from .config import Config, ConfigStore, get_config_store
 from .config_screen import ConfigScreen
+from .control import ControlServer, register_standard_commands
 from .kde_lock import KDEScreenLocker
 from .screen_lock_manager import (
     ScreenLockManager,
     NullPresenceService,
     PresenceService,
 )
+from .status import StatusModel
 from .whitelist_screen import WhitelistScreen
-from .yolo_train import YOLOTrainingScheduler
+from .yolo_train import YOLOTrainingScheduler, training_loop
 from .main_menu import MainMenuScreen
 
 
@@ -53,6 +57,9 @@ class MidoriApp(App):
         ("q", "quit", "Quit"),
     ]
 
+    FOOTER_INTERVAL = 0.1
+    """Seconds over which footer updates are coalesced into one render."""
+
     DEFAULT_CSS = """
     .status-bar {
         layer: footer;
@@ -70,14 +77,16 @@ class MidoriApp(App):
         scheduler: YOLOTrainingScheduler | None = None,
         locker: KDEScreenLocker | None = None,
         presence_service: PresenceService | None = None,
+        store: ConfigStore | None = None,
+        control_socket: str | Path | None = None,
     ) -> None:
         super().__init__()
         self._config_path = Path(config_path)
-        self._config: Config = load_config(self._config_path)
+        self._store = store or get_config_store(self._config_path)
         log.debug("Loaded config from %s", self._config_path)
         self._locker = locker or KDEScreenLocker()
         self._scheduler = scheduler or YOLOTrainingScheduler(
-            self._locker, self._config_path
+            self._locker, self._config_path, store=self._store
         )
         self._presence = presence_service or NullPresenceService()
         self._lock_manager = ScreenLockManager(
@@ -85,16 +94,29 @@ class MidoriApp(App):
         )
         self._train_task: asyncio.Task[None] | None = None
         self._lock_task: asyncio.Task[None] | None = None
-        self._status_message: str = ""
-        self._last_capture_at: datetime | None = None
-        self._last_detected: bool | None = None
-        self._lock_deadline: datetime | None = None
-        self._present: bool | None = None
-        self._locked: bool = False
+        self._config_task: asyncio.Task[None] | None = None
+        self._control_task: asyncio.Task[None] | None = None
+        self._status_model = StatusModel()
+        self._control: ControlServer | None = None
+        if control_socket is not None:
+            self._control = ControlServer(control_socket)
+            register_standard_commands(
+                self._control,
+                status=self._status_model,
+                presence=self._presence,
+                scheduler=self._scheduler,
+            )
+        self._countdown_timer: Timer | None = None
+        self._footer_pending = False
+        self._footer_text: str | None = None
         self._status_bar: Static | None = None
 
     status: str = reactive("")
 
+    @property
+    def _config(self) -> Config:
+        return self._store.config
+
     def compose(self) -> ComposeResult:  # type: ignore[override]
         footer = Footer()
         footer.styles.dock = "bottom"
@@ -106,68 +128,58 @@ class MidoriApp(App):
         self.call_after_refresh(self._refresh_footer)
 
     def watch_status(self, status: str) -> None:
-        self._status_message = status
+        self._status_model.message = status
         self._refresh_footer()
 
     def _refresh_footer(self) -> None:
-        if self._status_bar is not None:
-            self._status_bar.update(self._format_footer())
-
-    def _format_footer(self) -> str:
-        parts: list[str] = []
-        if self._status_message:
-            parts.append(self._status_message)
-        lock_state = "Locked" if self._locked else "Unlocked"
-        parts.append(f"Lock: {lock_state}")
-        if self._present is not None:
-            presence = "Present" if self._present else "Away"
-            parts.append(f"Presence: {presence}")
-        if self._last_capture_at is not None:
-            timestamp = self._last_capture_at.strftime("%H:%M:%S")
-            detected_label = ""
-            if self._last_detected is True:
-                detected_label = "auto"
-            elif self._last_detected is False:
-                detected_label = "manual"
-            capture_segment = f"Last capture: {timestamp}"
-            if detected_label:
-                capture_segment += f" ({detected_label})"
-            parts.append(capture_segment)
-        if self._lock_deadline is not None:
-            now = datetime.now()
-            remaining = max(0, int((self._lock_deadline - now).total_seconds()))
-            if remaining > 0:
-                parts.append(f"Lock in {remaining}s")
-        return " | ".join(parts)
+        """Schedule a footer render, coalescing requests within a frame."""
+        if self._footer_pending or self._status_bar is None:
+            return
+        self._footer_pending = True
+        self.set_timer(self.FOOTER_INTERVAL, self._render_footer)
+
+    def _render_footer(self) -> None:
+        self._footer_pending = False
+        if self._status_bar is None:
+            return
+        text = self._status_model.format(datetime.now())
+        if text != self._footer_text:
+            self._footer_text = text
+            self._status_bar.update(text)
 
     def record_capture_event(self, detected: bool, when: datetime) -> None:
-        self._last_detected = detected
-        self._last_capture_at = when
+        self._status_model.last_detected = detected
+        self._status_model.last_capture_at = when
         self._refresh_footer()
 
     def _handle_lock_event(self, event: tuple[str, Any]) -> None:
+        if not self._status_model.apply(event):
+            log.debug("Unknown lock event %s", event)
+            return
         kind, payload = event
-        if kind == "presence":
-            self._present = bool(payload)
-            if self._present:
-                self._lock_deadline = None
-        elif kind == "countdown":
-            if payload is None:
-                self._lock_deadline = None
-            else:
-                seconds = float(payload)
-                self._lock_deadline = datetime.now() + timedelta(seconds=seconds)
+        if kind in ("presence", "deadline"):
+            self._update_countdown_timer()
         elif kind == "lock":
-            active = bool(payload)
-            self._locked = active
-            state = "Locked" if active else "Unlocked"
+            state = "Locked" if payload else "Unlocked"
             self.sub_title = state
             self.status = state
             self.notify(state)
-        else:
-            log.debug("Unknown lock event %s", event)
+        if self._control is not None:
+            self._control.broadcast(list(event))
         self._refresh_footer()
 
+    def _update_countdown_timer(self) -> None:
+        """Tick the footer once a second only while a lock deadline is set."""
+        if self._status_model.lock_deadline is not None:
+            if self._countdown_timer is None:
+                self._countdown_timer = self.set_interval(
+                    1.0, self._refresh_footer
+                )
+            else:
+                self._countdown_timer.resume()
+        elif self._countdown_timer is not None:
+            self._countdown_timer.pause()
+
     def on_mount(self) -> None:  # type: ignore[override]
         cam_ids = [
             int(c) if isinstance(c, str) and c.isdigit() else c
@@ -181,13 +193,21 @@ class MidoriApp(App):
                 cam_ids,
                 model_path=Path(self._config.model),
                 device=self._config.device,
+                profiles={
+                    cam: self._config.capture_profile(cam, "capture")
+                    for cam in self._config.cameras
+                },
+                broker=camera_broker.broker,
+                camera_timeout=self._config.camera_timeout,
             ),
             name="capture",
         )
         self.install_screen(
             WhitelistScreen(Path(self._config.model)), name="whitelist"
         )
-        self.install_screen(ConfigScreen(self._config_path), name="config")
+        self.install_screen(
+            ConfigScreen(self._config_path, store=self._store), name="config"
+        )
         self.install_screen(
             PlaceholderScreen("Training status"),
             name="training",
@@ -200,11 +220,20 @@ class MidoriApp(App):
         log.debug("Started training loop task")
         self._lock_task = asyncio.create_task(self._lock_manager.start())
         log.debug("Started screen lock manager")
+        self._config_task = asyncio.create_task(self._store.watch())
+        log.debug("Watching %s for changes", self._config_path)
+        if self._control is not None:
+            self._control_task = asyncio.create_task(self._start_control())
+
+    async def _start_control(self) -> None:
+        assert self._control is not None
+        try:
+            await self._control.start()
+        except (OSError, RuntimeError):
+            log.warning("Control socket unavailable", exc_info=True)
 
     async def _train_loop(self) -> None:
-        while True:
-            await self._scheduler.maybe_train()
-            await asyncio.sleep(10)
+        await training_loop(self._scheduler)
 
     def action_view_capture(self) -> None:
         log.debug("Switching to capture screen")
@@ -235,5 +264,12 @@ class MidoriApp(App):
             self._train_task.cancel()
         if self._lock_task and not self._lock_task.done():
             self._lock_task.cancel()
+        if self._config_task:
+            self._config_task.cancel()
         log.debug("Application exiting")
         self.exit()
+
+    async def on_unmount(self) -> None:
+        # Awaited here so the socket file is removed before the loop closes.
+        if self._control is not None:
+            await self._control.stop()
@@ -0,0 +1,97 @@
+"""Pick the presence model size this host can sustain.
+
+:func:`calibrate` loads each candidate model size in turn, runs it on
+synthetic frames and measures wall-clock latency and process CPU time per
+inference. The largest size whose median latency stays under the target and
+whose CPU use at the locked-mode scan rate stays within the budget wins.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import statistics
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable
+
+from .camera import SyntheticCamera
+from .model_cache import warm_up
+
+
+log = logging.getLogger(__name__)
+
+MODEL_SIZES = ("n", "s", "m", "l", "x")
+
+
+@dataclass
+class Measurement:
+    """Timing of one model size on this host."""
+
+    size: str
+    latency: float
+    cpu: float
+    fits: bool
+
+    @property
+    def model(self) -> str:
+        return f"yolo11{self.size}.pt"
+
+
+def measure(model: Any, frames: list[Any], rounds: int) -> tuple[float, float]:
+    """Return median latency and mean process CPU seconds per inference."""
+
+    latencies: list[float] = []
+    cpu_started = time.process_time()
+    for index in range(rounds):
+        frame = frames[index % len(frames)]
+        started = time.perf_counter()
+        model(frame, verbose=False)
+        latencies.append(time.perf_counter() - started)
+    return statistics.median(latencies), (time.process_time() - cpu_started) / rounds
+
+
+def calibrate(
+    factory: Callable[[str], Any],
+    *,
+    device: str = "cpu",
+    sizes: Iterable[str] = MODEL_SIZES,
+    target_latency: float = 0.1,
+    cpu_budget: float = 0.25,
+    scan_interval: float = 0.5,
+    rounds: int = 10,
+    frame_size: tuple[int, int] = (640, 480),
+    cpus: int | None = None,
+) -> tuple[Measurement | None, list[Measurement]]:
+    """Benchmark *sizes* (smallest first) and return the largest that fits.
+
+    A size fits when its median latency is at most *target_latency* seconds
+    and one inference every *scan_interval* seconds uses at most
+    *cpu_budget* of the host's CPUs. Larger sizes are not tried once one
+    misses the latency target. Returns ``(best, measurements)``; *best* is
+    ``None`` when even the smallest size does not fit.
+    """
+
+    cpus = cpus or os.cpu_count() or 1
+    source = SyntheticCamera(*frame_size)
+    frames = [source.read()[1] for _ in range(4)]
+    results: list[Measurement] = []
+    for size in sizes:
+        model = factory(f"yolo11{size}.pt").to(device)
+        warm_up(model)
+        latency, cpu = measure(model, frames, rounds)
+        load = cpu / max(scan_interval, latency) / cpus
+        fits = latency <= target_latency and load <= cpu_budget
+        log.info(
+            "Model %s: %.1f ms median, %.0f%% CPU at %.1f s scans%s",
+            size,
+            latency * 1000,
+            load * 100,
+            scan_interval,
+            "" if fits else " (over budget)",
+        )
+        results.append(Measurement(size, latency, cpu, fits))
+        if latency > target_latency:
+            break
+    fitting = [m for m in results if m.fits]
+    return (fitting[-1] if fitting else None), results
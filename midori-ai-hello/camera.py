@@ -0,0 +1,368 @@
+"""Camera frame sources.
+
+Cameras are identified by the strings stored in ``Config.cameras``. Plain
+device indexes and paths open a live V4L2 device through OpenCV; prefixed
+specs select a replay or synthetic source so presence detection can be
+driven without hardware:
+
+``file:PATH``
+    Play a video file, looping at the end.
+``dir:PATH``
+    Cycle through the images in a directory.
+``synthetic:[WIDTHxHEIGHT][@FPS][#N]``
+    Generate noise frames in memory, optionally paced to *FPS*. ``#N`` makes
+    the spec distinct when several synthetic cameras are configured; each
+    starts at a different frame of the shared pool.
+
+Every source offers the subset of :class:`cv2.VideoCapture` used by the
+application (``isOpened``, ``read`` and ``release``).
+
+Live devices are wrapped in :class:`LiveCamera`, which discards frames that
+queued up in the driver since the last read without decoding them, and can
+be opened with a :class:`CaptureProfile` selecting the pixel format,
+resolution, frame rate and driver buffer size. Presence scans default to a small
+MJPEG stream so several cameras on one USB hub fit in the bus bandwidth;
+capture for the dataset keeps the device defaults.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import time
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Mapping, Protocol
+
+import numpy as np
+
+try:  # pragma: no cover - optional dependency
+    import cv2  # type: ignore
+except Exception:  # pragma: no cover - handled gracefully
+    cv2 = None  # type: ignore
+
+
+log = logging.getLogger(__name__)
+
+IMAGE_SUFFIXES = {".jpg", ".jpeg", ".png", ".bmp"}
+
+_SYNTHETIC = re.compile(r"^(?:(\d+)x(\d+))?(?:@(\d+(?:\.\d+)?))?(?:#(\d+))?$")
+
+
+class FrameSource(Protocol):
+    """The part of :class:`cv2.VideoCapture` the application relies on."""
+
+    def isOpened(self) -> bool: ...  # noqa: N802
+
+    def read(self) -> tuple[bool, np.ndarray | None]: ...
+
+    def release(self) -> None: ...
+
+
+@dataclass(frozen=True)
+class CaptureProfile:
+    """Requested capture mode; ``None`` fields keep the device default."""
+
+    width: int | None = None
+    height: int | None = None
+    fps: float | None = None
+    fourcc: str | None = None
+    buffer_size: int | None = None
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any] | None) -> "CaptureProfile":
+        data = data or {}
+        return cls(
+            width=int(data["width"]) if data.get("width") else None,
+            height=int(data["height"]) if data.get("height") else None,
+            fps=float(data["fps"]) if data.get("fps") else None,
+            fourcc=str(data["fourcc"]).upper() if data.get("fourcc") else None,
+            buffer_size=(
+                int(data["buffer_size"]) if data.get("buffer_size") else None
+            ),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {k: v for k, v in asdict(self).items() if v is not None}
+
+    def merged(self, other: Mapping[str, Any] | None) -> "CaptureProfile":
+        """Return this profile with the fields set in *other* overriding it."""
+
+        return CaptureProfile.from_dict({**self.to_dict(), **(other or {})})
+
+
+DEFAULT_PROFILES = {
+    "presence": CaptureProfile(
+        width=640, height=480, fps=5.0, fourcc="MJPG", buffer_size=1
+    ),
+    "capture": CaptureProfile(buffer_size=1),
+}
+
+# Mode each device actually agreed to, keyed by (spec, requested profile).
+_negotiated: dict[tuple[int | str, CaptureProfile], CaptureProfile] = {}
+
+
+def negotiated_mode(spec: int | str, profile: CaptureProfile) -> CaptureProfile | None:
+    """Return the mode *spec* settled on when last opened with *profile*."""
+
+    return _negotiated.get((spec, profile))
+
+
+def apply_profile(cap: Any, spec: int | str, profile: CaptureProfile) -> None:
+    """Configure a live :class:`cv2.VideoCapture` for *profile*.
+
+    The first open negotiates with the driver and reads back the mode it
+    settled on; later opens request that mode directly, so a device that
+    cannot honour the profile is not renegotiated on every scan.
+    """
+
+    cached = _negotiated.get((spec, profile))
+    wanted = cached or profile
+    # V4L2 picks the resolution list per pixel format, so FOURCC goes first.
+    if wanted.fourcc:
+        cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*wanted.fourcc))
+    if wanted.width:
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH, wanted.width)
+    if wanted.height:
+        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, wanted.height)
+    if wanted.fps:
+        cap.set(cv2.CAP_PROP_FPS, wanted.fps)
+    if profile.buffer_size:
+        # Only a hint: many backends ignore it, which LiveCamera copes with.
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, profile.buffer_size)
+    if cached is not None:
+        return
+    code = int(cap.get(cv2.CAP_PROP_FOURCC))
+    fourcc = "".join(chr((code >> 8 * i) & 0xFF) for i in range(4)).strip("\0")
+    mode = CaptureProfile(
+        width=int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)) or None,
+        height=int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)) or None,
+        fps=float(cap.get(cv2.CAP_PROP_FPS)) or None,
+        fourcc=fourcc or None,
+        buffer_size=profile.buffer_size,
+    )
+    if mode != profile:
+        log.info("Camera %s negotiated %s (requested %s)", spec, mode, profile)
+    _negotiated[(spec, profile)] = mode
+
+
+class LiveCamera:
+    """A :class:`cv2.VideoCapture` that returns the freshest frame.
+
+    Drivers queue frames while nobody reads, so a plain ``read()`` on a camera
+    held open between scans decodes a stale frame. :meth:`read` instead
+    calls ``grab()`` (no decode) for the frames estimated to have queued up
+    since the previous read, bounded by the driver's buffer size, and only
+    calls ``retrieve()`` on the last one.
+    """
+
+    DEFAULT_QUEUE = 4  # V4L2 buffer count OpenCV uses unless told otherwise
+    DEFAULT_FPS = 30.0
+
+    def __init__(self, cap: Any) -> None:
+        self._cap = cap
+        self._queue = self._prop("CAP_PROP_BUFFERSIZE") or self.DEFAULT_QUEUE
+        self._fps = self._prop("CAP_PROP_FPS") or self.DEFAULT_FPS
+        self._last_read: float | None = None
+        self.drained = 0
+
+    def _prop(self, name: str) -> float:
+        try:
+            return float(self._cap.get(getattr(cv2, name)))
+        except Exception:
+            return 0.0
+
+    def isOpened(self) -> bool:  # noqa: N802
+        return bool(self._cap.isOpened())
+
+    def read(self) -> tuple[bool, np.ndarray | None]:
+        now = time.monotonic()
+        last, self._last_read = self._last_read, now
+        if last is None:
+            return self._cap.read()
+        queued = min(int(self._queue), int((now - last) * self._fps))
+        for _ in range(queued - 1):
+            if not self._cap.grab():
+                return False, None
+            self.drained += 1
+        if not self._cap.grab():
+            return False, None
+        return self._cap.retrieve()
+
+    def set(self, prop: int, value: float) -> bool:
+        return self._cap.set(prop, value)
+
+    def get(self, prop: int) -> float:
+        return self._cap.get(prop)
+
+    def release(self) -> None:
+        self._cap.release()
+
+
+class UnavailableCamera:
+    """Placeholder returned when a source cannot be opened at all."""
+
+    def isOpened(self) -> bool:  # noqa: N802
+        return False
+
+    def read(self) -> tuple[bool, None]:
+        return False, None
+
+    def release(self) -> None:
+        pass
+
+
+class SyntheticCamera:
+    """Produce frames from memory at an optional fixed rate.
+
+    Frames come from a small read-only pool of noise images shared by every
+    source of the same size, so opening and reading cost no allocation. With
+    *fps* ``0`` frames are returned as fast as they are requested.
+    """
+
+    def __init__(
+        self,
+        width: int = 640,
+        height: int = 480,
+        fps: float = 0.0,
+        *,
+        seed: int = 0,
+        offset: int = 0,
+    ) -> None:
+        self._frames = _noise_frames(width, height, seed)
+        self._period = 1.0 / fps if fps > 0 else 0.0
+        self._next = time.monotonic()
+        self._index = offset % len(self._frames)
+        self._open = True
+
+    def isOpened(self) -> bool:  # noqa: N802
+        return self._open
+
+    def read(self) -> tuple[bool, np.ndarray | None]:
+        if not self._open:
+            return False, None
+        if self._period:
+            now = time.monotonic()
+            if now < self._next:
+                time.sleep(self._next - now)
+            self._next = max(now, self._next) + self._period
+        frame = self._frames[self._index]
+        self._index = (self._index + 1) % len(self._frames)
+        return True, frame
+
+    def release(self) -> None:
+        self._open = False
+
+
+class VideoFileCamera:
+    """Replay a video file, rewinding when it ends."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._cap = cv2.VideoCapture(str(self.path))
+
+    def isOpened(self) -> bool:  # noqa: N802
+        return bool(self._cap.isOpened())
+
+    def read(self) -> tuple[bool, np.ndarray | None]:
+        ret, frame = self._cap.read()
+        if not ret:
+            self._cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            ret, frame = self._cap.read()
+        return ret, frame
+
+    def release(self) -> None:
+        self._cap.release()
+
+
+class ImageDirCamera:
+    """Cycle through the images in a directory in name order.
+
+    Images are decoded on first use and kept in memory, so later passes over
+    the directory do not touch the disk.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._files = (
+            sorted(
+                p for p in self.path.iterdir() if p.suffix.lower() in IMAGE_SUFFIXES
+            )
+            if self.path.is_dir()
+            else []
+        )
+        self._cache: dict[int, np.ndarray] = {}
+        self._index = 0
+
+    def isOpened(self) -> bool:  # noqa: N802
+        return bool(self._files)
+
+    def read(self) -> tuple[bool, np.ndarray | None]:
+        if not self._files:
+            return False, None
+        index = self._index
+        self._index = (index + 1) % len(self._files)
+        frame = self._cache.get(index)
+        if frame is None:
+            frame = cv2.imread(str(self._files[index]))
+            if frame is None:
+                log.warning("Could not decode %s", self._files[index])
+                return False, None
+            self._cache[index] = frame
+        return True, frame
+
+    def release(self) -> None:
+        self._cache.clear()
+
+
+@lru_cache(maxsize=8)
+def _noise_frames(width: int, height: int, seed: int) -> tuple[np.ndarray, ...]:
+    rng = np.random.default_rng(seed)
+    frames = []
+    for _ in range(8):
+        frame = rng.integers(0, 255, size=(height, width, 3), dtype=np.uint8)
+        frame.flags.writeable = False
+        frames.append(frame)
+    return tuple(frames)
+
+
+def open_camera(spec: int | str, profile: CaptureProfile | None = None) -> FrameSource:
+    """Open the frame source described by *spec*.
+
+    *profile* only applies to live devices; replay and synthetic sources
+    ignore it.
+    """
+
+    if isinstance(spec, str):
+        kind, sep, arg = spec.partition(":")
+        if sep and kind == "synthetic":
+            match = _SYNTHETIC.match(arg)
+            if match is None:
+                log.warning("Invalid synthetic camera spec %s", spec)
+                return UnavailableCamera()
+            width, height, fps, index = match.groups()
+            return SyntheticCamera(
+                int(width or 640),
+                int(height or 480),
+                float(fps or 0.0),
+                offset=int(index or 0),
+            )
+        if sep and kind in {"file", "dir"}:
+            if cv2 is None:
+                log.warning("OpenCV not available; cannot open %s", spec)
+                return UnavailableCamera()
+            return VideoFileCamera(arg) if kind == "file" else ImageDirCamera(arg)
+        if spec.isdigit():
+            spec = int(spec)
+    if cv2 is None:
+        log.warning("OpenCV not available; cannot open camera %s", spec)
+        return UnavailableCamera()
+    cap = cv2.VideoCapture(spec)
+    if not cap.isOpened():
+        return cap
+    if profile is not None and profile != CaptureProfile():
+        apply_profile(cap, spec, profile)
+    if not hasattr(cap, "grab"):
+        return cap
+    return LiveCamera(cap)
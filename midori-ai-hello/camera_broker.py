@@ -0,0 +1,255 @@
+"""Share camera devices between consumers in one process.
+
+V4L2 devices are effectively exclusive: while the capture screen holds a
+camera, a second ``cv2.VideoCapture`` on it from the presence service fails.
+:class:`CameraBroker` opens each device once and hands every consumer a
+:class:`SharedCamera` handle. Reads within one frame period of each other
+share a single decoded frame, which is marked read-only so it can be handed
+out without copying.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Any
+
+import numpy as np
+
+try:  # pragma: no cover - optional dependency
+    import cv2  # type: ignore
+except Exception:  # pragma: no cover - handled gracefully
+    cv2 = None  # type: ignore
+
+from .camera import CaptureProfile, FrameSource, open_camera
+
+
+log = logging.getLogger(__name__)
+
+
+class _Device:
+    """One open device and the consumers sharing it."""
+
+    def __init__(self, spec: int | str, profile: CaptureProfile | None) -> None:
+        self.spec = spec
+        self.profile = profile
+        self.lock = threading.Lock()
+        self.ready = threading.Condition(self.lock)
+        self.source: FrameSource | None = None
+        self.users = 0
+        self.period = 0.0
+        self.frame: np.ndarray | None = None
+        self.frame_at = 0.0
+        self.reads = 0
+        self.reading = False
+        self.retired: list[FrameSource] = []
+        self.discarded = False
+
+    def close(self) -> None:
+        """Close the source; the caller holds :attr:`lock`.
+
+        A source with a read in flight is handed to that reader to release
+        once the driver call returns.
+        """
+
+        source, self.source = self.source, None
+        self.frame = None
+        if source is None:
+            return
+        if self.reading:
+            self.retired.append(source)
+        else:
+            source.release()
+
+
+class SharedCamera:
+    """A consumer's handle on a brokered device.
+
+    Implements :class:`~midori_ai_hello.camera.FrameSource`; :meth:`release`
+    only closes the device once every consumer has released it.
+    """
+
+    def __init__(
+        self, broker: "CameraBroker", device: _Device, *, released: bool = False
+    ) -> None:
+        self._broker = broker
+        self._device = device
+        self._released = released
+
+    def isOpened(self) -> bool:  # noqa: N802
+        source = self._device.source
+        return not self._released and source is not None and source.isOpened()
+
+    def read(self) -> tuple[bool, np.ndarray | None]:
+        if self._released:
+            return False, None
+        return self._broker._read(self._device)
+
+    def release(self) -> None:
+        if not self._released:
+            self._released = True
+            self._broker._release(self._device)
+
+
+class CameraBroker:
+    """Open each camera once and fan its frames out to every consumer.
+
+    A frame newer than the device's frame period (from ``CAP_PROP_FPS``, or
+    *default_fps*) is returned to later readers as-is instead of reading the
+    device again, so one decode serves every consumer of that frame. The
+    driver read runs without holding the device lock; a consumer arriving
+    while another one's read is in flight waits up to *read_wait* seconds
+    for that frame and otherwise gets a failed read, so a hung device never
+    blocks its other consumers indefinitely.
+
+    The device runs in the :class:`~midori_ai_hello.camera.CaptureProfile`
+    of whoever opened it, unless a *primary* consumer (the capture screen)
+    asks for another mode: then the device is reopened in that mode and the
+    other consumers carry on reading from it.
+    """
+
+    def __init__(self, *, default_fps: float = 30.0, read_wait: float = 1.0) -> None:
+        self.default_fps = default_fps
+        self.read_wait = read_wait
+        self._lock = threading.Lock()
+        self._devices: dict[str, _Device] = {}
+
+    def acquire(
+        self,
+        spec: int | str,
+        profile: CaptureProfile | None = None,
+        *,
+        primary: bool = False,
+    ) -> SharedCamera:
+        """Return a handle on *spec*, opening the device if nobody holds it.
+
+        With *primary* the device is switched to *profile* if it is already
+        open in another mode.
+        """
+
+        key = str(spec)
+        reopen = False
+        with self._lock:
+            device = self._devices.get(key)
+            if device is None:
+                device = self._devices[key] = _Device(spec, profile)
+            elif profile != device.profile:
+                if primary:
+                    log.info(
+                        "Switching camera %s from %s to %s",
+                        key,
+                        device.profile,
+                        profile,
+                    )
+                    device.profile = profile
+                    reopen = True
+                else:
+                    log.debug(
+                        "Camera %s shared in mode %s; requested %s",
+                        key,
+                        device.profile,
+                        profile,
+                    )
+            device.users += 1
+        with device.lock:
+            if reopen:
+                device.close()
+            if device.source is None or not device.source.isOpened():
+                device.source = open_camera(spec, device.profile)
+                fps = _fps(device.source) or self.default_fps
+                device.period = 1.0 / fps
+                device.frame = None
+            if device.discarded:
+                # Discarded while we were opening it: nobody else will close it.
+                device.close()
+                return SharedCamera(self, device, released=True)
+        return SharedCamera(self, device)
+
+    def discard(self, spec: int | str) -> None:
+        """Forget *spec*, e.g. after a hung read; the next :meth:`acquire`
+        opens a fresh device.
+
+        The old device is closed now unless a read or open is stuck in it;
+        then the stuck thread closes it once the driver call returns.
+        Handles on the old device report ``isOpened() == False`` so their
+        owners can acquire again.
+        """
+
+        with self._lock:
+            device = self._devices.pop(str(spec), None)
+        if device is None:
+            return
+        device.discarded = True
+        # Opens run under the device lock; a hung one closes the device itself.
+        if device.lock.acquire(timeout=self.read_wait):
+            try:
+                device.close()
+            finally:
+                device.lock.release()
+
+    def users(self, spec: int | str) -> int:
+        device = self._devices.get(str(spec))
+        return device.users if device is not None else 0
+
+    def _read(self, device: _Device) -> tuple[bool, np.ndarray | None]:
+        with device.lock:
+            if device.reading:
+                # Share the frame another consumer is already reading.
+                seen = device.reads
+                device.ready.wait_for(lambda: not device.reading, self.read_wait)
+                if device.reading:
+                    return False, None
+                if device.reads != seen and device.frame is not None:
+                    return True, device.frame
+            source = device.source
+            if source is None:
+                return False, None
+            now = time.monotonic()
+            if device.frame is not None and now - device.frame_at < device.period:
+                return True, device.frame
+            device.reading = True
+        ok, frame = False, None
+        try:
+            ok, frame = source.read()
+        finally:
+            with device.lock:
+                device.reading = False
+                device.reads += 1
+                current = device.source is source
+                if current and ok and frame is not None:
+                    if isinstance(frame, np.ndarray):
+                        frame.flags.writeable = False
+                    device.frame, device.frame_at = frame, now
+                elif current:
+                    device.frame = None
+                retired, device.retired = device.retired, []
+                device.ready.notify_all()
+            for old in retired:
+                old.release()
+        if not current or not ok or frame is None:
+            return False, None
+        return True, frame
+
+    def _release(self, device: _Device) -> None:
+        with self._lock:
+            device.users -= 1
+            if device.users > 0:
+                return
+            if self._devices.get(str(device.spec)) is device:
+                del self._devices[str(device.spec)]
+        with device.lock:
+            device.close()
+
+
+def _fps(source: Any) -> float:
+    if cv2 is None or not hasattr(source, "get"):
+        return 0.0
+    try:
+        return float(source.get(cv2.CAP_PROP_FPS))
+    except Exception:
+        return 0.0
+
+
+# Shared by the presence service and the capture screen in the app process.
+broker = CameraBroker()
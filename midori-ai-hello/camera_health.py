@@ -0,0 +1,185 @@
+"""Per-camera health tracking and circuit breaking.
+
+A camera that keeps failing to open or read is taken out of rotation for an
+exponentially growing back-off, so an unplugged device costs nothing on the
+scan path. Once the back-off expires a single probe is let through; success
+re-admits the camera, failure doubles the back-off. Blocking OpenCV calls
+can be bounded by running them on a camera's :class:`CameraWorker`, a
+long-lived daemon thread, so a hung device cannot stall the scan.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, TypeVar
+
+
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class CameraTimeout(TimeoutError):
+    """A camera call did not finish within its deadline."""
+
+
+class CameraWorker:
+    """A daemon thread that runs one camera's blocking calls in turn.
+
+    :meth:`call` hands the call to the worker and waits at most *timeout*
+    seconds for it. A call that overruns leaves the worker stuck in it and
+    marks it :attr:`hung`; the owner should :meth:`close` it and start a new
+    one. The abandoned thread exits once the call returns and never blocks
+    interpreter shutdown.
+    """
+
+    def __init__(self, name: str = "camera-worker") -> None:
+        self.name = name
+        self.hung = False
+        self._jobs: queue.SimpleQueue[Any] = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+
+    def call(
+        self, fn: Callable[..., T], *args: Any, timeout: float | None = None
+    ) -> T:
+        """Run ``fn(*args)`` on the worker, raising :class:`CameraTimeout`
+        after *timeout* seconds (``None`` or ``0`` runs it inline)."""
+
+        if not timeout:
+            return fn(*args)
+        if self.hung:
+            raise CameraTimeout(f"{self.name} is stuck in an earlier call")
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name=self.name, daemon=True
+            )
+            self._thread.start()
+        done = threading.Event()
+        outcome: list[Any] = []
+        self._jobs.put((fn, args, done, outcome))
+        if not done.wait(timeout):
+            self.hung = True
+            raise CameraTimeout(f"camera call exceeded {timeout} s")
+        ok, value = outcome[0]
+        if not ok:
+            raise value
+        return value
+
+    def close(self) -> None:
+        """Stop the worker after any call it is still running."""
+
+        if self._thread is not None:
+            self._jobs.put(None)
+            self._thread = None
+
+    def _run(self) -> None:
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            fn, args, done, outcome = job
+            try:
+                outcome.append((True, fn(*args)))
+            except BaseException as exc:  # pragma: no cover - re-raised in call
+                outcome.append((False, exc))
+            finally:
+                done.set()
+
+
+@dataclass
+class CameraState:
+    """Health bookkeeping for one camera."""
+
+    failures: int = 0
+    total_failures: int = 0
+    successes: int = 0
+    score: float = 1.0
+    open_until: float = 0.0
+    backoff: float = 0.0
+    last_error: str | None = None
+
+
+class CameraHealth:
+    """Circuit breaker keyed by camera spec.
+
+    After *failure_threshold* consecutive failures the breaker opens for
+    *base_backoff* seconds, doubling on every failed probe up to
+    *max_backoff*. ``score`` is an exponential moving average of recent
+    outcomes (1.0 healthy, 0.0 always failing).
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int = 3,
+        base_backoff: float = 5.0,
+        max_backoff: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self._clock = clock
+        self._states: dict[str, CameraState] = {}
+
+    def state(self, cam: str) -> CameraState:
+        state = self._states.get(cam)
+        if state is None:
+            state = self._states[cam] = CameraState()
+        return state
+
+    def allow(self, cam: str) -> bool:
+        """Return ``False`` while *cam*'s breaker is open."""
+
+        state = self._states.get(cam)
+        return state is None or self._clock() >= state.open_until
+
+    def record_success(self, cam: str) -> None:
+        state = self.state(cam)
+        if state.backoff:
+            log.info("Camera %s recovered after %d failures", cam, state.failures)
+        state.failures = 0
+        state.backoff = 0.0
+        state.open_until = 0.0
+        state.successes += 1
+        state.score = 0.8 * state.score + 0.2
+
+    def record_failure(self, cam: str, error: str) -> None:
+        state = self.state(cam)
+        state.failures += 1
+        state.total_failures += 1
+        state.last_error = error
+        state.score *= 0.8
+        if state.failures < self.failure_threshold:
+            log.debug("Camera %s failed (%s)", cam, error)
+            return
+        state.backoff = min(
+            self.max_backoff,
+            state.backoff * 2 if state.backoff else self.base_backoff,
+        )
+        state.open_until = self._clock() + state.backoff
+        log.warning(
+            "Camera %s failed %d times (%s); retrying in %.0f s",
+            cam,
+            state.failures,
+            error,
+            state.backoff,
+        )
+
+    def snapshot(self, cam: str) -> dict[str, Any]:
+        state = self.state(cam)
+        return {
+            "available": self.allow(cam),
+            "score": round(state.score, 3),
+            "failures": state.failures,
+            "total_failures": state.total_failures,
+            "retry_in": max(0.0, state.open_until - self._clock()),
+            "last_error": state.last_error,
+        }
+
+    def forget(self, cam: str) -> None:
+        self._states.pop(cam, None)
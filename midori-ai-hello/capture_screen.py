@@ -7,7 +7,7 @@ import logging
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Iterable, Tuple
+from typing import Iterable, Mapping, Tuple
 
 try:  # pragma: no cover - environment dependent
     import cv2  # type: ignore
@@ -23,6 +23,14 @@ from textual.containers import Horizontal, Vertical
 from textual.screen import ModalScreen, Screen
 from textual.widgets import Button, Static
 
+from .camera import CaptureProfile, FrameSource
+from .camera_broker import CameraBroker
+from .camera_health import CameraTimeout, CameraWorker
+from .dataset import get_dataset_layout
+from .detections import box_arrays, first_box
+from .metrics import metrics
+from .model_cache import load_model
+
 
 log = logging.getLogger(__name__)
 
@@ -68,18 +76,33 @@ def save_sample(
 ) -> tuple[Path, Path]:
     """Save an image and YOLO-format labels under ``dataset_path``."""
 
+    with metrics.timer("midori_save_sample_seconds"):
+        return _write_sample(
+            image, face_box, body_box, subject, camera_id, dataset_path
+        )
+
+
+def _write_sample(
+    image: np.ndarray,
+    face_box: BBox,
+    body_box: BBox,
+    subject: str,
+    camera_id: str,
+    dataset_path: Path,
+) -> tuple[Path, Path]:
     h, w = image.shape[:2]
-    image_dir = dataset_path / "images" / camera_id
-    label_dir = dataset_path / "labels" / camera_id
-    image_dir.mkdir(parents=True, exist_ok=True)
-    label_dir.mkdir(parents=True, exist_ok=True)
+    layout = get_dataset_layout(dataset_path)
+    image_dir, label_dir = layout.ensure_camera(camera_id)
 
     timestamp = int(time.time())
     image_name = f"{subject}_{timestamp}.jpg"
     image_path = image_dir / image_name
     label_path = label_dir / image_name.replace(".jpg", ".txt")
 
-    cv2.imwrite(str(image_path), image)
+    if not cv2.imwrite(str(image_path), image):
+        # The directories may have been removed since they were first created.
+        layout.ensure_camera(camera_id, force=True)
+        cv2.imwrite(str(image_path), image)
 
     face_line = "0 {} {} {} {}".format(*_box_to_yolo(face_box, w, h))
     body_line = "1 {} {} {} {}".format(*_box_to_yolo(body_box, w, h))
@@ -135,6 +158,9 @@ class CaptureScreen(Screen):
         model_path: str | Path | None = None,
         *,
         device: str = "cpu",
+        profiles: Mapping[str, CaptureProfile] | None = None,
+        broker: CameraBroker | None = None,
+        camera_timeout: float = 5.0,
     ) -> None:
         super().__init__()
         self.dataset_path = Path(dataset_path)
@@ -142,10 +168,15 @@ class CaptureScreen(Screen):
         self.cameras = [
             int(c) if isinstance(c, str) and c.isdigit() else c for c in raw
         ]
+        self._profiles = dict(profiles or {})
+        self._broker = broker or CameraBroker()
+        self._camera_timeout = camera_timeout
+        self._worker = CameraWorker("capture-camera")
         self._current = 0
-        self._cap: cv2.VideoCapture | None = None
+        self._cap: FrameSource | None = None
         self.model_path = Path(model_path) if model_path else None
         self._model: YOLO | None = None
+        self._model_task: asyncio.Task[None] | None = None
         self._device = device
         self._capture_in_progress = False
 
@@ -156,14 +187,17 @@ class CaptureScreen(Screen):
         if cv2 is not None:
             self._open_camera()
         if self.model_path and YOLO is not None:
-            try:
-                self._model = YOLO(str(self.model_path)).to(self._device)
-                log.info(
-                    "Loaded YOLO model %s on %s", self.model_path, self._device
-                )
-            except Exception:  # pragma: no cover - handled gracefully
-                log.warning("Failed to load YOLO model %s", self.model_path)
-                self._model = None
+            self._model_task = asyncio.create_task(
+                asyncio.to_thread(self._load_model)
+            )
+
+    def _load_model(self) -> None:
+        try:
+            self._model = load_model(YOLO, self.model_path, self._device)
+            log.info("Loaded YOLO model %s on %s", self.model_path, self._device)
+        except Exception:  # pragma: no cover - handled gracefully
+            log.warning("Failed to load YOLO model %s", self.model_path)
+            self._model = None
 
     def _open_camera(self) -> None:
         if cv2 is None:
@@ -176,8 +210,12 @@ class CaptureScreen(Screen):
             self._cap.release()
         index = self.cameras[self._current]
         log.info("Opening camera index %s", index)
-        cap = cv2.VideoCapture(index)
-        if not cap or not cap.isOpened():
+        # Enrolment frames matter more than presence scans: use our mode.
+        cap = self._broker.acquire(
+            index, self._profiles.get(str(index)), primary=True
+        )
+        if not cap.isOpened():
+            cap.release()
             log.warning("Failed to open camera index %s", index)
             self._cap = None
             return
@@ -212,6 +250,9 @@ class CaptureScreen(Screen):
                 self._open_camera()
             if not self._cap:
                 return
+            if self._model_task is not None:
+                await self._model_task
+                self._model_task = None
 
             capturing = True
             while capturing and self._cap:
@@ -221,7 +262,7 @@ class CaptureScreen(Screen):
                     self.app.status = f"Capturing from camera {camera_id}"
                 except Exception:
                     pass
-                ok, frame = self._cap.read()
+                ok, frame = await self._read_frame()
                 if not ok:
                     log.warning("Failed to read frame from camera %s", camera_id)
                     try:
@@ -236,12 +277,9 @@ class CaptureScreen(Screen):
                 if self._model is not None:
                     try:
                         result = self._model(frame, verbose=False)[0]
-                        for x1, y1, x2, y2, _, cls_id in result.boxes.data.tolist():
-                            box = (int(x1), int(y1), int(x2 - x1), int(y2 - y1))
-                            if int(cls_id) == 0 and face is None:
-                                face = box
-                            elif int(cls_id) == 1 and body is None:
-                                body = box
+                        xyxy, cls, _ = box_arrays(result.boxes)
+                        face = first_box(xyxy, cls, 0)
+                        body = first_box(xyxy, cls, 1)
                         auto_detected = face is not None and body is not None
                     except Exception:  # pragma: no cover - handled gracefully
                         log.warning("YOLO detection failed", exc_info=True)
@@ -328,6 +366,48 @@ class CaptureScreen(Screen):
         finally:
             self._capture_in_progress = False
 
+    async def _read_frame(self) -> tuple[bool, np.ndarray | None]:
+        """Read one frame off the event loop, bounded by the camera timeout.
+
+        A handle whose device was reset under it (the presence service
+        discards a device that hangs) is reacquired once before giving up.
+        """
+
+        for _ in range(2):
+            if self._cap is None:
+                await self._camera_call(self._open_camera)
+            if self._cap is None:
+                return False, None
+            ok, frame = await self._camera_call(self._cap.read)
+            if ok:
+                return ok, frame
+            is_opened = getattr(self._cap, "isOpened", None)
+            if is_opened is None or is_opened():
+                return False, None
+            log.info("Camera %s was reset; reopening", self.cameras[self._current])
+            self._cap.release()
+            self._cap = None
+        return False, None
+
+    async def _camera_call(self, fn, *args):
+        """Run *fn* on the camera worker; failures read as ``(False, None)``."""
+
+        try:
+            return await asyncio.to_thread(
+                self._worker.call, fn, *args, timeout=self._camera_timeout
+            )
+        except CameraTimeout:
+            spec = self.cameras[self._current]
+            log.warning("Camera %s stopped responding", spec)
+            # The worker stays stuck in the call; abandon it and the device.
+            self._worker.close()
+            self._worker = CameraWorker("capture-camera")
+            self._broker.discard(spec)
+            self._cap = None
+        except Exception:
+            log.warning("Camera call failed", exc_info=True)
+        return False, None
+
     async def _confirm(
         self,
         message: str,
@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import asyncio
+import logging
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import List
+from typing import Any, Callable, Dict, List
 
 import yaml
 
+from .camera import DEFAULT_PROFILES, CaptureProfile
+from .dataset import get_dataset_layout
+
+
+log = logging.getLogger(__name__)
+
 
 @dataclass
 class Config:
@@ -23,14 +31,39 @@ class Config:
     backend: str = "ultralytics"
     cameras: List[str] = field(default_factory=list)
     profile_hash: str | None = None
+    presence_window: int = 1
+    presence_enter_votes: int = 1
+    presence_exit_votes: int = 1
+    presence_enter_threshold: float = 0.25
+    presence_exit_threshold: float = 0.25
+    activity_window: int = 30
+    presence_tracking: bool = False
+    presence_reverify_interval: float = 30.0
+    prefilter: str = "none"
+    prefilter_model: str | None = None
+    camera_timeout: float = 5.0
+    inference_threads: int = 0
+    training_threads: int = 0
+    inference_cpus: List[int] = field(default_factory=list)
+    training_cpus: List[int] = field(default_factory=list)
+    class_thresholds: Dict[str, float] = field(default_factory=dict)
+    capture_profiles: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    camera_profiles: Dict[str, Dict[str, Dict[str, Any]]] = field(
+        default_factory=dict
+    )
 
     @classmethod
     def load(cls, path: Path) -> "Config":
         data = {}
         if path.exists():
             data = yaml.safe_load(path.read_text()) or {}
+        return cls.from_dict(data)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Config":
         model_size = str(data.get("model_size", "n"))
         model = str(data.get("model", f"yolo11{model_size}.pt"))
+        cameras, camera_profiles = _parse_cameras(data.get("cameras") or [])
         return cls(
             dataset=str(data.get("dataset", "dataset")),
             epochs=int(data.get("epochs", 1)),
@@ -40,8 +73,38 @@ class Config:
             device=str(data.get("device", "cpu")),
             model_size=model_size,
             backend=str(data.get("backend", "ultralytics")),
-            cameras=[str(c) for c in data.get("cameras", [])][:20],
+            cameras=cameras,
             profile_hash=data.get("profile_hash"),
+            presence_window=int(data.get("presence_window", 1)),
+            presence_enter_votes=int(data.get("presence_enter_votes", 1)),
+            presence_exit_votes=int(data.get("presence_exit_votes", 1)),
+            presence_enter_threshold=float(
+                data.get("presence_enter_threshold", 0.25)
+            ),
+            presence_exit_threshold=float(
+                data.get("presence_exit_threshold", 0.25)
+            ),
+            activity_window=int(data.get("activity_window", 30)),
+            presence_tracking=bool(data.get("presence_tracking", False)),
+            presence_reverify_interval=float(
+                data.get("presence_reverify_interval", 30.0)
+            ),
+            prefilter=str(data.get("prefilter", "none")),
+            prefilter_model=data.get("prefilter_model"),
+            camera_timeout=float(data.get("camera_timeout", 5.0)),
+            inference_threads=int(data.get("inference_threads", 0)),
+            training_threads=int(data.get("training_threads", 0)),
+            inference_cpus=[int(c) for c in data.get("inference_cpus") or []],
+            training_cpus=[int(c) for c in data.get("training_cpus") or []],
+            class_thresholds={
+                str(k): float(v)
+                for k, v in (data.get("class_thresholds") or {}).items()
+            },
+            capture_profiles={
+                str(use): dict(profile or {})
+                for use, profile in (data.get("capture_profiles") or {}).items()
+            },
+            camera_profiles=camera_profiles,
         )
 
     def save(self, path: Path) -> None:
@@ -55,12 +118,40 @@ class Config:
             "device": self.device,
             "model_size": self.model_size,
             "backend": self.backend,
-            "cameras": self.cameras[:20],
+            "cameras": [
+                {"device": cam, **self.camera_profiles[cam]}
+                if self.camera_profiles.get(cam)
+                else cam
+                for cam in self.cameras[:20]
+            ],
+            "presence_window": self.presence_window,
+            "presence_enter_votes": self.presence_enter_votes,
+            "presence_exit_votes": self.presence_exit_votes,
+            "presence_enter_threshold": self.presence_enter_threshold,
+            "presence_exit_threshold": self.presence_exit_threshold,
+            "activity_window": self.activity_window,
+            "presence_tracking": self.presence_tracking,
+            "presence_reverify_interval": self.presence_reverify_interval,
+            "prefilter": self.prefilter,
+            "camera_timeout": self.camera_timeout,
+            "inference_threads": self.inference_threads,
+            "training_threads": self.training_threads,
         }
         if self.profile_hash:
             data["profile_hash"] = self.profile_hash
+        if self.prefilter_model:
+            data["prefilter_model"] = self.prefilter_model
+        if self.class_thresholds:
+            data["class_thresholds"] = dict(self.class_thresholds)
+        if self.capture_profiles:
+            data["capture_profiles"] = dict(self.capture_profiles)
+        if self.inference_cpus:
+            data["inference_cpus"] = list(self.inference_cpus)
+        if self.training_cpus:
+            data["training_cpus"] = list(self.training_cpus)
         path.write_text(yaml.safe_dump(data))
-        self._ensure_camera_dirs()
+        # The shared layout remembers which directories exist already.
+        get_dataset_layout(self.dataset).ensure_cameras(self.cameras[:20])
 
     def update(self, path: Path, **kwargs: object) -> "Config":
         for key, value in kwargs.items():
@@ -73,14 +164,155 @@ class Config:
         self.save(path)
         return self
 
+    def capture_profile(self, camera: str, use: str) -> CaptureProfile:
+        """Return the capture mode for *camera* when opened for *use*.
+
+        Built-in defaults are overridden by ``capture_profiles[use]`` and then
+        by the camera's own entry in ``cameras``.
+        """
+
+        profile = DEFAULT_PROFILES.get(use, CaptureProfile())
+        profile = profile.merged(self.capture_profiles.get(use))
+        return profile.merged(self.camera_profiles.get(camera, {}).get(use))
+
+
+def _parse_cameras(
+    entries: list[Any],
+) -> tuple[list[str], dict[str, dict[str, dict[str, Any]]]]:
+    """Split ``cameras`` into device specs and per-camera capture profiles.
+
+    Entries are either a device spec or a mapping with a ``device`` key and
+    optional per-use profiles, e.g. ``{device: "0", presence: {fps: 2}}``.
+    """
+
+    cameras: list[str] = []
+    profiles: dict[str, dict[str, dict[str, Any]]] = {}
+    for entry in entries[:20]:
+        if isinstance(entry, dict):
+            cam = str(entry.get("device", ""))
+            if not cam:
+                log.warning("Ignoring camera entry without a device: %s", entry)
+                continue
+            uses = {
+                str(use): dict(profile)
+                for use, profile in entry.items()
+                if use != "device" and isinstance(profile, dict)
+            }
+            if uses:
+                profiles[cam] = uses
+        else:
+            cam = str(entry)
+        cameras.append(cam)
+    return cameras, profiles
+
+
+Subscriber = Callable[[Config], None]
+
+
+class ConfigStore:
+    """Shared, in-memory view of a ``config.yaml`` file.
+
+    The file is parsed once and the resulting :class:`Config` is handed to
+    every consumer. :meth:`refresh` compares the file's modification time and
+    size against the last parse and only re-reads YAML when they differ;
+    subscribers are notified whenever the configuration changes, either
+    through :meth:`update` or an external edit picked up by :meth:`watch`.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._subscribers: list[Subscriber] = []
+        self._signature: tuple[int, int] | None = None
+        self.raw: dict[str, Any] = {}
+        self._config = self._parse()
+
+    @property
+    def config(self) -> Config:
+        """Return the current configuration."""
+
+        return self._config
+
+    def subscribe(self, callback: Subscriber) -> None:
+        """Invoke *callback* with the new :class:`Config` after each change.
+
+        Every change publishes a fresh object, so a subscriber can compare it
+        with the one it saw last.
+        """
+
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Subscriber) -> None:
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    def refresh(self) -> bool:
+        """Reload the file if it changed on disk; return ``True`` if it did."""
+
+        if self._stat() == self._signature:
+            return False
+        log.debug("Config file %s changed on disk; reloading", self.path)
+        self._config = self._parse()
+        self._publish()
+        return True
+
+    def update(self, **kwargs: object) -> Config:
+        """Apply *kwargs*, persist them and notify subscribers."""
+
+        self.refresh()
+        # Subscribers may keep the previous Config; never mutate it.
+        self._config = replace(self._config).update(self.path, **kwargs)
+        self.raw.update(kwargs)
+        self._signature = self._stat()
+        self._publish()
+        return self._config
+
+    async def watch(self, interval: float = 2.0) -> None:
+        """Poll the file for external changes every *interval* seconds."""
+
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                self.refresh()
+            except (OSError, yaml.YAMLError):
+                log.warning("Failed to reload config from %s", self.path, exc_info=True)
+
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
-    def _ensure_camera_dirs(self) -> None:
-        root = Path(self.dataset)
-        for cam in self.cameras[:20]:
-            (root / "images" / cam).mkdir(parents=True, exist_ok=True)
-            (root / "labels" / cam).mkdir(parents=True, exist_ok=True)
+    def _stat(self) -> tuple[int, int] | None:
+        try:
+            st = self.path.stat()
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _parse(self) -> Config:
+        self._signature = self._stat()
+        data: dict[str, Any] = {}
+        if self._signature is not None:
+            data = yaml.safe_load(self.path.read_text()) or {}
+        self.raw = dict(data)
+        return Config.from_dict(data)
+
+    def _publish(self) -> None:
+        for cb in list(self._subscribers):
+            try:
+                cb(self._config)
+            except Exception:  # pragma: no cover - subscriber bug
+                log.exception("Config subscriber %r failed", cb)
+
+
+_stores: dict[Path, ConfigStore] = {}
+
+
+def get_config_store(path: str | Path) -> ConfigStore:
+    """Return the process-wide :class:`ConfigStore` for ``path``."""
+
+    key = Path(path).resolve()
+    store = _stores.get(key)
+    if store is None:
+        store = _stores[key] = ConfigStore(path)
+    return store
 
 
 def load_config(path: str | Path) -> Config:
@@ -98,6 +330,5 @@ def save_config(config: Config, path: str | Path) -> None:
 def update_config(path: str | Path, **kwargs: object) -> Config:
     """Update specific fields in the config file at ``path``."""
 
-    cfg = load_config(path)
-    return cfg.update(Path(path), **kwargs)
+    return get_config_store(path).update(**kwargs)
 
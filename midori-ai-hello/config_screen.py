@@ -8,7 +8,7 @@ from textual.app import ComposeResult
 from textual.screen import Screen
 from textual.widgets import Button, Input, ListView, Static
 
-from .config import Config, load_config, update_config
+from .config import Config, ConfigStore, get_config_store
 
 
 class ConfigScreen(Screen):
@@ -19,10 +19,16 @@ class ConfigScreen(Screen):
         ("q", "quit", "Quit"),
     ]
 
-    def __init__(self, config_path: str | Path) -> None:
+    def __init__(
+        self, config_path: str | Path, *, store: ConfigStore | None = None
+    ) -> None:
         super().__init__()
         self._config_path = Path(config_path)
-        self._config: Config = load_config(self._config_path)
+        self._store = store or get_config_store(self._config_path)
+
+    @property
+    def _config(self) -> Config:
+        return self._store.config
 
     def compose(self) -> ComposeResult:  # type: ignore[override]
         yield Static("Config editor")
@@ -92,8 +98,7 @@ class ConfigScreen(Screen):
                 self.app.status = "Adding camera..."
             except Exception:
                 pass
-            self._config.cameras.append(new_id)
-            update_config(self._config_path, cameras=self._config.cameras)
+            self._store.update(cameras=[*self._config.cameras, new_id])
             self._camera_list.append(Static(new_id))
             try:
                 self.app.status = "Config updated"
@@ -0,0 +1,197 @@
+"""Local JSON-lines control socket for a running Midori-AI Hello process."""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import json
+import logging
+import os
+import socket
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Awaitable, Callable
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from .status import StatusModel
+
+
+log = logging.getLogger(__name__)
+
+Command = Callable[[dict[str, Any]], Any | Awaitable[Any]]
+
+
+def default_socket_path() -> Path:
+    """Return the per-user control socket path."""
+
+    runtime = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime:
+        return Path(runtime) / "midori-ai-hello.sock"
+    return Path(tempfile.gettempdir()) / f"midori-ai-hello-{os.getuid()}.sock"
+
+
+class ControlServer:
+    """Serve commands over a Unix-domain socket, one JSON object per line.
+
+    Requests look like ``{"cmd": "status"}`` and are answered with
+    ``{"ok": true, "result": ...}`` or ``{"ok": false, "error": "..."}``.
+    A client sending ``{"cmd": "subscribe"}`` additionally receives every
+    event passed to :meth:`broadcast` as ``{"event": ...}`` lines, which is
+    how a TUI can attach to a headless daemon.
+    """
+
+    def __init__(self, path: str | Path | None = None) -> None:
+        self.path = Path(path) if path else default_socket_path()
+        self._commands: dict[str, Command] = {"ping": lambda request: "pong"}
+        self._subscribers: set[asyncio.StreamWriter] = set()
+        self._server: asyncio.AbstractServer | None = None
+
+    def register(self, name: str, handler: Command) -> None:
+        """Expose *handler* as command *name*."""
+
+        self._commands[name] = handler
+
+    async def start(self) -> None:
+        """Listen on :attr:`path`, refusing to steal a live socket."""
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.path.exists():
+            try:
+                _, writer = await asyncio.open_unix_connection(str(self.path))
+            except OSError:
+                self.path.unlink()
+            else:
+                writer.close()
+                raise RuntimeError(f"control socket {self.path} is already in use")
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        # Bind with a private umask so the socket is never reachable by other
+        # users, not even between bind() and a later chmod.
+        umask = os.umask(0o077)
+        try:
+            sock.bind(str(self.path))
+        except OSError:
+            sock.close()
+            raise
+        finally:
+            os.umask(umask)
+        self._server = await asyncio.start_unix_server(self._handle_client, sock=sock)
+        log.info("Control socket listening on %s", self.path)
+
+    async def stop(self) -> None:
+        if self._server is None:
+            return
+        self._server.close()
+        for writer in list(self._subscribers):
+            writer.close()
+        self._subscribers.clear()
+        await self._server.wait_closed()
+        self._server = None
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+        log.debug("Control socket closed")
+
+    def broadcast(self, event: Any) -> None:
+        """Send *event* to every subscribed client."""
+
+        if not self._subscribers:
+            return
+        line = json.dumps({"event": event}, default=str).encode() + b"\n"
+        for writer in list(self._subscribers):
+            if writer.is_closing():
+                self._subscribers.discard(writer)
+                continue
+            writer.write(line)
+
+    async def _handle_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while line := await reader.readline():
+                response = await self._dispatch(line, writer)
+                writer.write(json.dumps(response, default=str).encode() + b"\n")
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._subscribers.discard(writer)
+            writer.close()
+
+    async def _dispatch(
+        self, line: bytes, writer: asyncio.StreamWriter
+    ) -> dict[str, Any]:
+        try:
+            request = json.loads(line)
+            name = request["cmd"]
+        except (ValueError, KeyError, TypeError):
+            return {"ok": False, "error": "invalid request"}
+        if name == "subscribe":
+            self._subscribers.add(writer)
+            return {"ok": True, "result": "subscribed"}
+        handler = self._commands.get(name)
+        if handler is None:
+            return {"ok": False, "error": f"unknown command {name!r}"}
+        try:
+            result = handler(request)
+            if inspect.isawaitable(result):
+                result = await result
+        except Exception as exc:
+            log.warning("Control command %s failed", name, exc_info=True)
+            return {"ok": False, "error": str(exc)}
+        return {"ok": True, "result": result}
+
+
+def register_standard_commands(
+    server: ControlServer,
+    *,
+    status: "StatusModel",
+    presence: object,
+    scheduler: object,
+) -> None:
+    """Expose presence, lock and training state plus ``scan``/``retrain``.
+
+    *presence* and *scheduler* are duck-typed: ``stats``/``scan_now`` and
+    ``status``/``training``/``maybe_train`` are used when present.
+    """
+
+    background: set[asyncio.Task[Any]] = set()
+
+    def _presence(request: dict[str, Any]) -> Any:
+        stats = getattr(presence, "stats", None)
+        return stats() if stats is not None else None
+
+    def _status(request: dict[str, Any]) -> dict[str, Any]:
+        result = status.snapshot()
+        result["presence"] = _presence(request)
+        training = getattr(scheduler, "status", None)
+        result["training"] = training() if training is not None else None
+        return result
+
+    def _scan(request: dict[str, Any]) -> str:
+        scan_now = getattr(presence, "scan_now", None)
+        if scan_now is None:
+            raise RuntimeError("no presence service is running")
+        scan_now()
+        return "scheduled"
+
+    def _retrain(request: dict[str, Any]) -> str:
+        if getattr(scheduler, "training", False):
+            return "already training"
+        task = asyncio.create_task(scheduler.maybe_train(force=True))  # type: ignore[attr-defined]
+        background.add(task)
+        task.add_done_callback(background.discard)
+        return "started"
+
+    def _metrics(request: dict[str, Any]) -> str:
+        from .metrics import metrics
+
+        if not metrics.enabled:
+            raise RuntimeError("metrics are disabled; start with --metrics")
+        return metrics.render_prometheus()
+
+    server.register("status", _status)
+    server.register("presence", _presence)
+    server.register("metrics", _metrics)
+    server.register("scan", _scan)
+    server.register("retrain", _retrain)
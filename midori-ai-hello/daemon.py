@@ -0,0 +1,142 @@
+"""Headless presence-locking daemon without the Textual UI."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import signal
+from pathlib import Path
+from typing import Any
+
+from . import camera_broker
+from .config import Config, ConfigStore, get_config_store
+from .control import ControlServer, register_standard_commands
+from .governor import governor
+from .kde_lock import KDEScreenLocker, PowerInhibitor
+from .metrics import metrics
+from .presence_service import CameraPresenceService
+from .presence_smoothing import PresenceSmoother
+from .screen_lock_manager import ScreenLockManager
+from .status import StatusModel
+from .whitelist import WhitelistManager
+from .yolo_train import YOLOTrainingScheduler, training_loop
+
+
+log = logging.getLogger(__name__)
+
+
+def build_presence_service(
+    store: ConfigStore, locker: KDEScreenLocker | None = None
+) -> CameraPresenceService:
+    """Create the presence service for the configured cameras.
+
+    The service is subscribed to *store* even without cameras, so cameras
+    added later (e.g. in the config screen) start presence detection. With a
+    *locker*, recent session input stands in for camera scans (see
+    ``activity_window``).
+    """
+
+    config: Config = store.config
+    governor.configure(config)
+    whitelist = WhitelistManager(Path(config.model))
+    presence = CameraPresenceService(
+        config.cameras,
+        config.model,
+        whitelist,
+        device=config.device,
+        smoother=PresenceSmoother.from_config(config),
+        class_thresholds=config.class_thresholds,
+        idle_time=locker.get_idle_time if locker is not None else None,
+        activity_window=config.activity_window,
+        prefilter=config.prefilter,
+        prefilter_model=config.prefilter_model,
+        tracking=config.presence_tracking,
+        reverify_interval=config.presence_reverify_interval,
+        camera_timeout=config.camera_timeout,
+        profiles={
+            cam: config.capture_profile(cam, "presence") for cam in config.cameras
+        },
+        broker=camera_broker.broker,
+    )
+    store.subscribe(presence.apply_config)
+    return presence
+
+
+class PresenceDaemon:
+    """Run presence detection, screen locking and training headlessly.
+
+    Only the presence service, :class:`ScreenLockManager`, the training
+    scheduler and a :class:`PowerInhibitor` run, under a plain asyncio loop.
+    State is exposed through a :class:`ControlServer` so a TUI (or scripts)
+    can attach later.
+    """
+
+    def __init__(
+        self,
+        config_path: str | Path,
+        *,
+        socket_path: str | Path | None = None,
+        locker: KDEScreenLocker | None = None,
+        store: ConfigStore | None = None,
+        metrics_file: str | Path | None = None,
+    ) -> None:
+        self._config_path = Path(config_path)
+        self._metrics_file = metrics_file
+        self._store = store or get_config_store(self._config_path)
+        self._locker = locker or KDEScreenLocker()
+        self._scheduler = YOLOTrainingScheduler(
+            self._locker, self._config_path, store=self._store
+        )
+        self._presence = build_presence_service(self._store, self._locker)
+        self._status = StatusModel()
+        self._control = ControlServer(socket_path)
+        self._lock_manager = ScreenLockManager(
+            self._locker, self._presence, notify=self._handle_lock_event
+        )
+        self._stop = asyncio.Event()
+        register_standard_commands(
+            self._control,
+            status=self._status,
+            presence=self._presence,
+            scheduler=self._scheduler,
+        )
+        self._control.register("stop", lambda request: self.stop())
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _handle_lock_event(self, event: tuple[str, Any]) -> None:
+        self._status.apply(event)
+        self._control.broadcast(list(event))
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self.stop)
+            except (NotImplementedError, RuntimeError):  # pragma: no cover
+                pass
+        await self._control.start()
+        tasks: list[asyncio.Task[None]] = []
+        try:
+            async with PowerInhibitor(self._locker, "midori-ai-hello daemon running"):
+                await self._lock_manager.start()
+                tasks = [
+                    asyncio.create_task(training_loop(self._scheduler)),
+                    asyncio.create_task(self._store.watch()),
+                ]
+                if self._metrics_file:
+                    tasks.append(
+                        asyncio.create_task(metrics.export_loop(self._metrics_file))
+                    )
+                log.info("Daemon running")
+                await self._stop.wait()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            stop = getattr(self._presence, "stop", None)
+            if stop is not None:
+                await stop()
+            await self._control.stop()
+            log.info("Daemon stopped")
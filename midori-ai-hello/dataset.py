@@ -0,0 +1,62 @@
+"""Dataset directory layout shared by configuration and capture code."""
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+from typing import Iterable
+
+
+log = logging.getLogger(__name__)
+
+
+class DatasetLayout:
+    """Own the ``images/<camera>`` and ``labels/<camera>`` directory tree.
+
+    Directories are created at most once per camera for the lifetime of the
+    process, so repeated config saves and captures do not re-issue
+    ``mkdir`` chains against (possibly slow, network-backed) storage.
+    """
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+        self._materialised: set[str] = set()
+
+    def image_dir(self, camera_id: str) -> Path:
+        return self.root / "images" / camera_id
+
+    def label_dir(self, camera_id: str) -> Path:
+        return self.root / "labels" / camera_id
+
+    def ensure_camera(self, camera_id: str, *, force: bool = False) -> tuple[Path, Path]:
+        """Create and return the image and label directories for *camera_id*.
+
+        Pass ``force=True`` to re-create directories that were removed behind
+        the layout's back.
+        """
+
+        image_dir = self.image_dir(camera_id)
+        label_dir = self.label_dir(camera_id)
+        if force or camera_id not in self._materialised:
+            image_dir.mkdir(parents=True, exist_ok=True)
+            label_dir.mkdir(parents=True, exist_ok=True)
+            self._materialised.add(camera_id)
+            log.debug("Created dataset directories for camera %s", camera_id)
+        return image_dir, label_dir
+
+    def ensure_cameras(self, camera_ids: Iterable[str]) -> None:
+        for cam in camera_ids:
+            self.ensure_camera(cam)
+
+
+_layouts: dict[Path, DatasetLayout] = {}
+
+
+def get_dataset_layout(root: str | Path) -> DatasetLayout:
+    """Return the process-wide :class:`DatasetLayout` for ``root``."""
+
+    key = Path(root).resolve()
+    layout = _layouts.get(key)
+    if layout is None:
+        layout = _layouts[key] = DatasetLayout(root)
+    return layout
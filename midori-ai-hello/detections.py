@@ -0,0 +1,58 @@
+"""Convert YOLO detection results to NumPy arrays in one step."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+
+def to_numpy(values: Any, dtype: Any = None) -> np.ndarray:
+    """Return *values* (a tensor, array or sequence) as a NumPy array."""
+
+    if values is None:
+        return np.empty(0, dtype=dtype)
+    cpu = getattr(values, "cpu", None)
+    if cpu is not None:
+        values = cpu().numpy()
+    return np.asarray(values, dtype=dtype)
+
+
+def box_arrays(boxes: Any) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return ``(xyxy, cls, conf)`` arrays for an ultralytics ``Boxes`` object.
+
+    ``boxes.data`` (``x1, y1, x2, y2, conf, cls`` rows) is transferred once
+    when available; otherwise the ``xyxy``/``cls``/``conf`` attributes are
+    used. Missing confidences default to ``1.0``.
+    """
+
+    data = getattr(boxes, "data", None)
+    if data is not None:
+        rows = to_numpy(data, np.float64).reshape(-1, 6)
+        return rows[:, :4], rows[:, 5].astype(np.int64), rows[:, 4]
+    cls = to_numpy(getattr(boxes, "cls", None), np.float64).astype(np.int64)
+    conf = getattr(boxes, "conf", None)
+    conf = (
+        np.ones(cls.shape, dtype=np.float64)
+        if conf is None
+        else to_numpy(conf, np.float64)
+    )
+    xyxy = getattr(boxes, "xyxy", None)
+    xyxy = (
+        np.zeros((cls.size, 4), dtype=np.float64)
+        if xyxy is None
+        else to_numpy(xyxy, np.float64).reshape(-1, 4)
+    )
+    return xyxy, cls, conf
+
+
+def first_box(
+    xyxy: np.ndarray, cls: np.ndarray, class_id: int
+) -> tuple[int, int, int, int] | None:
+    """Return the first *class_id* box as ``(x, y, w, h)``, or ``None``."""
+
+    hits = np.flatnonzero(cls == class_id)
+    if not hits.size:
+        return None
+    x1, y1, x2, y2 = xyxy[hits[0]]
+    return int(x1), int(y1), int(x2 - x1), int(y2 - y1)
@@ -0,0 +1,101 @@
+"""In-process stand-in for the session bus's ``org.freedesktop.ScreenSaver``.
+
+:class:`FakeScreenSaverBus` implements the part of
+:class:`dbus_next.aio.MessageBus` that :class:`~midori_ai_hello.kde_lock.KDEScreenLocker`
+uses and answers ScreenSaver calls itself, emitting ``ActiveChanged``
+signals like KDE does. It makes presence→lock runs reproducible without a
+desktop session, e.g. for throughput and latency tests.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+from collections import Counter
+from typing import Callable
+
+from dbus_next import Message
+from dbus_next.constants import MessageFlag
+
+from .kde_lock import INTERFACE, PATH
+
+
+log = logging.getLogger(__name__)
+
+
+class FakeScreenSaverBus:
+    """Answer ScreenSaver method calls in-process.
+
+    *latency* delays every call to model a slow session bus. ``calls``
+    counts requests per member so tests can assert on traffic.
+    """
+
+    def __init__(self, *, latency: float = 0.0, idle_time: int = 0) -> None:
+        self.latency = latency
+        self.idle_time = idle_time
+        self.active = False
+        self.connected = True
+        self.inhibitors: dict[int, str] = {}
+        self.calls: Counter[str] = Counter()
+        self._handlers: list[Callable[[Message], object]] = []
+        self._serials = itertools.count(1)
+        self._cookies = itertools.count(1)
+
+    def add_message_handler(self, handler: Callable[[Message], object]) -> None:
+        self._handlers.append(handler)
+
+    def remove_message_handler(self, handler: Callable[[Message], object]) -> None:
+        if handler in self._handlers:
+            self._handlers.remove(handler)
+
+    async def call(self, msg: Message) -> Message | None:
+        if not self.connected:
+            raise EOFError("fake bus is disconnected")
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if not msg.serial:
+            msg.serial = next(self._serials)
+        self.calls[msg.member] += 1
+        signature, body = self._dispatch(msg)
+        if msg.flags & MessageFlag.NO_REPLY_EXPECTED:
+            return None
+        return Message.new_method_return(msg, signature, body)
+
+    def set_active(self, active: bool) -> None:
+        """Change the lock state as if the user locked or unlocked."""
+
+        if active == self.active:
+            return
+        self.active = active
+        log.debug("Fake screensaver active=%s", active)
+        signal = Message.new_signal(PATH, INTERFACE, "ActiveChanged", "b", [active])
+        loop = asyncio.get_running_loop()
+        for handler in list(self._handlers):
+            loop.call_soon(handler, signal)
+
+    def disconnect(self) -> None:
+        self.connected = False
+
+    def _dispatch(self, msg: Message) -> tuple[str, list[object]]:
+        member = msg.member
+        if msg.interface == "org.freedesktop.DBus":
+            return "", []
+        if member == "Lock":
+            self.set_active(True)
+        elif member == "SetActive":
+            self.set_active(bool(msg.body[0]))
+            return "b", [True]
+        elif member == "GetActive":
+            return "b", [self.active]
+        elif member == "GetSessionIdleTime":
+            return "u", [self.idle_time]
+        elif member == "Inhibit":
+            cookie = next(self._cookies)
+            self.inhibitors[cookie] = msg.body[1]
+            return "u", [cookie]
+        elif member == "UnInhibit":
+            self.inhibitors.pop(int(msg.body[0]), None)
+        else:
+            log.warning("Fake screensaver ignoring unknown call %s", member)
+        return "", []
@@ -0,0 +1,220 @@
+"""CPU thread and affinity governor for inference and training.
+
+Torch, OpenCV and the training data loader each default to one thread per
+core, so presence inference, capture inference and a background training run
+compete for every CPU. :class:`ResourceGovernor` splits the CPUs this process
+may use into an inference set and a training set, and only acts while a
+training run is active:
+
+* training runs in :meth:`ResourceGovernor.training`, which pins the
+  training thread (and the data loader workers and subprocesses it starts,
+  which inherit the affinity) to the training set. Torch's intra-op pool and
+  OpenCV's pool are process-wide, so they are sized once when the first run
+  starts (torch to the training thread count, OpenCV to the inference one)
+  and restored when the last run ends;
+* presence scans pin their worker thread to the inference set while a run
+  is active and hand it back to every CPU afterwards. Outside training they
+  make no system calls at all.
+
+Affinity is Linux-only; elsewhere only the thread counts are applied. A
+single :data:`governor` instance is shared by the presence service and the
+training scheduler. It stays inert (nothing pinned, no thread counts or
+data loader workers changed) unless the config sets ``inference_cpus``,
+``training_cpus``, ``inference_threads`` or ``training_threads``.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Sequence
+
+try:  # pragma: no cover - optional dependency
+    import cv2  # type: ignore
+except Exception:  # pragma: no cover - handled gracefully
+    cv2 = None  # type: ignore
+
+from .config import Config
+
+
+log = logging.getLogger(__name__)
+
+
+def available_cpus() -> list[int]:
+    """CPUs this process may run on."""
+
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def split_cpus(
+    cpus: Sequence[int],
+    inference: Sequence[int] = (),
+    training: Sequence[int] = (),
+) -> tuple[list[int], list[int]]:
+    """Return disjoint ``(inference, training)`` CPU sets.
+
+    Explicit sets are intersected with *cpus*. By default inference gets a
+    quarter of the CPUs (at least one) and training the rest; with a single
+    CPU both share it.
+    """
+
+    allowed = set(cpus)
+    infer = sorted(allowed & set(inference))
+    if not infer:
+        infer = list(cpus[: max(1, len(cpus) // 4)])
+    train = sorted((allowed & set(training)) - set(infer))
+    if not train:
+        train = [cpu for cpu in cpus if cpu not in infer] or list(infer)
+    return infer, train
+
+
+def _set_torch_threads(count: int) -> int | None:
+    """Resize torch's process-wide intra-op pool; return the previous size."""
+
+    try:
+        import torch  # type: ignore
+    except Exception:
+        return None
+    previous = torch.get_num_threads()
+    torch.set_num_threads(count)
+    return previous
+
+
+def _pin(cpus: Sequence[int]) -> None:
+    """Restrict the calling thread to *cpus* (no-op where unsupported)."""
+
+    if not hasattr(os, "sched_setaffinity"):
+        return
+    try:
+        os.sched_setaffinity(0, cpus)
+    except OSError:
+        log.debug("Could not set CPU affinity to %s", cpus, exc_info=True)
+
+
+class ResourceGovernor:
+    """Split CPUs and thread pools between presence inference and training."""
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.cpus = available_cpus()
+        self.inference_cpus: list[int] = list(self.cpus)
+        self.training_cpus: list[int] = list(self.cpus)
+        self.inference_threads = len(self.cpus)
+        self.training_threads = len(self.cpus)
+        self._training = 0
+        self._cv2_threads: int | None = None
+        self._torch_threads: int | None = None
+        self._narrowed: set[int] = set()
+        self._lock = threading.Lock()
+
+    @property
+    def training_active(self) -> bool:
+        return self._training > 0
+
+    def configure(self, config: Config) -> None:
+        """Apply the CPU sets and thread counts from *config*.
+
+        Without any of the governor options the governor is (or becomes)
+        inert; a run already in progress keeps its settings until it ends.
+        """
+
+        if not (
+            config.inference_cpus
+            or config.training_cpus
+            or config.inference_threads
+            or config.training_threads
+        ):
+            if self.enabled:
+                log.info("CPU governor disabled")
+                self.enabled = False
+            return
+        infer, train = split_cpus(
+            self.cpus, config.inference_cpus, config.training_cpus
+        )
+        settings = (
+            infer,
+            train,
+            config.inference_threads or len(infer),
+            config.training_threads or len(train),
+        )
+        current = (
+            self.inference_cpus,
+            self.training_cpus,
+            self.inference_threads,
+            self.training_threads,
+        )
+        if self.enabled and settings == current:
+            return
+        (
+            self.inference_cpus,
+            self.training_cpus,
+            self.inference_threads,
+            self.training_threads,
+        ) = settings
+        self.enabled = True
+        log.info(
+            "Inference on CPUs %s (%d threads), training on CPUs %s (%d threads)",
+            self.inference_cpus,
+            self.inference_threads,
+            self.training_cpus,
+            self.training_threads,
+        )
+
+    def pin_inference(self) -> None:
+        """Pin the calling inference thread for the current training state.
+
+        Only touches affinity while a governed run is active, or to undo that
+        on a thread pinned during one.
+        """
+
+        ident = threading.get_ident()
+        if self.training_active:
+            if ident not in self._narrowed:
+                _pin(self.inference_cpus)
+                self._narrowed.add(ident)
+        elif ident in self._narrowed:
+            _pin(self.cpus)
+            self._narrowed.discard(ident)
+
+    @contextmanager
+    def training(self) -> Iterator[None]:
+        """Run the body as training: pinned to the training CPUs.
+
+        Inference threads pick up the narrower set on their next scan. The
+        torch and OpenCV thread counts are restored when the last run ends.
+        """
+
+        if not self.enabled:
+            yield
+            return
+        with self._lock:
+            self._training += 1
+            if self._training == 1:
+                if cv2 is not None:
+                    self._cv2_threads = cv2.getNumThreads()
+                    cv2.setNumThreads(self.inference_threads)
+                self._torch_threads = _set_torch_threads(self.training_threads)
+        _pin(self.training_cpus)
+        log.debug("Training pinned to CPUs %s", self.training_cpus)
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._training -= 1
+                if not self._training:
+                    if self._cv2_threads is not None:
+                        cv2.setNumThreads(self._cv2_threads)
+                        self._cv2_threads = None
+                    if self._torch_threads is not None:
+                        _set_torch_threads(self._torch_threads)
+                        self._torch_threads = None
+            # Executor threads are reused; hand this one back unrestricted.
+            _pin(self.cpus)
+            log.debug("Training finished; inference may use all CPUs")
+
+
+governor = ResourceGovernor()
@@ -3,13 +3,16 @@
 from __future__ import annotations
 
 import asyncio
+import copy
 import inspect
 import logging
 from typing import Awaitable, Callable
 
 from dbus_next import BusType, Message
 from dbus_next.aio import MessageBus
-from dbus_next.constants import MessageType
+from dbus_next.constants import MessageFlag, MessageType
+
+from .metrics import metrics
 
 
 log = logging.getLogger(__name__)
@@ -20,94 +23,178 @@ INTERFACE = "org.freedesktop.ScreenSaver"
 
 
 class KDEScreenLocker:
-    """Client for KDE's :code:`org.freedesktop.ScreenSaver` interface."""
+    """Client for KDE's :code:`org.freedesktop.ScreenSaver` interface.
+
+    The locker owns a persistent session-bus connection. If the bus drops,
+    the next call (or the background disconnect watcher) reconnects and
+    re-registers message handlers and match rules, so ``ActiveChanged``
+    subscriptions survive a session-bus restart. Method-call messages are
+    built once and copied per call, and every call is bounded by *timeout*.
+    """
 
-    def __init__(self, bus: MessageBus | None = None) -> None:
+    def __init__(
+        self, bus: MessageBus | None = None, *, timeout: float | None = 5.0
+    ) -> None:
         """Optionally provide an existing :class:`MessageBus` instance."""
         self._bus = bus
-
+        self._timeout = timeout
+        self._connect_lock = asyncio.Lock()
+        self._handlers: list[Callable[[Message], bool]] = []
+        self._match_rules: list[str] = []
+        self._messages: dict[tuple[object, ...], Message] = {}
+        self._watch_task: asyncio.Task[None] | None = None
+        if bus is not None:
+            self._watch(bus)
+
+    # ------------------------------------------------------------------
+    # Connection management
+    # ------------------------------------------------------------------
     async def _ensure_bus(self) -> MessageBus:
-        """Connect to the session bus if one was not supplied."""
-        if self._bus is None:
-            self._bus = await MessageBus(bus_type=BusType.SESSION).connect()
-            log.debug("Connected to DBus session bus")
-        return self._bus
+        """Return a connected bus, (re)connecting to the session bus if needed."""
+        bus = self._bus
+        if bus is not None and getattr(bus, "connected", True):
+            return bus
+        async with self._connect_lock:
+            if self._bus is not None and getattr(self._bus, "connected", True):
+                return self._bus
+            reconnect = self._bus is not None
+            bus = await MessageBus(bus_type=BusType.SESSION).connect()
+            self._bus = bus
+            log.debug(
+                "%s DBus session bus", "Reconnected to" if reconnect else "Connected to"
+            )
+            for handler in self._handlers:
+                bus.add_message_handler(handler)
+            for rule in self._match_rules:
+                await self._send(bus, self._add_match_message(rule))
+            self._watch(bus)
+            return bus
+
+    def _watch(self, bus: MessageBus) -> None:
+        """Reconnect in the background once *bus* disconnects."""
+        wait = getattr(bus, "wait_for_disconnect", None)
+        if wait is None or not self._handlers and not self._match_rules:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        if self._watch_task and not self._watch_task.done():
+            self._watch_task.cancel()
+        self._watch_task = loop.create_task(self._reconnect_when_dropped(bus))
+
+    async def _reconnect_when_dropped(self, bus: MessageBus) -> None:
+        try:
+            await bus.wait_for_disconnect()
+        except Exception:
+            pass
+        log.warning("DBus session bus disconnected; reconnecting")
+        delay = 1.0
+        while self._bus is bus:
+            try:
+                await self._ensure_bus()
+                return
+            except Exception:
+                log.debug("DBus reconnect failed; retrying in %s s", delay)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 30.0)
+
+    def _message(self, member: str, signature: str = "", body: tuple = ()) -> Message:
+        """Return a fresh copy of a cached method-call message."""
+        key = (member, signature, body)
+        template = self._messages.get(key)
+        if template is None:
+            template = self._messages[key] = Message(
+                destination=SCREEN_SAVER,
+                path=PATH,
+                interface=INTERFACE,
+                member=member,
+                signature=signature,
+                body=list(body),
+            )
+        msg = copy.copy(template)
+        msg.serial = 0
+        return msg
+
+    @staticmethod
+    def _add_match_message(rule: str) -> Message:
+        return Message(
+            destination="org.freedesktop.DBus",
+            path="/org/freedesktop/DBus",
+            interface="org.freedesktop.DBus",
+            member="AddMatch",
+            signature="s",
+            body=[rule],
+        )
+
+    async def _send(self, bus: MessageBus, msg: Message) -> Message | None:
+        with metrics.timer("midori_dbus_call_seconds", member=msg.member):
+            if self._timeout is None:
+                return await bus.call(msg)
+            return await asyncio.wait_for(bus.call(msg), self._timeout)
 
+    async def _call(self, msg: Message) -> Message | None:
+        """Send *msg*, reconnecting and retrying once if the bus dropped."""
+        bus = await self._ensure_bus()
+        try:
+            return await self._send(bus, msg)
+        except (EOFError, ConnectionError, OSError):
+            if getattr(bus, "connected", False):
+                raise
+            log.warning("DBus call %s failed on a dropped bus; retrying", msg.member)
+            msg.serial = 0
+            bus = await self._ensure_bus()
+            return await self._send(bus, msg)
+
+    # ------------------------------------------------------------------
+    # ScreenSaver API
+    # ------------------------------------------------------------------
     async def lock(self) -> None:
         """Trigger the desktop screen locker."""
-        bus = await self._ensure_bus()
         log.info("Locking screen via DBus")
-        msg = Message(
-            destination=SCREEN_SAVER,
-            path=PATH,
-            interface=INTERFACE,
-            member="Lock",
-        )
-        await bus.call(msg)
+        await self._call(self._message("Lock"))
 
-    async def set_active(self, active: bool) -> None:
-        """Set the screensaver active state."""
-        bus = await self._ensure_bus()
+    async def set_active(self, active: bool, *, reply: bool = True) -> None:
+        """Set the screensaver active state.
+
+        With ``reply=False`` the call is sent without waiting for the
+        session's answer, so unlocking is not gated on a DBus round-trip.
+        """
         log.debug("Setting screensaver active=%s", active)
-        msg = Message(
-            destination=SCREEN_SAVER,
-            path=PATH,
-            interface=INTERFACE,
-            member="SetActive",
-            signature="b",
-            body=[active],
-        )
-        await bus.call(msg)
+        msg = self._message("SetActive", "b", (active,))
+        if not reply:
+            msg.flags = MessageFlag.NO_REPLY_EXPECTED
+        await self._call(msg)
 
     async def get_idle_time(self) -> int:
         """Return seconds of session idle time."""
-        bus = await self._ensure_bus()
-        msg = Message(
-            destination=SCREEN_SAVER,
-            path=PATH,
-            interface=INTERFACE,
-            member="GetSessionIdleTime",
-        )
-        reply = await bus.call(msg)
+        reply = await self._call(self._message("GetSessionIdleTime"))
         idle = int(reply.body[0])
         log.debug("Session idle time %s seconds", idle)
         return idle
 
     async def inhibit(self, reason: str) -> int:
         """Disable automatic screen locking and return an inhibition cookie."""
-        bus = await self._ensure_bus()
         log.debug("Inhibiting screensaver: %s", reason)
-        msg = Message(
-            destination=SCREEN_SAVER,
-            path=PATH,
-            interface=INTERFACE,
-            member="Inhibit",
-            signature="ss",
-            body=["midori-ai-hello", reason],
+        reply = await self._call(
+            self._message("Inhibit", "ss", ("midori-ai-hello", reason))
         )
-        reply = await bus.call(msg)
         cookie = int(reply.body[0])
         log.debug("Inhibit cookie %s", cookie)
         return cookie
 
     async def uninhibit(self, cookie: int) -> None:
         """Re-enable automatic screen locking for a prior inhibition cookie."""
-        bus = await self._ensure_bus()
         log.debug("Uninhibiting screensaver cookie %s", cookie)
-        msg = Message(
-            destination=SCREEN_SAVER,
-            path=PATH,
-            interface=INTERFACE,
-            member="UnInhibit",
-            signature="u",
-            body=[cookie],
-        )
-        await bus.call(msg)
+        await self._call(self._message("UnInhibit", "u", (cookie,)))
 
     async def add_active_changed_handler(
         self, handler: Callable[[bool], Awaitable[None] | None]
     ) -> None:
-        """Invoke *handler* whenever the screen lock state changes."""
+        """Invoke *handler* whenever the screen lock state changes.
+
+        The handler and its match rule are replayed after a reconnect.
+        """
 
         def _wrapper(msg: Message) -> bool:
             if (
@@ -124,20 +211,14 @@ class KDEScreenLocker:
             return True
 
         bus = await self._ensure_bus()
+        self._handlers.append(_wrapper)
         bus.add_message_handler(_wrapper)
         log.debug("Added ActiveChanged handler")
-        await bus.call(
-            Message(
-                destination="org.freedesktop.DBus",
-                path="/org/freedesktop/DBus",
-                interface="org.freedesktop.DBus",
-                member="AddMatch",
-                signature="s",
-                body=[
-                    f"type='signal',interface='{INTERFACE}',member='ActiveChanged'"
-                ],
-            )
-        )
+        rule = f"type='signal',interface='{INTERFACE}',member='ActiveChanged'"
+        if rule not in self._match_rules:
+            self._match_rules.append(rule)
+            await self._send(bus, self._add_match_message(rule))
+        self._watch(bus)
 
 
 class PowerInhibitor:
@@ -0,0 +1,148 @@
+"""Non-blocking logging pipeline.
+
+Records are handed to a :class:`~logging.handlers.QueueHandler` on the
+calling thread and written by a :class:`~logging.handlers.QueueListener`
+thread, so scans, DBus callbacks and the UI never wait on disk I/O. The log
+file rotates by size, individual modules can override their level and a
+:class:`SamplingFilter` caps how often any single high-frequency debug line
+is recorded.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import queue
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from pathlib import Path
+from typing import Iterable, Mapping
+
+
+log = logging.getLogger(__name__)
+
+LOG_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+
+_listener: QueueListener | None = None
+
+
+class SamplingFilter(logging.Filter):
+    """Let at most *limit* records per message template through per *interval*.
+
+    Only records below *max_level* (DEBUG by default) are sampled. Records are
+    grouped by logger name and unformatted message, so ``"Detected %s"`` is
+    one stream regardless of its arguments. The first record let through
+    after suppression notes how many similar records were dropped.
+    """
+
+    def __init__(
+        self, limit: int = 20, interval: float = 10.0, max_level: int = logging.DEBUG
+    ) -> None:
+        super().__init__()
+        self.limit = limit
+        self.interval = interval
+        self.max_level = max_level
+        self._windows: dict[tuple[str, object], list[float]] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > self.max_level or self.limit <= 0:
+            return True
+        key = (record.name, record.msg)
+        now = time.monotonic()
+        with self._lock:
+            # [window start, records let through, records suppressed]
+            window = self._windows.get(key)
+            if window is None or now - window[0] >= self.interval:
+                suppressed = int(window[2]) if window else 0
+                self._windows[key] = [now, 1, 0]
+            elif window[1] < self.limit:
+                window[1] += 1
+                return True
+            else:
+                window[2] += 1
+                return False
+        if suppressed and isinstance(record.msg, str):
+            record.msg = f"{record.msg} [{suppressed} similar messages suppressed]"
+        return True
+
+
+def parse_module_levels(specs: Iterable[str]) -> dict[str, int]:
+    """Parse ``name=LEVEL`` items (comma separated or repeated)."""
+
+    levels: dict[str, int] = {}
+    for spec in specs:
+        for item in spec.split(","):
+            item = item.strip()
+            if not item:
+                continue
+            name, sep, level = item.partition("=")
+            value = logging.getLevelName(level.strip().upper())
+            if not sep or not name.strip() or not isinstance(value, int):
+                raise ValueError(f"invalid module log level {item!r}")
+            levels[name.strip()] = value
+    return levels
+
+
+def configure_logging(
+    level: str,
+    *,
+    log_path: str | Path = "midori-ai-hello.log",
+    max_bytes: int = 5 * 1024 * 1024,
+    backup_count: int = 3,
+    module_levels: Mapping[str, int] | None = None,
+    sampling: SamplingFilter | None = None,
+) -> QueueListener:
+    """Route all logging through a background listener thread.
+
+    The file receives everything at DEBUG and rotates at *max_bytes*; the
+    console shows *level* and above. Calling this again replaces the previous
+    pipeline. Returns the running listener; :func:`shutdown_logging` flushes
+    and stops it (also registered with :mod:`atexit`).
+    """
+
+    global _listener
+    shutdown_logging()
+
+    formatter = logging.Formatter(LOG_FORMAT)
+    file_handler = RotatingFileHandler(
+        log_path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8"
+    )
+    file_handler.setLevel(logging.DEBUG)
+    file_handler.setFormatter(formatter)
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(getattr(logging, level.upper(), logging.INFO))
+    console_handler.setFormatter(formatter)
+
+    records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    queue_handler = QueueHandler(records)
+    queue_handler.addFilter(sampling or SamplingFilter())
+
+    root = logging.getLogger()
+    root.setLevel(logging.DEBUG)
+    root.handlers.clear()
+    root.addHandler(queue_handler)
+    for name, module_level in (module_levels or {}).items():
+        logging.getLogger(name).setLevel(module_level)
+
+    _listener = QueueListener(
+        records, file_handler, console_handler, respect_handler_level=True
+    )
+    _listener.start()
+    return _listener
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the listener thread."""
+
+    global _listener
+    listener, _listener = _listener, None
+    if listener is None:
+        return
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+atexit.register(shutdown_logging)
@@ -0,0 +1,240 @@
+"""Lightweight latency histograms and hot-path instrumentation.
+
+The module-level :data:`metrics` registry is disabled by default; while
+disabled, :meth:`MetricsRegistry.timer` returns a shared no-op context
+manager and the other recording methods return immediately, so
+instrumented hot paths cost a single attribute check. Enabled registries
+render their contents in the Prometheus text exposition format.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from pathlib import Path
+from typing import Any, Iterator, Sequence
+
+
+log = logging.getLogger(__name__)
+
+
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class Histogram:
+    """Fixed-bucket histogram of durations in seconds."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self.count += 1
+            self.sum += value
+
+    def cumulative(self) -> list[tuple[float, int]]:
+        """Return ``(upper_bound, cumulative_count)`` pairs, ending at ``inf``."""
+
+        with self._lock:
+            counts = list(self._counts)
+        total = 0
+        pairs: list[tuple[float, int]] = []
+        for bound, count in zip((*self.buckets, float("inf")), counts):
+            total += count
+            pairs.append((bound, total))
+        return pairs
+
+    def quantile(self, q: float) -> float | None:
+        """Estimate the *q* quantile as the upper bound of its bucket."""
+
+        if not self.count:
+            return None
+        rank = q * self.count
+        for bound, total in self.cumulative():
+            if total >= rank:
+                return bound
+        return float("inf")  # pragma: no cover - unreachable
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "p50": self.quantile(0.5),
+            "p99": self.quantile(0.99),
+            "buckets": {str(bound): total for bound, total in self.cumulative()},
+        }
+
+
+LabelKey = tuple[tuple[str, str], ...]
+
+_NULL_TIMER = contextlib.nullcontext()
+
+
+class MetricsRegistry:
+    """Collect counters and timing histograms keyed by name and labels."""
+
+    def __init__(self, *, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self._counters: dict[str, dict[LabelKey, float]] = {}
+        self._histograms: dict[str, dict[LabelKey, Histogram]] = {}
+        self._help: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def describe(self, name: str, help_text: str) -> None:
+        self._help[name] = help_text
+
+    def inc(self, name: str, value: float = 1.0, **labels: str) -> None:
+        if not self.enabled:
+            return
+        key = _label_key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0.0) + value
+
+    def observe(self, name: str, seconds: float, **labels: str) -> None:
+        if not self.enabled:
+            return
+        key = _label_key(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            hist = series.get(key)
+            if hist is None:
+                hist = series[key] = Histogram()
+        hist.observe(seconds)
+
+    def timer(self, name: str, **labels: str) -> contextlib.AbstractContextManager[Any]:
+        """Time the ``with`` block into histogram *name*."""
+
+        if not self.enabled:
+            return _NULL_TIMER
+        return self._timed(name, labels)
+
+    @contextlib.contextmanager
+    def _timed(self, name: str, labels: dict[str, str]) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, **labels)
+
+    def histogram(self, name: str, **labels: str) -> Histogram | None:
+        return self._histograms.get(name, {}).get(_label_key(labels))
+
+    def counter(self, name: str, **labels: str) -> float:
+        return self._counters.get(name, {}).get(_label_key(labels), 0.0)
+
+    def render_prometheus(self) -> str:
+        """Return all metrics in the Prometheus text exposition format."""
+
+        lines: list[str] = []
+        with self._lock:
+            counters = {n: dict(s) for n, s in self._counters.items()}
+            histograms = {n: dict(s) for n, s in self._histograms.items()}
+        for name in sorted(counters):
+            self._header(lines, name, "counter")
+            for key, value in sorted(counters[name].items()):
+                lines.append(f"{name}{_format_labels(key)} {value:g}")
+        for name in sorted(histograms):
+            self._header(lines, name, "histogram")
+            for key, hist in sorted(histograms[name].items()):
+                for bound, total in hist.cumulative():
+                    le = "+Inf" if bound == float("inf") else f"{bound:g}"
+                    labels = _format_labels((*key, ("le", le)))
+                    lines.append(f"{name}_bucket{labels} {total}")
+                lines.append(f"{name}_sum{_format_labels(key)} {hist.sum:.6f}")
+                lines.append(f"{name}_count{_format_labels(key)} {hist.count}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def write_prometheus(self, path: str | Path) -> None:
+        """Atomically write :meth:`render_prometheus` output to *path*.
+
+        Suitable for node_exporter's textfile collector.
+        """
+
+        target = Path(path)
+        tmp = target.with_name(target.name + ".tmp")
+        tmp.write_text(self.render_prometheus())
+        os.replace(tmp, target)
+
+    async def export_loop(self, path: str | Path, interval: float = 15.0) -> None:
+        """Write metrics to *path* every *interval* seconds."""
+
+        while True:
+            try:
+                await asyncio.to_thread(self.write_prometheus, path)
+            except OSError:
+                log.warning("Failed to write metrics to %s", path, exc_info=True)
+            await asyncio.sleep(interval)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def _header(self, lines: list[str], name: str, kind: str) -> None:
+        help_text = self._help.get(name)
+        if help_text:
+            lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+
+
+def _label_key(labels: dict[str, str]) -> LabelKey:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _format_labels(key: LabelKey) -> str:
+    if not key:
+        return ""
+    inner = ",".join(
+        '{}="{}"'.format(k, v.replace("\\", "\\\\").replace('"', '\\"'))
+        for k, v in key
+    )
+    return "{" + inner + "}"
+
+
+metrics = MetricsRegistry()
+"""Process-wide registry used by the instrumented modules."""
+
+metrics.describe("midori_camera_open_seconds", "Time to open a camera device")
+metrics.describe("midori_camera_read_seconds", "Time to read one camera frame")
+metrics.describe("midori_camera_failures_total", "Camera open, read or timeout failures")
+metrics.describe("midori_inference_seconds", "Presence model inference time")
+metrics.describe("midori_prefilter_seconds", "Presence pre-filter time")
+metrics.describe("midori_prefilter_rejects_total", "Frames rejected by the pre-filter")
+metrics.describe("midori_scans_total", "Presence scans performed")
+metrics.describe("midori_scans_skipped_total", "Presence scans skipped")
+metrics.describe(
+    "midori_track_verifications_total", "Full identifications in tracking mode"
+)
+metrics.describe(
+    "midori_track_static_frames_total",
+    "Tracking-mode samples skipped because the scene did not change",
+)
+metrics.describe("midori_whitelist_read_seconds", "Whitelist decrypt time")
+metrics.describe("midori_dbus_call_seconds", "ScreenSaver DBus call time")
+metrics.describe("midori_save_sample_seconds", "Time to write a labelled sample")
+metrics.describe("midori_training_seconds", "Duration of training runs")
+metrics.describe("midori_model_warmup_seconds", "Warm-up inference after model load")
@@ -0,0 +1,177 @@
+"""Model loading with a fused-weights cache and warm-up inference.
+
+The first call on a freshly loaded YOLO model fuses Conv+BatchNorm layers
+and warms the allocator, so it is several times slower than later calls.
+:func:`load_model` does that work up front: it loads fused, eval-mode
+weights from an on-disk cache keyed on the SHA-256 of the source weights
+(writing the cache on first use) and runs one throw-away inference per
+input size before handing the model out.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+import numpy as np
+
+from .metrics import metrics
+
+
+log = logging.getLogger(__name__)
+
+CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    / "midori-ai-hello"
+    / "models"
+)
+
+_digests: dict[tuple[str, int, int], str] = {}
+
+
+def weights_digest(path: str | Path) -> str | None:
+    """Return the SHA-256 of *path*, or ``None`` if it is not a local file.
+
+    Digests are memoised on the file's modification time and size.
+    """
+
+    path = Path(path)
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    key = (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+    digest = _digests.get(key)
+    if digest is None:
+        sha = hashlib.sha256()
+        with path.open("rb") as fh:
+            for chunk in iter(lambda: fh.read(1 << 20), b""):
+                sha.update(chunk)
+        digest = _digests[key] = sha.hexdigest()
+    return digest
+
+
+def _source_key(path: str | Path) -> str:
+    """Short key for the weights' location, so equally named files differ."""
+
+    resolved = str(Path(path).resolve())
+    return f"{Path(path).stem}-{hashlib.sha256(resolved.encode()).hexdigest()[:8]}"
+
+
+def cache_path(path: str | Path, cache_dir: Path | None = None) -> Path | None:
+    """Return where the fused copy of *path* lives (whether or not it exists).
+
+    The name is ``<stem>-<location hash>-<content hash>.pt``: retrained
+    weights at the same path replace their old entry, while two ``best.pt``
+    files in different runs keep separate ones.
+    """
+
+    digest = weights_digest(path)
+    if digest is None:
+        return None
+    return (cache_dir or CACHE_DIR) / f"{_source_key(path)}-{digest[:16]}.pt"
+
+
+def fuse_and_cache(model: Any, target: Path) -> bool:
+    """Fuse *model*, switch it to eval mode and save it to *target*.
+
+    Models without ``fuse``/``save`` (other backends, test doubles) are left
+    alone. The file is written under a unique temporary name and renamed
+    into place, so concurrent loads of the same weights cannot interleave
+    their writes. Older cache files for the same source path are removed.
+    """
+
+    fuse = getattr(model, "fuse", None)
+    save = getattr(model, "save", None)
+    if not callable(fuse) or not callable(save):
+        return False
+    tmp: Path | None = None
+    try:
+        fuse()
+        inner = getattr(model, "model", None)
+        if callable(getattr(inner, "eval", None)):
+            inner.eval()
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            dir=target.parent, prefix=f".{target.stem}-", suffix=".pt", delete=False
+        ) as fh:
+            tmp = Path(fh.name)
+        save(str(tmp))
+        os.replace(tmp, target)
+    except Exception:
+        log.warning("Could not cache fused model at %s", target, exc_info=True)
+        if tmp is not None:
+            tmp.unlink(missing_ok=True)
+        return False
+    source = target.stem.rsplit("-", 1)[0]
+    for stale in target.parent.glob(f"{source}-*.pt"):
+        if stale != target:
+            stale.unlink(missing_ok=True)
+    log.info("Cached fused model at %s", target)
+    return True
+
+
+def warm_up(model: Any, sizes: Iterable[int | None] = (None,)) -> None:
+    """Run one inference per *sizes* entry (``None`` = model default)."""
+
+    frame = np.zeros((480, 640, 3), dtype=np.uint8)
+    for imgsz in sizes:
+        kwargs: dict[str, Any] = {"verbose": False}
+        if imgsz:
+            kwargs["imgsz"] = imgsz
+        try:
+            with metrics.timer("midori_model_warmup_seconds"):
+                model(frame, **kwargs)
+        except Exception:
+            log.debug("Warm-up inference failed", exc_info=True)
+            return
+
+
+def load_model(
+    factory: Callable[[str], Any],
+    path: str | Path,
+    device: str,
+    *,
+    warmup_sizes: Iterable[int | None] = (None,),
+    cache_dir: Path | None = None,
+) -> Any:
+    """Load *path* with *factory* (e.g. ``YOLO``) ready for steady-state use.
+
+    Loads the fused cache for these weights when present; otherwise (or if
+    the cache cannot be loaded) loads *path*, fuses it and writes the cache
+    for the next start. The model is
+    then moved to *device* and warmed up at each of *warmup_sizes*.
+    """
+
+    cached = cache_path(path, cache_dir)
+    model = None
+    if cached is not None and cached.exists():
+        log.debug("Loading fused model %s for %s", cached, path)
+        try:
+            model = factory(str(cached))
+        except Exception:
+            log.warning(
+                "Fused model cache %s is unreadable; rebuilding it",
+                cached,
+                exc_info=True,
+            )
+            cached.unlink(missing_ok=True)
+    if model is None:
+        model = factory(str(path))
+        if cached is not None:
+            fuse_and_cache(model, cached)
+    model = model.to(device)
+    started = time.perf_counter()
+    warm_up(model, warmup_sizes)
+    log.debug(
+        "Model %s ready on %s after %.2f s warm-up",
+        path,
+        device,
+        time.perf_counter() - started,
+    )
+    return model
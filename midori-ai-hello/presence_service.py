@@ -4,28 +4,99 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from pathlib import Path
-from typing import Awaitable, Callable, List
+from typing import Awaitable, Callable, List, Mapping, NamedTuple
+
+import numpy as np
 
 try:  # pragma: no cover - optional dependency
     from ultralytics import YOLO  # type: ignore
 except Exception:  # pragma: no cover - handled gracefully
     YOLO = None  # type: ignore
 
-try:  # pragma: no cover - optional dependency
-    import cv2  # type: ignore
-except Exception:  # pragma: no cover - handled gracefully
-    cv2 = None  # type: ignore
-
+from .camera import CaptureProfile, FrameSource
+from .camera_broker import CameraBroker
+from .camera_health import CameraHealth, CameraTimeout, CameraWorker
+from .config import Config
+from .detections import box_arrays
+from .governor import governor
+from .metrics import Histogram, metrics
+from .model_cache import load_model
+from .prefilter import build_prefilter
+from .tracking import IoUTracker, SceneChange
+from .presence_smoothing import PresenceSmoother
 from .whitelist import WhitelistManager
 
 log = logging.getLogger(__name__)
 
 Listener = Callable[[bool], Awaitable[None] | None]
+IdleTime = Callable[[], Awaitable[int]]
+ConfidenceListener = Callable[[bool, float], Awaitable[None] | None]
+
+
+class ClassLookup(NamedTuple):
+    """Per-class-id whitelist lookup for one model ``names`` mapping.
+
+    ``allowed`` and ``min_conf`` are indexed by class id and have one extra
+    trailing slot (never allowed) for ids the model did not declare.
+    """
+
+    names: dict[int, str]
+    authorised: frozenset[str]
+    thresholds: dict[str, float]
+    ids: list[int]
+    allowed: np.ndarray
+    min_conf: np.ndarray
+    labels: dict[int, str]
 
 
 class CameraPresenceService:
-    """Detect authorised user presence across multiple cameras."""
+    """Detect authorised user presence across multiple cameras.
+
+    While the screen is locked (see :meth:`set_locked`) the service switches
+    to a fast path: cameras stay open between scans, frames are sampled every
+    *locked_interval* seconds with a cheap, reduced ``imgsz`` pass, and the
+    full-resolution pass only runs to confirm frames the cheap pass flagged.
+
+    Each scan yields a confidence score (the best authorised detection, after
+    per-class *class_thresholds*) which a :class:`PresenceSmoother` turns into
+    the presence decision, so single missed or spurious detections do not
+    flip the state.
+
+    When *idle_time* (e.g. :meth:`KDEScreenLocker.get_idle_time`) is given,
+    keyboard or mouse input within the last *activity_window* seconds counts
+    as authoritative presence and the camera scan is skipped; inference only
+    runs once the session has been idle that long. Input is never trusted
+    while the screen is locked.
+
+    With a *prefilter* (``"haar"`` or ``"yunet"``, see
+    :mod:`~midori_ai_hello.prefilter`) each frame first goes through a cheap
+    OpenCV detector and the presence model only runs when it finds someone.
+
+    In *tracking* mode cameras stay open and are sampled every
+    *tracking_interval* seconds. A
+    :class:`~midori_ai_hello.tracking.SceneChange` frame difference decides
+    whether a sample needs any inference: while the view is static the
+    tracks carry over untouched. Changed frames get the cheap pass; an
+    :class:`~midori_ai_hello.tracking.IoUTracker` keeps the identity from the
+    last full pass attached to each box, and full identification runs only
+    when a track appears or is lost, or every *reverify_interval* seconds.
+
+    Each camera is guarded by a :class:`~midori_ai_hello.camera_health.CameraHealth`
+    circuit breaker: repeated open or read failures take it out of rotation
+    with exponential back-off, and opens and reads that exceed
+    *camera_timeout* seconds (``0`` disables the limit) count as failures.
+
+    *profiles* maps a camera to the :class:`~midori_ai_hello.camera.CaptureProfile`
+    it is opened with (see :meth:`Config.capture_profile`).
+
+    Cameras are opened through a :class:`~midori_ai_hello.camera_broker.CameraBroker`;
+    passing the one the capture screen uses lets both read a device at once.
+
+    *cameras* accepts any :func:`~midori_ai_hello.camera.open_camera` spec,
+    so ``synthetic:`` or ``file:`` sources can stand in for webcams.
+    """
 
     def __init__(
         self,
@@ -35,30 +106,189 @@ class CameraPresenceService:
         *,
         present_interval: float = 10.0,
         absent_interval: float = 5.0,
+        locked_interval: float = 0.5,
+        locked_imgsz: int = 320,
         device: str = "cpu",
+        smoother: PresenceSmoother | None = None,
+        class_thresholds: dict[str, float] | None = None,
+        idle_time: IdleTime | None = None,
+        activity_window: float = 0.0,
+        prefilter: str = "none",
+        prefilter_model: str | None = None,
+        tracking: bool = False,
+        tracking_interval: float = 1.0,
+        reverify_interval: float = 30.0,
+        camera_timeout: float = 5.0,
+        health: CameraHealth | None = None,
+        profiles: Mapping[str, CaptureProfile] | None = None,
+        broker: CameraBroker | None = None,
     ) -> None:
         self._cameras = cameras
         self._model_path = str(model_path)
         self._whitelist = whitelist
         self._listeners: list[Listener] = []
+        self._confidence_listeners: list[ConfidenceListener] = []
+        self._smoother = smoother or PresenceSmoother()
+        self._class_thresholds = dict(class_thresholds or {})
+        self._idle_time = idle_time
+        self._activity_window = activity_window
+        self._prefilter_spec = (prefilter, prefilter_model)
+        self._prefilter = build_prefilter(prefilter, prefilter_model)
+        self._tracking = tracking
+        self._tracking_interval = tracking_interval
+        self._reverify_interval = reverify_interval
+        self._trackers: dict[str, IoUTracker] = {}
+        self._scenes: dict[str, SceneChange] = {}
+        self._camera_timeout = camera_timeout
+        self._health = health or CameraHealth()
+        self._workers: dict[str, CameraWorker] = {}
+        self._profiles = dict(profiles or {})
+        self._reopen_cameras = False
+        self._broker = broker or CameraBroker()
+        self._reset_tracks = False
+        self._authorised_names: frozenset[str] = frozenset()
+        self._whitelist_version: object = None
+        self._class_table: ClassLookup | None = None
+        self._confidence = 0.0
         self._task: asyncio.Task[None] | None = None
         self._present = False
         self._present_interval = present_interval
         self._absent_interval = absent_interval
+        self._locked_interval = locked_interval
+        self._locked_imgsz = locked_imgsz
+        self._locked = False
+        self._wake = asyncio.Event()
+        self._warm: dict[str, FrameSource] = {}
+        self._last_frame_at: dict[str, float] = {}
+        self._scan_latency = Histogram()
+        self._inference_latency = Histogram()
         self._device = device
+        self._reload_model = False
         log.debug(
             "Initialised presence service with cameras %s using model %s",
             cameras,
             model_path,
         )
 
+    @property
+    def present(self) -> bool:
+        return self._present
+
+    @property
+    def confidence(self) -> float:
+        """Smoothed confidence behind the current presence decision."""
+
+        return self._confidence
+
+    def scan_now(self) -> None:
+        """Run the next scan immediately instead of waiting for the interval."""
+
+        self._wake.set()
+
+    def stats(self) -> dict[str, object]:
+        """Return presence state and timing statistics for monitoring."""
+
+        now = time.monotonic()
+        return {
+            "present": self._present,
+            "confidence": self._confidence,
+            "locked_mode": self._locked,
+            "cameras": {
+                cam: {
+                    "last_frame_age": (
+                        now - self._last_frame_at[cam]
+                        if cam in self._last_frame_at
+                        else None
+                    ),
+                    "health": self._health.snapshot(cam),
+                }
+                for cam in self._cameras
+            },
+            "scan_latency": self._scan_latency.snapshot(),
+            "inference_latency": self._inference_latency.snapshot(),
+        }
+
     def add_listener(self, callback: Listener) -> None:
         """Register *callback* for presence changes."""
 
         self._listeners.append(callback)
+        self._start()
+
+    def add_confidence_listener(self, callback: ConfidenceListener) -> None:
+        """Register *callback* for presence changes with their confidence."""
+
+        self._confidence_listeners.append(callback)
+        self._start()
+
+    def _start(self) -> None:
         if self._task is None:
             self._task = asyncio.create_task(self._poll_loop())
 
+    def set_locked(self, locked: bool) -> None:
+        """Enter or leave locked mode and trigger an immediate scan."""
+
+        if locked == self._locked:
+            return
+        log.debug("Presence service %s locked mode", "entering" if locked else "leaving")
+        self._locked = locked
+        # Identities verified before the lock are not carried across it.
+        self._reset_tracks = True
+        self._wake.set()
+
+    def apply_config(self, config: Config) -> None:
+        """Pick up camera, device and model changes from *config*.
+
+        Intended as a :class:`~midori_ai_hello.config.ConfigStore` subscriber;
+        camera changes apply on the next scan and model or device changes
+        reload the model before it.
+        """
+
+        cameras = list(config.cameras)
+        if cameras != self._cameras:
+            log.info("Presence cameras changed to %s", cameras)
+            for cam in set(self._cameras) - set(cameras):
+                self._health.forget(cam)
+                self._close_worker(cam)
+            self._cameras = cameras
+            self._wake.set()
+        if config.device != self._device or config.model != self._model_path:
+            log.info(
+                "Presence model changed to %s on %s", config.model, config.device
+            )
+            if str(config.model) != self._model_path:
+                self._rebind_whitelist(Path(config.model))
+            self._device = config.device
+            self._model_path = str(config.model)
+            self._reload_model = True
+        smoother = PresenceSmoother.from_config(config)
+        if smoother.settings() != self._smoother.settings():
+            log.info("Presence smoothing changed to %s", smoother.settings())
+            smoother.present = self._present
+            self._smoother = smoother
+        self._class_thresholds = dict(config.class_thresholds)
+        self._activity_window = config.activity_window
+        prefilter_spec = (config.prefilter, config.prefilter_model)
+        if prefilter_spec != self._prefilter_spec:
+            log.info("Presence pre-filter changed to %s", config.prefilter)
+            self._prefilter_spec = prefilter_spec
+            self._prefilter = build_prefilter(*prefilter_spec)
+        if config.presence_tracking != self._tracking:
+            log.info(
+                "Presence tracking %s",
+                "enabled" if config.presence_tracking else "disabled",
+            )
+            self._tracking = config.presence_tracking
+            self._reset_tracks = True
+        self._reverify_interval = config.presence_reverify_interval
+        self._camera_timeout = config.camera_timeout
+        governor.configure(config)
+        profiles = {cam: config.capture_profile(cam, "presence") for cam in cameras}
+        if profiles != self._profiles:
+            log.info("Presence capture profiles changed to %s", profiles)
+            self._profiles = profiles
+            # Warm cameras still run the old mode; reopen them.
+            self._reopen_cameras = True
+
     async def stop(self) -> None:
         """Stop background polling."""
 
@@ -69,57 +299,417 @@ class CameraPresenceService:
             except asyncio.CancelledError:  # pragma: no cover - normal shutdown
                 pass
             self._task = None
+        await asyncio.to_thread(self._release_cameras)
+        for cam in list(self._workers):
+            self._close_worker(cam)
 
     async def _poll_loop(self) -> None:
         """Periodically scan cameras for authorised users."""
 
         if YOLO is None:  # pragma: no cover - dependency missing
             return
-        log.debug("Loading YOLO model from %s on %s", self._model_path, self._device)
-        model = YOLO(self._model_path).to(self._device)
+        # Without cameras the service idles (never reporting absence) until
+        # apply_config brings some in.
+        while not self._cameras:
+            await self._sleep(self._absent_interval)
+        model = await asyncio.to_thread(self._load_model)
         log.debug("Starting presence polling loop")
         try:
             while True:
-                present = await asyncio.to_thread(self._scan_once, model)
+                if self._reload_model:
+                    model = await asyncio.to_thread(self._load_model)
+                if not self._cameras:
+                    await self._sleep(self._absent_interval)
+                    continue
+                if self._reopen_cameras:
+                    self._reopen_cameras = False
+                    await asyncio.to_thread(self._release_cameras)
+                locked = self._locked
+                if not locked and await self._recently_active():
+                    metrics.inc("midori_scans_skipped_total", reason="activity")
+                    present, self._confidence = self._smoother.force(True, 1.0)
+                    if present != self._present:
+                        self._present = present
+                        await self._emit(present, self._confidence)
+                    await self._sleep(self._present_interval)
+                    continue
+                tracking = self._tracking and not locked
+                started = time.perf_counter()
+                if locked:
+                    mode = "locked"
+                    score = await asyncio.to_thread(self._governed, self._scan_locked, model)
+                elif tracking:
+                    mode = "tracked"
+                    score = await asyncio.to_thread(self._governed, self._scan_tracked, model)
+                else:
+                    mode = "normal"
+                    if self._warm:
+                        await asyncio.to_thread(self._release_cameras)
+                    score = await asyncio.to_thread(self._governed, self._scan_once, model)
+                elapsed = time.perf_counter() - started
+                self._scan_latency.observe(elapsed)
+                metrics.inc("midori_scans_total", mode=mode)
+                present, self._confidence = self._smoother.update(float(score))
                 if present != self._present:
                     self._present = present
-                    for cb in list(self._listeners):
-                        result = cb(present)
-                        if asyncio.iscoroutine(result):
-                            await result
-                await asyncio.sleep(
-                    self._present_interval if present else self._absent_interval
-                )
+                    await self._emit(present, self._confidence)
+                if tracking:
+                    interval = self._tracking_interval
+                elif present:
+                    interval = self._present_interval
+                elif locked:
+                    interval = self._locked_interval
+                else:
+                    interval = self._absent_interval
+                await self._sleep(interval)
         except asyncio.CancelledError:  # pragma: no cover - normal shutdown
             pass
 
-    def _scan_once(self, model: YOLO) -> bool:  # pragma: no cover - I/O heavy
-        """Return ``True`` if an authorised user is detected."""
+    def _governed(self, scan: Callable[[YOLO], float], model: YOLO) -> float:
+        """Run *scan* on a worker thread pinned to the inference CPUs."""
+
+        governor.pin_inference()
+        return scan(model)
 
-        if cv2 is None:
-            log.warning("OpenCV not available; skipping camera scan")
+    async def _recently_active(self) -> bool:
+        """Return ``True`` if the session saw input within the activity window."""
+
+        if self._idle_time is None or self._activity_window <= 0:
+            return False
+        try:
+            idle = await self._idle_time()
+        except Exception:
+            log.debug("Session idle time unavailable; scanning cameras", exc_info=True)
             return False
-        authorised = set(self._whitelist.users())
+        return idle < self._activity_window
+
+    async def _emit(self, present: bool, confidence: float) -> None:
+        log.debug("Presence %s (confidence %.2f)", present, confidence)
+        for cb in list(self._listeners):
+            result = cb(present)
+            if asyncio.iscoroutine(result):
+                await result
+        for cb in list(self._confidence_listeners):
+            result = cb(present, confidence)
+            if asyncio.iscoroutine(result):
+                await result
+
+    async def _sleep(self, interval: float) -> None:
+        """Sleep for *interval* seconds or until :meth:`set_locked` wakes us."""
+
+        try:
+            await asyncio.wait_for(self._wake.wait(), interval)
+        except asyncio.TimeoutError:
+            pass
+        self._wake.clear()
+
+    def _load_model(self) -> YOLO:
+        self._reload_model = False
+        log.debug("Loading YOLO model from %s on %s", self._model_path, self._device)
+        # Warm both input sizes so neither the first locked nor the first
+        # full-size pass pays for allocator warm-up.
+        return load_model(
+            YOLO,
+            self._model_path,
+            self._device,
+            warmup_sizes=(self._locked_imgsz, None),
+        )
+
+    def _scan_once(self, model: YOLO) -> float:  # pragma: no cover - I/O heavy
+        """Return the best authorised-detection confidence across cameras."""
+
+        authorised = self._authorised()
+        best = 0.0
+        for cam in self._cameras:
+            frame = self._read_frame(cam)
+            if frame is None or not self._has_candidate(frame, cam):
+                continue
+            best = max(best, self._detect(model, frame, cam, authorised))
+            if best >= self._smoother.enter_threshold:
+                return best
+        if not best:
+            log.debug("No authorised users detected on any camera")
+        return best
+
+    def _scan_locked(self, model: YOLO) -> float:
+        """Cheap scan on warm cameras, confirmed at full size when it fires."""
+
+        authorised = self._authorised()
+        best = 0.0
+        for cam in self._cameras:
+            frame = self._read_frame(cam, keep_open=True)
+            if frame is None or not self._has_candidate(frame, cam):
+                continue
+            if not self._detect(
+                model, frame, cam, authorised, imgsz=self._locked_imgsz
+            ):
+                continue
+            log.debug("Fast pass fired on camera %s; confirming", cam)
+            best = max(best, self._detect(model, frame, cam, authorised))
+            if best >= self._smoother.enter_threshold:
+                return best
+        return best
+
+    def _scan_tracked(self, model: YOLO) -> float:
+        """Follow tracks, running inference only when the scene changes.
+
+        Static frames cost a frame difference; changed frames get the cheap
+        pass, and full identification runs only when the tracks change.
+        """
+
+        if self._reset_tracks:
+            self._reset_tracks = False
+            self._trackers.clear()
+            self._scenes.clear()
+        for cam in set(self._trackers) - set(self._cameras):
+            del self._trackers[cam]
+            self._scenes.pop(cam, None)
+        authorised = self._authorised()
+        now = time.monotonic()
+        best = 0.0
         for cam in self._cameras:
-            log.debug("Scanning camera %s", cam)
-            cap = cv2.VideoCapture(cam)
-            if not cap.isOpened():
-                log.warning("Camera %s could not be opened", cam)
+            tracker = self._trackers.get(cam)
+            if tracker is None:
+                tracker = self._trackers[cam] = IoUTracker()
+                self._scenes[cam] = SceneChange()
+            tracker.reverify_interval = self._reverify_interval
+            scene = self._scenes[cam]
+            frame = self._read_frame(cam, keep_open=True)
+            if frame is None:
+                tracker.clear()
+                scene.reset()
                 continue
-            ret, frame = cap.read()
+            if not scene(frame) and not tracker.due(now):
+                # Nothing moved: the tracks and their identities still hold.
+                metrics.inc("midori_track_static_frames_total", camera=cam)
+                best = max(best, tracker.confidence())
+                continue
+            if self._has_candidate(frame, cam):
+                boxes, _, _ = self._identify(
+                    model, frame, cam, authorised, imgsz=self._locked_imgsz
+                )
+            else:
+                boxes = np.empty((0, 4))
+            changed = tracker.update(boxes, now)
+            if changed and any(not t.misses for t in tracker.tracks):
+                log.debug("Tracks changed on camera %s; identifying", cam)
+                metrics.inc("midori_track_verifications_total", camera=cam)
+                tracker.verify(*self._identify(model, frame, cam, authorised), now)
+            best = max(best, tracker.confidence())
+        return best
+
+    def _read_frame(self, cam: str, *, keep_open: bool = False):
+        """Return one frame from *cam*, or ``None`` if it is unavailable.
+
+        Cameras whose breaker is open are skipped without touching the
+        device. Open and read are bounded by the camera timeout; a device
+        that hangs is abandoned to its worker thread and counted as failed,
+        as is one whose open or read raises.
+        """
+
+        if not self._health.allow(cam):
+            return None
+        cap = self._warm.pop(cam, None)
+        try:
+            if cap is None:
+                log.debug("Scanning camera %s", cam)
+                with metrics.timer("midori_camera_open_seconds", camera=cam):
+                    cap = self._camera_call(
+                        cam, self._broker.acquire, cam, self._profiles.get(cam)
+                    )
+                if not cap.isOpened():
+                    cap.release()
+                    self._camera_failed(cam, "open")
+                    return None
+            with metrics.timer("midori_camera_read_seconds", camera=cam):
+                ret, frame = self._camera_call(cam, cap.read)
+        except CameraTimeout:
+            self._broker.discard(cam)
+            self._camera_failed(cam, "timeout")
+            return None
+        except Exception:
+            # e.g. cv2.error from an unplugged device: a failure, not a crash.
+            log.debug("Camera %s raised", cam, exc_info=True)
+            if cap is not None:
+                try:
+                    cap.release()
+                except Exception:
+                    log.debug("Releasing camera %s failed", cam, exc_info=True)
+            self._camera_failed(cam, "error")
+            return None
+        if keep_open and ret:
+            self._warm[cam] = cap
+        else:
+            cap.release()
+        if not ret:
+            self._camera_failed(cam, "read")
+            return None
+        self._health.record_success(cam)
+        self._last_frame_at[cam] = time.monotonic()
+        return frame
+
+    def _camera_call(self, cam: str, fn, *args):
+        """Run a blocking call on *cam*'s worker thread within the timeout."""
+
+        worker = self._workers.get(cam)
+        if worker is None:
+            worker = self._workers[cam] = CameraWorker(f"camera-{cam}")
+        try:
+            return worker.call(fn, *args, timeout=self._camera_timeout)
+        except CameraTimeout:
+            # The worker stays stuck in the call; the next one gets a new one.
+            self._close_worker(cam)
+            raise
+
+    def _close_worker(self, cam: str) -> None:
+        worker = self._workers.pop(cam, None)
+        if worker is not None:
+            worker.close()
+
+    def _camera_failed(self, cam: str, stage: str) -> None:
+        metrics.inc("midori_camera_failures_total", camera=cam, stage=stage)
+        self._health.record_failure(cam, stage)
+
+    def _has_candidate(self, frame, cam: str) -> bool:
+        """Return ``False`` if the pre-filter sees nobody in *frame*."""
+
+        if self._prefilter is None:
+            return True
+        with metrics.timer("midori_prefilter_seconds"):
+            found = self._prefilter(frame)
+        if not found:
+            metrics.inc("midori_prefilter_rejects_total", camera=cam)
+            log.debug("Pre-filter found nobody on camera %s", cam)
+        return found
+
+    def _release_cameras(self) -> None:
+        while self._warm:
+            _, cap = self._warm.popitem()
             cap.release()
-            if not ret:
-                log.warning("Failed to read from camera %s", cam)
+
+    def _detect(
+        self,
+        model: YOLO,
+        frame,
+        cam: str,
+        authorised: set[str],
+        *,
+        imgsz: int | None = None,
+    ) -> float:
+        """Return the best authorised confidence in *frame* (``0.0`` if none)."""
+
+        _, scores, labels = self._identify(model, frame, cam, authorised, imgsz=imgsz)
+        if not scores.size:
+            return 0.0
+        top = int(scores.argmax())
+        log.info("Authorised user %s detected on camera %s", labels[top], cam)
+        return float(scores[top])
+
+    def _identify(
+        self,
+        model: YOLO,
+        frame,
+        cam: str,
+        authorised: set[str],
+        *,
+        imgsz: int | None = None,
+    ) -> tuple[np.ndarray, np.ndarray, list[str]]:
+        """Return boxes, confidences and names of authorised detections."""
+
+        empty = (np.empty((0, 4)), np.empty(0), [])
+        kwargs: dict[str, object] = {}
+        if imgsz is not None:
+            kwargs["imgsz"] = imgsz
+        model_names = getattr(model, "names", None)
+        if model_names:
+            table = self._class_lookup(model_names, authorised)
+            if not table.ids:
+                # Nobody on the whitelist maps to a model class.
+                return empty
+            kwargs["classes"] = table.ids
+        started = time.perf_counter()
+        results = model(frame, **kwargs)
+        elapsed = time.perf_counter() - started
+        self._inference_latency.observe(elapsed)
+        metrics.observe(
+            "midori_inference_seconds", elapsed, stage="fast" if imgsz else "full"
+        )
+        found_boxes: list[np.ndarray] = []
+        found_scores: list[np.ndarray] = []
+        labels: list[str] = []
+        for r in results:
+            boxes = getattr(r, "boxes", None)
+            if boxes is None:
+                continue
+            xyxy, cls, conf = box_arrays(boxes)
+            if not cls.size:
+                continue
+            table = self._class_lookup(
+                getattr(r, "names", None) or model_names or {}, authorised
+            )
+            log.debug("%d detections on camera %s", cls.size, cam)
+            # Ids beyond the table land on its trailing unauthorised slot.
+            index = np.minimum(cls, table.allowed.size - 1)
+            keep = table.allowed[index] & (conf >= table.min_conf[index]) & (conf > 0)
+            if not keep.any():
                 continue
-            results = model(frame)
-            for r in results:
-                names = getattr(r, "names", {})
-                boxes = getattr(getattr(r, "boxes", None), "cls", [])
-                for cls in boxes:
-                    name = names.get(int(cls), str(cls))
-                    log.debug("Detected %s on camera %s", name, cam)
-                    if name in authorised:
-                        log.info("Authorised user %s detected on camera %s", name, cam)
-                        return True
-        log.debug("No authorised users detected on any camera")
-        return False
+            found_boxes.append(xyxy[keep])
+            found_scores.append(conf[keep])
+            labels.extend(table.labels[int(c)] for c in cls[keep])
+        if not found_scores:
+            return empty
+        return np.concatenate(found_boxes), np.concatenate(found_scores), labels
+
+    def _rebind_whitelist(self, model_path: Path) -> None:
+        """Point the whitelist at new weights; its key derives from them."""
+
+        whitelist = self._whitelist
+        if isinstance(whitelist, WhitelistManager):
+            self._whitelist = WhitelistManager(model_path, whitelist.config_dir)
+        self._whitelist_version = None
+        self._class_table = None
+
+    def _authorised(self) -> frozenset[str]:
+        """Return whitelisted names, re-read only when the whitelist changes."""
+
+        version = getattr(self._whitelist, "version", None)
+        key = version() if version is not None else None
+        if key is None or key != self._whitelist_version:
+            self._authorised_names = frozenset(self._whitelist.users())
+            self._whitelist_version = key
+        return self._authorised_names
+
+    def _class_lookup(
+        self, names: dict[int, str], authorised: frozenset[str] | set[str]
+    ) -> ClassLookup:
+        """Return the class lookup table for *names* and *authorised*.
+
+        Rebuilt only when the model's ``names``, the whitelist or the class
+        thresholds change.
+        """
+
+        cached = self._class_table
+        if (
+            cached is not None
+            and (cached.names is names or cached.names == names)
+            and cached.authorised == authorised
+            and cached.thresholds == self._class_thresholds
+        ):
+            return cached
+        ids = sorted(int(i) for i, name in names.items() if name in authorised)
+        size = max((int(i) for i in names), default=-1) + 2
+        allowed = np.zeros(size, dtype=bool)
+        min_conf = np.zeros(size, dtype=np.float64)
+        for i in ids:
+            allowed[i] = True
+            min_conf[i] = self._class_thresholds.get(names[i], 0.0)
+        self._class_table = ClassLookup(
+            names=names,
+            authorised=frozenset(authorised),
+            thresholds=dict(self._class_thresholds),
+            ids=ids,
+            allowed=allowed,
+            min_conf=min_conf,
+            labels={i: names[i] for i in ids},
+        )
+        return self._class_table
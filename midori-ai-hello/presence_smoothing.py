@@ -0,0 +1,96 @@
+"""Temporal smoothing and hysteresis for presence decisions."""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from .config import Config
+
+
+class PresenceSmoother:
+    """Turn per-scan confidence scores into a stable presence decision.
+
+    The last *window* scan scores are kept. While absent, presence is entered
+    once at least *enter_votes* of them reach *enter_threshold*; while
+    present, it is only left once at least *exit_votes* fall below
+    *exit_threshold*. With the defaults a single scan decides, matching the
+    unsmoothed behaviour.
+    """
+
+    def __init__(
+        self,
+        *,
+        window: int = 1,
+        enter_votes: int = 1,
+        exit_votes: int = 1,
+        enter_threshold: float = 0.25,
+        exit_threshold: float = 0.25,
+    ) -> None:
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        if not 1 <= enter_votes <= window or not 1 <= exit_votes <= window:
+            raise ValueError("vote counts must be between 1 and window")
+        if exit_threshold > enter_threshold:
+            raise ValueError("exit_threshold must not exceed enter_threshold")
+        self.window = window
+        self.enter_votes = enter_votes
+        self.exit_votes = exit_votes
+        self.enter_threshold = enter_threshold
+        self.exit_threshold = exit_threshold
+        self._scores: deque[float] = deque(maxlen=window)
+        self.present = False
+
+    @classmethod
+    def from_config(cls, config: "Config") -> "PresenceSmoother":
+        return cls(
+            window=config.presence_window,
+            enter_votes=config.presence_enter_votes,
+            exit_votes=config.presence_exit_votes,
+            enter_threshold=config.presence_enter_threshold,
+            exit_threshold=config.presence_exit_threshold,
+        )
+
+    def settings(self) -> tuple[int, int, int, float, float]:
+        return (
+            self.window,
+            self.enter_votes,
+            self.exit_votes,
+            self.enter_threshold,
+            self.exit_threshold,
+        )
+
+    @property
+    def confidence(self) -> float:
+        """Mean score over the current window."""
+
+        if not self._scores:
+            return 0.0
+        return sum(self._scores) / len(self._scores)
+
+    def update(self, score: float) -> tuple[bool, float]:
+        """Record one scan *score* and return ``(present, confidence)``."""
+
+        self._scores.append(float(score))
+        if self.present:
+            misses = sum(1 for s in self._scores if s < self.exit_threshold)
+            if misses >= self.exit_votes:
+                self.present = False
+                self._scores.clear()
+                self._scores.append(float(score))
+        else:
+            hits = sum(1 for s in self._scores if s >= self.enter_threshold)
+            if hits >= self.enter_votes:
+                self.present = True
+                self._scores.clear()
+                self._scores.append(float(score))
+        return self.present, self.confidence
+
+    def force(self, present: bool, score: float) -> tuple[bool, float]:
+        """Adopt *present* from an authoritative source, restarting the window."""
+
+        self.present = present
+        self._scores.clear()
+        self._scores.append(float(score))
+        return self.present, self.confidence
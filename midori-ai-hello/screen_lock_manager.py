@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from typing import Awaitable, Callable, Protocol, Tuple
 
 from .kde_lock import KDEScreenLocker
@@ -24,9 +25,18 @@ class NullPresenceService:
     def add_listener(self, callback: Callable[[bool], Awaitable[None] | None]) -> None:
         return None
 
+    def set_locked(self, locked: bool) -> None:
+        return None
+
 
 class ScreenLockManager:
-    """Subscribe to presence events and control the KDE screen locker."""
+    """Subscribe to presence events and control the KDE screen locker.
+
+    Absence arms a single ``loop.call_at`` deadline rather than a ticking
+    countdown. ``notify`` receives ``("deadline", timestamp)`` with the wall
+    clock time the screen will lock, and ``("deadline", None)`` once the
+    deadline is cancelled or reached; the UI derives remaining time itself.
+    """
 
     def __init__(
         self,
@@ -40,6 +50,7 @@ class ScreenLockManager:
         self._presence = presence
         self._absent_timeout = absent_timeout
         self._notify = notify or (lambda event: None)
+        self._lock_handle: asyncio.TimerHandle | None = None
         self._lock_task: asyncio.Task[None] | None = None
         self._locked = False
 
@@ -55,41 +66,53 @@ class ScreenLockManager:
         log.info("Presence %s", "detected" if present else "lost")
         self._notify(("presence", present))
         if present:
+            self._cancel_deadline()
             if self._lock_task:
                 self._lock_task.cancel()
                 self._lock_task = None
-            self._notify(("countdown", None))
             if self._locked:
-                asyncio.create_task(self._locker.set_active(False))
+                asyncio.create_task(self._locker.set_active(False, reply=False))
         else:
-            if self._lock_task:
-                self._lock_task.cancel()
-            self._lock_task = asyncio.create_task(self._lock_after_delay())
-
-    async def _lock_after_delay(self) -> None:
-        start = asyncio.get_running_loop().time()
-        target = start + self._absent_timeout
+            self._arm_deadline()
+
+    def _arm_deadline(self) -> None:
+        if self._lock_handle:
+            self._lock_handle.cancel()
+        loop = asyncio.get_running_loop()
+        self._lock_handle = loop.call_at(
+            loop.time() + self._absent_timeout, self._on_deadline
+        )
+        log.debug("Absent for %s seconds, will lock screen", self._absent_timeout)
+        self._notify(("deadline", time.time() + self._absent_timeout))
+
+    def _cancel_deadline(self) -> None:
+        if self._lock_handle is None:
+            return
+        self._lock_handle.cancel()
+        self._lock_handle = None
+        log.debug("Lock deadline cancelled")
+        self._notify(("deadline", None))
+
+    def _on_deadline(self) -> None:
+        self._lock_handle = None
+        self._notify(("deadline", None))
+        self._lock_task = asyncio.create_task(self._lock())
+
+    async def _lock(self) -> None:
         try:
-            log.debug(
-                "Absent for %s seconds, will lock screen", self._absent_timeout
-            )
-            while True:
-                now = asyncio.get_running_loop().time()
-                remaining = max(0.0, target - now)
-                if remaining <= 0:
-                    break
-                self._notify(("countdown", remaining))
-                await asyncio.sleep(min(1.0, remaining))
             await self._locker.lock()
             log.info("Screen locked due to absence")
         except asyncio.CancelledError:
-            log.debug("Lock delayed cancelled")
+            log.debug("Lock cancelled")
         finally:
-            self._notify(("countdown", None))
             self._lock_task = None
 
     async def _on_active_changed(self, active: bool) -> None:
         self._locked = active
         state = "Locked" if active else "Unlocked"
         log.info("Screen %s", state.lower())
+        # Presence services may offer a faster scan mode while locked.
+        set_locked = getattr(self._presence, "set_locked", None)
+        if set_locked is not None:
+            set_locked(active)
         self._notify(("lock", active))
@@ -0,0 +1,85 @@
+"""Status model rendered in the application footer."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+
+@dataclass
+class StatusModel:
+    """State shown in the footer status bar.
+
+    Producers update fields directly; :meth:`format` renders them, computing
+    the lock countdown from the absolute deadline at render time.
+    """
+
+    message: str = ""
+    locked: bool = False
+    present: bool | None = None
+    last_capture_at: datetime | None = None
+    last_detected: bool | None = None
+    lock_deadline: datetime | None = None
+
+    def apply(self, event: tuple[str, Any]) -> bool:
+        """Update from a :class:`ScreenLockManager` event.
+
+        Returns ``False`` for event kinds the model does not track.
+        """
+        kind, payload = event
+        if kind == "presence":
+            self.present = bool(payload)
+            if self.present:
+                self.lock_deadline = None
+        elif kind == "deadline":
+            if payload is None:
+                self.lock_deadline = None
+            else:
+                self.lock_deadline = datetime.fromtimestamp(float(payload))
+        elif kind == "lock":
+            self.locked = bool(payload)
+        else:
+            return False
+        return True
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return a JSON-friendly view of the model."""
+        return {
+            "message": self.message,
+            "locked": self.locked,
+            "present": self.present,
+            "last_capture_at": (
+                self.last_capture_at.timestamp() if self.last_capture_at else None
+            ),
+            "last_detected": self.last_detected,
+            "lock_deadline": (
+                self.lock_deadline.timestamp() if self.lock_deadline else None
+            ),
+        }
+
+    def format(self, now: datetime) -> str:
+        parts: list[str] = []
+        if self.message:
+            parts.append(self.message)
+        lock_state = "Locked" if self.locked else "Unlocked"
+        parts.append(f"Lock: {lock_state}")
+        if self.present is not None:
+            presence = "Present" if self.present else "Away"
+            parts.append(f"Presence: {presence}")
+        if self.last_capture_at is not None:
+            timestamp = self.last_capture_at.strftime("%H:%M:%S")
+            detected_label = ""
+            if self.last_detected is True:
+                detected_label = "auto"
+            elif self.last_detected is False:
+                detected_label = "manual"
+            capture_segment = f"Last capture: {timestamp}"
+            if detected_label:
+                capture_segment += f" ({detected_label})"
+            parts.append(capture_segment)
+        if self.lock_deadline is not None:
+            remaining = max(0, int((self.lock_deadline - now).total_seconds()))
+            if remaining > 0:
+                parts.append(f"Lock in {remaining}s")
+        return " | ".join(parts)
@@ -0,0 +1,192 @@
+"""Lightweight IoU tracker used by the presence service's tracking mode."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from itertools import count
+
+import numpy as np
+
+
+@dataclass
+class Track:
+    """A box followed across consecutive frames from one camera."""
+
+    id: int
+    box: np.ndarray
+    label: str | None = None
+    confidence: float = 0.0
+    verified_at: float | None = None
+    misses: int = 0
+
+
+def iou_matrix(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Return pairwise IoU of ``x1, y1, x2, y2`` boxes *a* (N) and *b* (M)."""
+
+    if not len(a) or not len(b):
+        return np.zeros((len(a), len(b)))
+    a = np.asarray(a, dtype=np.float64)[:, None, :]
+    b = np.asarray(b, dtype=np.float64)[None, :, :]
+    w = np.minimum(a[..., 2], b[..., 2]) - np.maximum(a[..., 0], b[..., 0])
+    h = np.minimum(a[..., 3], b[..., 3]) - np.maximum(a[..., 1], b[..., 1])
+    inter = np.clip(w, 0, None) * np.clip(h, 0, None)
+    area_a = (a[..., 2] - a[..., 0]) * (a[..., 3] - a[..., 1])
+    area_b = (b[..., 2] - b[..., 0]) * (b[..., 3] - b[..., 1])
+    union = area_a + area_b - inter
+    return np.divide(inter, union, out=np.zeros_like(inter), where=union > 0)
+
+
+def _greedy_match(iou: np.ndarray, threshold: float) -> list[tuple[int, int]]:
+    """Pair rows and columns by descending IoU above *threshold*."""
+
+    pairs: list[tuple[int, int]] = []
+    if not iou.size:
+        return pairs
+    used_rows: set[int] = set()
+    used_cols: set[int] = set()
+    for flat in np.argsort(iou, axis=None)[::-1]:
+        row, col = divmod(int(flat), iou.shape[1])
+        if iou[row, col] < threshold:
+            break
+        if row in used_rows or col in used_cols:
+            continue
+        used_rows.add(row)
+        used_cols.add(col)
+        pairs.append((row, col))
+    return pairs
+
+
+class IoUTracker:
+    """Associate boxes between frames by overlap.
+
+    Tracks that go unmatched for more than *max_misses* updates are dropped.
+    :meth:`update` reports whether identities need re-verification: a track
+    appeared, a track was lost, or a track was last verified more than
+    *reverify_interval* seconds ago.
+    """
+
+    def __init__(
+        self,
+        *,
+        iou_threshold: float = 0.3,
+        max_misses: int = 2,
+        reverify_interval: float = 30.0,
+    ) -> None:
+        self.iou_threshold = iou_threshold
+        self.max_misses = max_misses
+        self.reverify_interval = reverify_interval
+        self.tracks: list[Track] = []
+        self._ids = count(1)
+
+    def update(self, boxes: np.ndarray, now: float) -> bool:
+        """Advance the tracks with this frame's *boxes*."""
+
+        boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+        current = np.array([t.box for t in self.tracks]).reshape(-1, 4)
+        pairs = _greedy_match(iou_matrix(current, boxes), self.iou_threshold)
+        matched_tracks = {row for row, _ in pairs}
+        matched_boxes = {col for _, col in pairs}
+        for row, col in pairs:
+            track = self.tracks[row]
+            track.box = boxes[col]
+            track.misses = 0
+        lost = False
+        kept: list[Track] = []
+        for index, track in enumerate(self.tracks):
+            if index not in matched_tracks:
+                track.misses += 1
+                if track.misses > self.max_misses:
+                    lost = True
+                    continue
+            kept.append(track)
+        new = [
+            Track(id=next(self._ids), box=boxes[i])
+            for i in range(len(boxes))
+            if i not in matched_boxes
+        ]
+        self.tracks = kept + new
+        return bool(new) or lost or self.due(now)
+
+    def due(self, now: float) -> bool:
+        """Return ``True`` if a track is unverified or its identity is stale."""
+
+        return any(
+            t.verified_at is None or now - t.verified_at >= self.reverify_interval
+            for t in self.tracks
+        )
+
+    def verify(
+        self,
+        boxes: np.ndarray,
+        scores: np.ndarray,
+        labels: list[str | None],
+        now: float,
+    ) -> None:
+        """Attach identities from a full identification pass to the tracks."""
+
+        boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+        current = np.array([t.box for t in self.tracks]).reshape(-1, 4)
+        matches = dict(_greedy_match(iou_matrix(current, boxes), self.iou_threshold))
+        for index, track in enumerate(self.tracks):
+            if track.misses:
+                continue
+            col = matches.get(index)
+            track.verified_at = now
+            if col is None:
+                track.label = None
+                track.confidence = 0.0
+            else:
+                track.label = labels[col]
+                track.confidence = float(scores[col])
+
+    def confidence(self) -> float:
+        """Best identity confidence among tracks seen in the latest frame."""
+
+        return max((t.confidence for t in self.tracks if not t.misses), default=0.0)
+
+    def clear(self) -> None:
+        self.tracks.clear()
+
+
+class SceneChange:
+    """Tell whether a camera's view changed enough to need new boxes.
+
+    Frames are reduced to a coarse greyscale thumbnail (strided sampling, no
+    resize) and compared with the thumbnail of the last frame that changed.
+    A mean absolute difference above *threshold* (0–255 scale) counts as a
+    change; sensor noise and small movements stay below it. This costs a
+    few microseconds per frame, so static scenes need no inference at all.
+    """
+
+    def __init__(
+        self, *, threshold: float = 6.0, grid: tuple[int, int] = (32, 24)
+    ) -> None:
+        self.threshold = threshold
+        self.grid = grid
+        self._reference: np.ndarray | None = None
+
+    def thumbnail(self, frame: np.ndarray) -> np.ndarray:
+        height, width = frame.shape[:2]
+        step_x = max(1, width // self.grid[0])
+        step_y = max(1, height // self.grid[1])
+        small = np.asarray(frame[::step_y, ::step_x], dtype=np.float32)
+        return small.mean(axis=2) if small.ndim == 3 else small
+
+    def __call__(self, frame: object) -> bool:
+        """Return ``True`` if *frame* differs from the reference frame."""
+
+        if not isinstance(frame, np.ndarray) or frame.ndim < 2:
+            return True
+        thumb = self.thumbnail(frame)
+        reference = self._reference
+        if (
+            reference is not None
+            and reference.shape == thumb.shape
+            and float(np.abs(thumb - reference).mean()) <= self.threshold
+        ):
+            return False
+        self._reference = thumb
+        return True
+
+    def reset(self) -> None:
+        self._reference = None
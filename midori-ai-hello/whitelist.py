@@ -20,10 +20,11 @@ import json
 import logging
 import uuid
 from pathlib import Path
-from typing import List
+from typing import List, Tuple
 
 from cryptography.fernet import Fernet
 
+from .metrics import metrics
 
 log = logging.getLogger(__name__)
 
@@ -38,6 +39,7 @@ class WhitelistManager:
         self.whitelist_file = self.config_dir / "whitelist.json"
         self.hash_file = self.config_dir / "whitelist.hash"
         self.uuid_file = self.config_dir / "hellouuid.txt"
+        self._cache: Tuple[tuple, List[str]] | None = None
         log.debug("WhitelistManager initialised at %s", self.config_dir)
 
     # ------------------------------------------------------------------
@@ -79,8 +81,13 @@ class WhitelistManager:
         token = self._fernet().encrypt(json.dumps(profiles).encode("utf-8"))
         self.whitelist_file.write_bytes(token)
         self.hash_file.write_text(self._model_hash())
+        self._cache = None
 
     def _read(self) -> List[str]:
+        with metrics.timer("midori_whitelist_read_seconds"):
+            return self._decrypt()
+
+    def _decrypt(self) -> List[str]:
         if not self.whitelist_file.exists():
             return []
         token = self.whitelist_file.read_bytes()
@@ -115,7 +122,28 @@ class WhitelistManager:
             log.info("Removed user %s from whitelist", name)
 
     def users(self) -> List[str]:
-        return self._read()
+        """Return the authorised profiles.
+
+        Decryption hashes the whole model file, so the result is cached until
+        :meth:`version` changes.
+        """
+        version = self.version()
+        if self._cache is None or self._cache[0] != version:
+            self._cache = (version, self._read())
+        return list(self._cache[1])
+
+    def version(self) -> tuple:
+        """Return a signature that changes whenever :meth:`users` may change."""
+        signature = []
+        paths = (self.whitelist_file, self.hash_file, self.uuid_file, self.model_path)
+        for path in paths:
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                signature.append(None)
+            else:
+                signature.append((st.st_mtime_ns, st.st_size, st.st_ino))
+        return tuple(signature)
 
     # ------------------------------------------------------------------
     # Key rotation / model change
@@ -6,12 +6,16 @@ import asyncio
 import hashlib
 import json
 import logging
+import os
+import time
 from pathlib import Path
 from tempfile import NamedTemporaryFile
 from typing import Any
 
-from .config import Config, load_config
+from .config import Config, ConfigStore, get_config_store
+from .governor import governor
 from .kde_lock import KDEScreenLocker
+from .metrics import metrics
 
 
 log = logging.getLogger(__name__)
@@ -20,11 +24,25 @@ log = logging.getLogger(__name__)
 class YOLOTrainingScheduler:
     """Train Ultralytics YOLO models when the session is idle."""
 
-    def __init__(self, locker: KDEScreenLocker, config_path: str | Path) -> None:
+    def __init__(
+        self,
+        locker: KDEScreenLocker,
+        config_path: str | Path,
+        *,
+        store: ConfigStore | None = None,
+    ) -> None:
         self._locker = locker
         self._config_path = Path(config_path)
-        self._config: Config = load_config(self._config_path)
-        log.debug("Training scheduler loaded config from %s", self._config_path)
+        self._store = store or get_config_store(self._config_path)
+        self.training = False
+        self.last_trained_at: float | None = None
+        log.debug("Training scheduler using config from %s", self._config_path)
+
+    @property
+    def _config(self) -> Config:
+        """Current configuration; edits to ``config.yaml`` apply on the next run."""
+
+        return self._store.config
 
     async def maybe_train(self, force: bool = False) -> bool:
         """Run training if idle exceeds the configured threshold or *force*.
@@ -39,11 +57,28 @@ class YOLOTrainingScheduler:
         )
         if force or idle_time >= threshold:
             log.info("Starting training run")
-            await asyncio.to_thread(self._train)
+            self.training = True
+            try:
+                with metrics.timer(
+                    "midori_training_seconds", backend=self._config.backend
+                ):
+                    await asyncio.to_thread(self._governed_train)
+            finally:
+                self.training = False
+            self.last_trained_at = time.time()
             return True
         log.debug("Skipping training; idle time below threshold")
         return False
 
+    def status(self) -> dict[str, object]:
+        """Return the training state for monitoring."""
+
+        return {
+            "training": self.training,
+            "last_trained_at": self.last_trained_at,
+            "epochs": self._config.epochs,
+        }
+
     def _dataset_yaml(self) -> Path:
         dataset_root = Path(self._config.dataset)
         yaml_content = (
@@ -70,6 +105,13 @@ class YOLOTrainingScheduler:
         data["last_trained_epoch"] = epoch
         meta_path.write_text(json.dumps(data))
 
+    def _governed_train(self) -> None:
+        """Run :meth:`_train` pinned to the training CPUs, if configured."""
+
+        governor.configure(self._config)
+        with governor.training():
+            self._train()
+
     def _train(self) -> None:
         dataset_yaml = self._dataset_yaml()
         epochs = int(self._config.epochs)
@@ -83,6 +125,9 @@ class YOLOTrainingScheduler:
             epochs,
             batch,
         )
+        # Only a configured governor sizes the data loader and OpenMP pools;
+        # otherwise the trainer keeps its own defaults.
+        governed = governor.enabled
         if backend == "yolov9":
             import subprocess
 
@@ -98,21 +143,39 @@ class YOLOTrainingScheduler:
                 "--batch",
                 str(batch),
             ]
+            env = dict(os.environ)
+            if governed:
+                cmd += ["--workers", str(governor.training_threads)]
+                env["OMP_NUM_THREADS"] = str(governor.training_threads)
             cwd = getattr(self._config, "yolov9_path", ".")
-            subprocess.run(cmd, check=False, cwd=cwd)
+            subprocess.run(cmd, check=False, cwd=cwd, env=env)
             log.info("YOLOv9 training subprocess finished")
         else:
             from ultralytics import YOLO  # type: ignore
 
             model = YOLO(model_path)
+            options: dict[str, Any] = {}
+            if governed:
+                options["workers"] = governor.training_threads
             result = model.train(
                 data=str(dataset_yaml),
                 epochs=epochs,
                 batch=batch,
                 device=self._config.device,
+                **options,
             )
             weights = Path(result.save_dir) / "weights" / "last.pt"
             if weights.exists():
                 self._update_profile_hash(weights)
                 self._mark_epoch(epochs)
                 log.info("Updated profile hash and metadata after training")
+
+
+async def training_loop(
+    scheduler: YOLOTrainingScheduler, interval: float = 10.0
+) -> None:
+    """Check every *interval* seconds whether the scheduler should train."""
+
+    while True:
+        await scheduler.maybe_train()
+        await asyncio.sleep(interval)
@@ -155,3 +155,74 @@ def test_capture_returns_to_menu(monkeypatch, tmp_path: Path) -> None:
         assert screen._cap is None
 
     asyncio.run(run())
+
+
+def test_footer_updates_are_coalesced(tmp_path: Path) -> None:
+    cfg = Config(
+        dataset=str(tmp_path / "data"),
+        epochs=1,
+        batch=1,
+        idle_threshold=0,
+        model="yolo.pt",
+    )
+    cfg.save(tmp_path / "config.yaml")
+
+    class DummyLocker:
+        async def add_active_changed_handler(self, handler):
+            self.handler = handler
+
+    app = MidoriApp(
+        tmp_path / "config.yaml", scheduler=DummyScheduler(), locker=DummyLocker()
+    )
+    rendered: list[str] = []
+
+    async def run() -> None:
+        app._status_bar = type(
+            "Bar", (), {"update": lambda self, text: rendered.append(text)}
+        )()
+        app._footer_pending = False
+        for present in (True, False, True, False, True):
+            app._handle_lock_event(("presence", present))
+        await asyncio.sleep(app.FOOTER_INTERVAL * 2)
+        # Re-rendering identical state does not touch the widget.
+        app._refresh_footer()
+        await asyncio.sleep(app.FOOTER_INTERVAL * 2)
+
+    async def main() -> None:
+        async with app.run_test():
+            await run()
+
+    asyncio.run(main())
+    assert rendered == ["Lock: Unlocked | Presence: Present"]
+
+
+def test_quit_removes_control_socket(tmp_path: Path) -> None:
+    cfg = Config(
+        dataset=str(tmp_path / "data"),
+        epochs=1,
+        batch=1,
+        idle_threshold=0,
+        model="yolo.pt",
+    )
+    cfg.save(tmp_path / "config.yaml")
+
+    class DummyLocker:
+        async def add_active_changed_handler(self, handler):
+            self.handler = handler
+
+    sock = tmp_path / "ctl.sock"
+    app = MidoriApp(
+        tmp_path / "config.yaml",
+        scheduler=DummyScheduler(),
+        locker=DummyLocker(),
+        control_socket=sock,
+    )
+
+    async def main() -> None:
+        async with app.run_test() as pilot:
+            while not sock.exists():
+                await asyncio.sleep(0.01)
+            await pilot.press("q")
+
+    asyncio.run(main())
+    assert not sock.exists()
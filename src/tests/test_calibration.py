@@ -0,0 +1,34 @@
+import time
+
+from midori_ai_hello.calibration import calibrate
+
+
+def test_calibrate_picks_largest_size_within_budget() -> None:
+    delays = {"n": 0.0, "s": 0.002, "m": 0.05, "l": 0.1, "x": 0.2}
+    loaded: list[str] = []
+
+    class FakeModel:
+        def __init__(self, path: str) -> None:
+            loaded.append(path)
+            self.delay = delays[path[len("yolo11") : -len(".pt")]]
+
+        def to(self, device: str) -> "FakeModel":
+            return self
+
+        def __call__(self, frame, **kwargs):
+            time.sleep(self.delay)
+            return []
+
+    best, results = calibrate(
+        FakeModel, target_latency=0.02, cpu_budget=1.0, rounds=2, frame_size=(32, 24)
+    )
+    assert best is not None and best.size == "s"
+    assert best.model == "yolo11s.pt"
+    assert [r.fits for r in results] == [True, True, False]
+    # Sizes past the first one over the latency target are never loaded.
+    assert loaded == ["yolo11n.pt", "yolo11s.pt", "yolo11m.pt"]
+
+    best, _ = calibrate(
+        FakeModel, sizes=["m"], target_latency=0.02, rounds=1, frame_size=(32, 24)
+    )
+    assert best is None
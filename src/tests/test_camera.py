@@ -0,0 +1,174 @@
+from pathlib import Path
+
+import numpy as np
+
+from midori_ai_hello import camera
+from midori_ai_hello.camera import (
+    ImageDirCamera,
+    SyntheticCamera,
+    UnavailableCamera,
+    open_camera,
+)
+
+
+def test_synthetic_spec_sets_frame_size() -> None:
+    source = open_camera("synthetic:32x24")
+    assert isinstance(source, SyntheticCamera)
+    ok, frame = source.read()
+    assert ok
+    assert frame.shape == (24, 32, 3)
+    source.release()
+    assert not source.isOpened()
+    assert source.read() == (False, None)
+
+
+def test_synthetic_spec_index_offsets_frames() -> None:
+    first = open_camera("synthetic:16x16#1").read()[1]
+    second = open_camera("synthetic:16x16#2").read()[1]
+    assert first.shape == second.shape == (16, 16, 3)
+    assert not np.array_equal(first, second)
+
+
+def test_invalid_synthetic_spec_is_unavailable() -> None:
+    assert isinstance(open_camera("synthetic:big"), UnavailableCamera)
+
+
+def test_live_camera_without_opencv(monkeypatch) -> None:
+    monkeypatch.setattr(camera, "cv2", None)
+    assert isinstance(open_camera("0"), UnavailableCamera)
+    assert isinstance(open_camera("dir:/tmp"), UnavailableCamera)
+
+
+def test_digit_specs_open_device_index(monkeypatch) -> None:
+    opened: list[object] = []
+
+    class DummyCV2:
+        def VideoCapture(self, spec):  # noqa: N802
+            opened.append(spec)
+            return UnavailableCamera()
+
+    monkeypatch.setattr(camera, "cv2", DummyCV2())
+    open_camera("2")
+    open_camera("/dev/video4")
+    assert opened == [2, "/dev/video4"]
+
+
+def test_image_dir_cycles_and_caches(monkeypatch, tmp_path: Path) -> None:
+    for name in ("b.png", "a.jpg", "notes.txt"):
+        (tmp_path / name).write_bytes(b"")
+    reads: list[str] = []
+
+    class DummyCV2:
+        def imread(self, path):
+            reads.append(Path(path).name)
+            return np.zeros((2, 2, 3), dtype=np.uint8)
+
+    monkeypatch.setattr(camera, "cv2", DummyCV2())
+    source = ImageDirCamera(tmp_path)
+    assert source.isOpened()
+    for _ in range(4):
+        ok, _ = source.read()
+        assert ok
+    assert reads == ["a.jpg", "b.png"]
+
+
+def test_empty_image_dir_is_not_opened(tmp_path: Path) -> None:
+    assert not ImageDirCamera(tmp_path / "missing").isOpened()
+
+
+def test_capture_profile_negotiated_once(monkeypatch) -> None:
+    import cv2
+
+    calls: list[tuple[int, float]] = []
+    # The device only offers 320x240; it reports what it settled on.
+    mode = {
+        cv2.CAP_PROP_FOURCC: float(cv2.VideoWriter_fourcc(*"MJPG")),
+        cv2.CAP_PROP_FRAME_WIDTH: 320.0,
+        cv2.CAP_PROP_FRAME_HEIGHT: 240.0,
+        cv2.CAP_PROP_FPS: 5.0,
+        cv2.CAP_PROP_BUFFERSIZE: 1.0,
+    }
+
+    class Cap:
+        def isOpened(self) -> bool:  # noqa: N802
+            return True
+
+        def set(self, prop, value) -> bool:
+            calls.append((prop, value))
+            return True
+
+        def get(self, prop) -> float:
+            return mode[prop]
+
+        def grab(self) -> bool:
+            return True
+
+    class DummyCV2:
+        CAP_PROP_FOURCC = cv2.CAP_PROP_FOURCC
+        CAP_PROP_FRAME_WIDTH = cv2.CAP_PROP_FRAME_WIDTH
+        CAP_PROP_FRAME_HEIGHT = cv2.CAP_PROP_FRAME_HEIGHT
+        CAP_PROP_FPS = cv2.CAP_PROP_FPS
+        CAP_PROP_BUFFERSIZE = cv2.CAP_PROP_BUFFERSIZE
+        VideoWriter_fourcc = staticmethod(cv2.VideoWriter_fourcc)  # noqa: N815
+
+        def VideoCapture(self, spec):  # noqa: N802
+            return Cap()
+
+    monkeypatch.setattr(camera, "cv2", DummyCV2())
+    monkeypatch.setattr(camera, "_negotiated", {})
+    profile = camera.DEFAULT_PROFILES["presence"]
+    open_camera("3", profile)
+    assert calls[0][0] == cv2.CAP_PROP_FOURCC
+    assert (cv2.CAP_PROP_FRAME_WIDTH, 640) in calls
+    assert camera.negotiated_mode(3, profile) == camera.CaptureProfile(
+        320, 240, 5.0, "MJPG", buffer_size=1
+    )
+    assert (cv2.CAP_PROP_BUFFERSIZE, 1) in calls
+
+    calls.clear()
+    open_camera("3", profile)
+    assert (cv2.CAP_PROP_FRAME_WIDTH, 320) in calls
+
+    calls.clear()
+    open_camera("4", camera.CaptureProfile())
+    assert calls == []
+
+
+def test_live_camera_drains_stale_frames(monkeypatch) -> None:
+    import cv2
+
+    clock = [0.0]
+    monkeypatch.setattr(camera.time, "monotonic", lambda: clock[0])
+    events: list[str] = []
+
+    class Cap:
+        def get(self, prop) -> float:
+            return {cv2.CAP_PROP_BUFFERSIZE: 4.0, cv2.CAP_PROP_FPS: 10.0}[prop]
+
+        def read(self):
+            events.append("read")
+            return True, "first"
+
+        def grab(self) -> bool:
+            events.append("grab")
+            return True
+
+        def retrieve(self):
+            events.append("retrieve")
+            return True, "fresh"
+
+    live = camera.LiveCamera(Cap())
+    assert live.read() == (True, "first")
+
+    # 0.25 s at 10 fps queued two frames: drop one, decode the newest.
+    clock[0] = 0.25
+    events.clear()
+    assert live.read() == (True, "fresh")
+    assert events == ["grab", "grab", "retrieve"]
+
+    # After a long pause draining is capped at the driver buffer size.
+    clock[0] = 60.0
+    events.clear()
+    live.read()
+    assert events == ["grab"] * 4 + ["retrieve"]
+    assert live.drained == 4
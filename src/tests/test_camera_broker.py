@@ -0,0 +1,180 @@
+import numpy as np
+
+from midori_ai_hello import camera_broker
+from midori_ai_hello.camera_broker import CameraBroker
+
+
+class Source:
+    def __init__(self) -> None:
+        self.reads = 0
+        self.released = False
+
+    def isOpened(self) -> bool:  # noqa: N802
+        return not self.released
+
+    def read(self):
+        self.reads += 1
+        return True, np.zeros((2, 2, 3), dtype=np.uint8)
+
+    def release(self) -> None:
+        self.released = True
+
+
+def test_broker_shares_device_and_frames(monkeypatch) -> None:
+    opened: list[object] = []
+
+    def fake_open(spec, profile=None):
+        opened.append(spec)
+        return Source()
+
+    monkeypatch.setattr(camera_broker, "open_camera", fake_open)
+    broker = CameraBroker(default_fps=0.001)
+    presence = broker.acquire("0")
+    capture = broker.acquire(0)
+    assert opened == ["0"]
+    assert broker.users("0") == 2
+
+    ok, first = presence.read()
+    ok2, second = capture.read()
+    assert ok and ok2
+    # One read serves both consumers, handed out read-only without a copy.
+    assert first is second
+    assert not first.flags.writeable
+
+    presence.release()
+    presence.release()
+    assert broker.users("0") == 1
+    source = capture._device.source
+    capture.release()
+    assert source.released
+    assert broker.users("0") == 0
+
+    broker.acquire("0")
+    assert opened == ["0", "0"]
+
+
+def test_discard_closes_idle_device(monkeypatch) -> None:
+    monkeypatch.setattr(camera_broker, "open_camera", lambda spec, profile=None: Source())
+    broker = CameraBroker()
+    old = broker.acquire("1")
+    source = old._device.source
+    broker.discard("1")
+    fresh = broker.acquire("1")
+    assert fresh._device is not old._device
+    assert source.released
+    assert not old.read()[0]
+
+
+def test_discarded_device_closed_when_hung_call_returns(monkeypatch) -> None:
+    import threading
+
+    entered = threading.Event()
+    unblock = threading.Event()
+    sources: list[Source] = []
+
+    class HungSource(Source):
+        def read(self):
+            entered.set()
+            unblock.wait()
+            return super().read()
+
+    def fake_open(spec, profile=None):
+        sources.append(HungSource())
+        return sources[-1]
+
+    monkeypatch.setattr(camera_broker, "open_camera", fake_open)
+    broker = CameraBroker()
+    handle = broker.acquire("1")
+    result: list[tuple] = []
+    reader = threading.Thread(target=lambda: result.append(handle.read()))
+    reader.start()
+    entered.wait()
+    broker.discard("1")
+    # The stuck read holds the device, so discard leaves it for the reader.
+    assert not sources[0].released
+    assert not handle.isOpened()
+    unblock.set()
+    reader.join()
+    assert sources[0].released
+    assert result == [(False, None)]
+
+
+def test_acquire_finishing_after_discard_releases_device(monkeypatch) -> None:
+    broker = CameraBroker()
+    sources: list[Source] = []
+
+    def fake_open(spec, profile=None):
+        # The caller timed out and discarded the camera mid-open.
+        broker.discard(spec)
+        sources.append(Source())
+        return sources[-1]
+
+    monkeypatch.setattr(camera_broker, "open_camera", fake_open)
+    # discard() cannot take the lock the open holds; it gives up quickly.
+    broker.read_wait = 0.01
+    late = broker.acquire("1")
+    assert sources[0].released
+    assert not late.isOpened()
+    assert broker.users("1") == 0
+
+
+def test_primary_consumer_switches_device_profile(monkeypatch) -> None:
+    from midori_ai_hello.camera import CaptureProfile
+
+    opened: list[object] = []
+
+    def fake_open(spec, profile=None):
+        opened.append(profile)
+        return Source()
+
+    monkeypatch.setattr(camera_broker, "open_camera", fake_open)
+    broker = CameraBroker()
+    presence_mode = CaptureProfile(width=640, height=480)
+    capture_mode = CaptureProfile(buffer_size=1)
+    presence = broker.acquire("0", presence_mode)
+    first = presence._device.source
+    # A secondary consumer joins in the current mode.
+    broker.acquire("0", capture_mode).release()
+    assert opened == [presence_mode]
+
+    capture = broker.acquire("0", capture_mode, primary=True)
+    assert opened == [presence_mode, capture_mode]
+    assert first.released
+    assert presence.isOpened() and presence.read()[0]
+    assert capture._device is presence._device
+
+
+def test_hung_read_does_not_block_other_consumers(monkeypatch) -> None:
+    import threading
+    import time
+
+    entered = threading.Event()
+    unblock = threading.Event()
+
+    class SlowSource(Source):
+        def read(self):
+            entered.set()
+            unblock.wait()
+            return super().read()
+
+    monkeypatch.setattr(
+        camera_broker, "open_camera", lambda spec, profile=None: SlowSource()
+    )
+    broker = CameraBroker(default_fps=0.001, read_wait=0.05)
+    presence = broker.acquire("0")
+    capture = broker.acquire("0")
+    reader = threading.Thread(target=presence.read)
+    reader.start()
+    entered.wait()
+    started = time.perf_counter()
+    assert capture.read() == (False, None)
+    assert time.perf_counter() - started < 1.0
+    # Once the stuck read returns, its frame is shared instead of re-read.
+    broker.read_wait = 5.0
+    waiter: list[tuple] = []
+    second = threading.Thread(target=lambda: waiter.append(capture.read()))
+    second.start()
+    unblock.set()
+    reader.join()
+    second.join()
+    assert waiter[0][0] and presence._device.source.reads == 1
@@ -0,0 +1,64 @@
+import threading
+import time
+
+import pytest
+
+from midori_ai_hello.camera_health import CameraHealth, CameraTimeout, CameraWorker
+
+
+def test_breaker_backs_off_and_readmits() -> None:
+    now = [0.0]
+    health = CameraHealth(
+        failure_threshold=2, base_backoff=5.0, max_backoff=12.0, clock=lambda: now[0]
+    )
+    health.record_failure("0", "open")
+    assert health.allow("0")
+    health.record_failure("0", "open")
+    assert not health.allow("0")
+    assert health.snapshot("0")["retry_in"] == 5.0
+
+    # A failed probe after the back-off doubles it, capped at max_backoff.
+    now[0] = 5.0
+    assert health.allow("0")
+    health.record_failure("0", "open")
+    assert health.state("0").backoff == 10.0
+    now[0] = 15.0
+    health.record_failure("0", "timeout")
+    assert health.state("0").backoff == 12.0
+
+    now[0] = 27.0
+    health.record_success("0")
+    snapshot = health.snapshot("0")
+    assert snapshot["available"] and snapshot["failures"] == 0
+    assert snapshot["total_failures"] == 4
+    assert snapshot["last_error"] == "timeout"
+    assert 0.0 < snapshot["score"] < 1.0
+
+
+def test_camera_worker_reuses_one_thread() -> None:
+    worker = CameraWorker()
+    names = [
+        worker.call(lambda: threading.current_thread().name, timeout=1.0)
+        for _ in range(3)
+    ]
+    assert names == ["camera-worker"] * 3
+    assert worker.call(lambda x: x + 1, 1, timeout=1.0) == 2
+    with pytest.raises(ValueError):
+        worker.call(int, "x", timeout=1.0)
+    # Without a timeout the call runs inline.
+    assert worker.call(threading.current_thread) is threading.current_thread()
+    worker.close()
+
+
+def test_camera_worker_times_out_and_stays_hung() -> None:
+    worker = CameraWorker()
+    release = threading.Event()
+    started = time.perf_counter()
+    with pytest.raises(CameraTimeout):
+        worker.call(release.wait, timeout=0.05)
+    assert time.perf_counter() - started < 1.0
+    assert worker.hung
+    with pytest.raises(CameraTimeout):
+        worker.call(int, timeout=1.0)
+    worker.close()
+    release.set()
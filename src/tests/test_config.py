@@ -1,6 +1,12 @@
 from pathlib import Path
 
-from midori_ai_hello.config import Config, load_config, save_config, update_config
+from midori_ai_hello.config import (
+    Config,
+    get_config_store,
+    load_config,
+    save_config,
+    update_config,
+)
 
 
 def test_load_save_update(tmp_path: Path) -> None:
@@ -45,3 +51,64 @@ def test_camera_dirs_created(tmp_path: Path) -> None:
         assert (data_root / "images" / cam).is_dir()
         assert (data_root / "labels" / cam).is_dir()
 
+
+def test_config_store_shares_and_notifies(tmp_path: Path) -> None:
+    cfg_path = tmp_path / "config.yaml"
+    Config(
+        dataset=str(tmp_path / "data"),
+        epochs=1,
+        batch=1,
+        idle_threshold=0,
+        model="yolo11n.pt",
+    ).save(cfg_path)
+
+    store = get_config_store(cfg_path)
+    assert get_config_store(cfg_path) is store
+    seen: list[int] = []
+    store.subscribe(lambda cfg: seen.append(cfg.epochs))
+
+    before = store.config
+    update_config(cfg_path, epochs=4)
+    assert store.config.epochs == 4
+    assert seen == [4]
+    # A fresh object is published; the previous one is left alone.
+    assert store.config is not before and before.epochs == 1
+
+    # No change on disk: nothing is re-parsed or published.
+    assert store.refresh() is False
+
+    text = cfg_path.read_text().replace("epochs: 4", "epochs: 7")
+    cfg_path.write_text(text + "\n")
+    assert store.refresh() is True
+    assert store.config.epochs == 7
+    assert seen == [4, 7]
+
+
+def test_camera_capture_profiles(tmp_path: Path) -> None:
+    cfg_path = tmp_path / "config.yaml"
+    cfg_path.write_text(
+        "dataset: data\n"
+        "capture_profiles:\n"
+        "  presence: {width: 424, height: 240}\n"
+        "cameras:\n"
+        "  - '0'\n"
+        "  - device: /dev/video2\n"
+        "    presence: {fps: 2, fourcc: yuyv}\n"
+        "    capture: {width: 1920, height: 1080}\n"
+    )
+    cfg = load_config(cfg_path)
+    assert cfg.cameras == ["0", "/dev/video2"]
+
+    presence = cfg.capture_profile("0", "presence")
+    assert (presence.width, presence.height, presence.fourcc) == (424, 240, "MJPG")
+    override = cfg.capture_profile("/dev/video2", "presence")
+    assert (override.width, override.fps, override.fourcc) == (424, 2.0, "YUYV")
+    assert cfg.capture_profile("/dev/video2", "capture").width == 1920
+    assert cfg.capture_profile("0", "capture").width is None
+
+    cfg.dataset = str(tmp_path / "data")
+    save_config(cfg, cfg_path)
+    reloaded = load_config(cfg_path)
+    assert reloaded.cameras == cfg.cameras
+    assert reloaded.camera_profiles == cfg.camera_profiles
+    assert reloaded.capture_profiles == cfg.capture_profiles
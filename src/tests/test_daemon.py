@@ -0,0 +1,176 @@
+import asyncio
+import json
+from pathlib import Path
+
+from midori_ai_hello.config import Config
+from midori_ai_hello.control import ControlServer
+from midori_ai_hello.daemon import PresenceDaemon
+
+
+class DummyLocker:
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    async def add_active_changed_handler(self, handler) -> None:
+        self.handler = handler
+
+    async def inhibit(self, reason: str) -> int:
+        self.calls.append("inhibit")
+        return 7
+
+    async def uninhibit(self, cookie: int) -> None:
+        self.calls.append("uninhibit")
+
+    async def get_idle_time(self) -> int:
+        return 0
+
+
+async def _request(path: Path, payload: dict) -> dict:
+    reader, writer = await asyncio.open_unix_connection(str(path))
+    writer.write(json.dumps(payload).encode() + b"\n")
+    await writer.drain()
+    response = json.loads(await reader.readline())
+    writer.close()
+    return response
+
+
+def test_control_server_dispatches_commands(tmp_path: Path) -> None:
+    async def run() -> list[dict]:
+        server = ControlServer(tmp_path / "ctl.sock")
+        server.register("echo", lambda request: request["value"])
+        await server.start()
+        # Bound under a private umask: no group or other access, ever.
+        assert server.path.stat().st_mode & 0o077 == 0
+        try:
+            return [
+                await _request(server.path, {"cmd": "ping"}),
+                await _request(server.path, {"cmd": "echo", "value": 3}),
+                await _request(server.path, {"cmd": "missing"}),
+            ]
+        finally:
+            await server.stop()
+
+    ping, echo, missing = asyncio.run(run())
+    assert ping == {"ok": True, "result": "pong"}
+    assert echo == {"ok": True, "result": 3}
+    assert missing["ok"] is False
+
+
+def test_daemon_serves_status_and_stops(tmp_path: Path) -> None:
+    cfg_path = tmp_path / "config.yaml"
+    Config(
+        dataset=str(tmp_path / "data"),
+        epochs=1,
+        batch=1,
+        idle_threshold=60,
+        model="yolo.pt",
+    ).save(cfg_path)
+    locker = DummyLocker()
+    sock = tmp_path / "daemon.sock"
+
+    async def run() -> tuple[dict, dict]:
+        daemon = PresenceDaemon(cfg_path, socket_path=sock, locker=locker)
+        task = asyncio.create_task(daemon.run())
+        while not sock.exists():
+            await asyncio.sleep(0.01)
+        await locker.handler(True)
+        status = await _request(sock, {"cmd": "status"})
+        stopped = await _request(sock, {"cmd": "stop"})
+        await asyncio.wait_for(task, 1)
+        return status, stopped
+
+    status, stopped = asyncio.run(run())
+    assert status["ok"] and status["result"]["locked"] is True
+    assert stopped["ok"]
+    assert locker.calls == ["inhibit", "uninhibit"]
+    assert not sock.exists()
+
+
+def test_standard_commands_scan_and_retrain(tmp_path: Path) -> None:
+    from midori_ai_hello.control import register_standard_commands
+    from midori_ai_hello.status import StatusModel
+
+    class Presence:
+        scans = 0
+
+        def scan_now(self) -> None:
+            Presence.scans += 1
+
+        def stats(self) -> dict:
+            return {"present": True, "cameras": {"0": {"last_frame_age": 0.5}}}
+
+    class Scheduler:
+        training = False
+        forced: list[bool] = []
+
+        async def maybe_train(self, force: bool = False) -> bool:
+            Scheduler.forced.append(force)
+            return True
+
+        def status(self) -> dict:
+            return {"training": self.training}
+
+    async def run() -> list[dict]:
+        server = ControlServer(tmp_path / "ctl.sock")
+        register_standard_commands(
+            server, status=StatusModel(), presence=Presence(), scheduler=Scheduler()
+        )
+        await server.start()
+        try:
+            responses = [
+                await _request(server.path, {"cmd": "status"}),
+                await _request(server.path, {"cmd": "scan"}),
+                await _request(server.path, {"cmd": "retrain"}),
+            ]
+            await asyncio.sleep(0)
+            return responses
+        finally:
+            await server.stop()
+
+    status, scan, retrain = asyncio.run(run())
+    assert status["result"]["presence"]["cameras"]["0"]["last_frame_age"] == 0.5
+    assert status["result"]["training"] == {"training": False}
+    assert scan["result"] == "scheduled" and Presence.scans == 1
+    assert retrain["result"] == "started" and Scheduler.forced == [True]
+
+
+def test_presence_service_picks_up_cameras_added_later(tmp_path: Path, monkeypatch) -> None:
+    from midori_ai_hello.config import ConfigStore
+    from midori_ai_hello.daemon import build_presence_service
+
+    cfg_path = tmp_path / "config.yaml"
+    Config(
+        dataset=str(tmp_path / "data"),
+        epochs=1,
+        batch=1,
+        idle_threshold=60,
+        model="yolo.pt",
+    ).save(cfg_path)
+    store = ConfigStore(cfg_path)
+
+    class DummyModel:
+        def to(self, device):
+            return self
+
+    loaded: list[str] = []
+    monkeypatch.setattr(
+        "midori_ai_hello.presence_service.YOLO",
+        lambda path: loaded.append(path) or DummyModel(),
+    )
+
+    async def run() -> list[list[str]]:
+        presence = build_presence_service(store)
+        presence._absent_interval = 60
+        scanned: list[list[str]] = []
+        presence._scan_once = lambda model: scanned.append(list(presence._cameras)) or 0.0
+        presence.add_listener(lambda present: None)
+        await asyncio.sleep(0.02)
+        assert loaded == [] and scanned == []
+        store.update(cameras=["0"])
+        await asyncio.sleep(0.05)
+        await presence.stop()
+        return scanned
+
+    scanned = asyncio.run(run())
+    assert scanned and scanned[0] == ["0"]
+    assert loaded == ["yolo.pt"]
@@ -0,0 +1,55 @@
+from pathlib import Path
+
+from midori_ai_hello.config import Config, save_config
+from midori_ai_hello.dataset import DatasetLayout
+
+
+def test_layout_creates_directories_once(tmp_path: Path, monkeypatch) -> None:
+    layout = DatasetLayout(tmp_path / "data")
+    calls: list[Path] = []
+    original = Path.mkdir
+
+    def tracking_mkdir(self: Path, *args: object, **kwargs: object) -> None:
+        calls.append(self)
+        original(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "mkdir", tracking_mkdir)
+    image_dir, label_dir = layout.ensure_camera("0")
+    assert image_dir.is_dir() and label_dir.is_dir()
+    assert image_dir in calls and label_dir in calls
+
+    calls.clear()
+    layout.ensure_camera("0")
+    assert calls == []
+
+
+def test_config_save_only_materialises_new_cameras(
+    tmp_path: Path, monkeypatch
+) -> None:
+    cfg_path = tmp_path / "config.yaml"
+    data_root = tmp_path / "dataset"
+    cfg = Config(
+        dataset=str(data_root),
+        epochs=1,
+        batch=1,
+        idle_threshold=0,
+        model="yolo11n.pt",
+        cameras=["a"],
+    )
+    save_config(cfg, cfg_path)
+
+    created: list[Path] = []
+    original = Path.mkdir
+
+    def tracking_mkdir(self: Path, *args: object, **kwargs: object) -> None:
+        if data_root in self.parents:
+            created.append(self)
+        original(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "mkdir", tracking_mkdir)
+    cfg.update(cfg_path, epochs=2)
+    assert created == []
+    # A freshly parsed Config (as after a store refresh) shares the layout.
+    reloaded = Config.load(cfg_path)
+    reloaded.update(cfg_path, cameras=["a", "b"])
+    assert created == [data_root / "images" / "b", data_root / "labels" / "b"]
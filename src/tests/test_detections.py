@@ -0,0 +1,44 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+from midori_ai_hello.detections import box_arrays, first_box
+
+
+class FakeTensor:
+    def __init__(self, values) -> None:
+        self.values = np.asarray(values)
+        self.transfers = 0
+
+    def cpu(self):
+        self.transfers += 1
+        return self
+
+    def numpy(self) -> np.ndarray:
+        return self.values
+
+
+def test_box_arrays_transfers_data_once() -> None:
+    data = FakeTensor(
+        [[10, 20, 50, 80, 0.9, 1], [0, 0, 5, 5, 0.3, 0], [1, 2, 3, 4, 0.8, 0]]
+    )
+    xyxy, cls, conf = box_arrays(SimpleNamespace(data=data))
+    assert data.transfers == 1
+    assert cls.tolist() == [1, 0, 0]
+    assert conf.tolist() == [0.9, 0.3, 0.8]
+    assert first_box(xyxy, cls, 0) == (0, 0, 5, 5)
+    assert first_box(xyxy, cls, 1) == (10, 20, 40, 60)
+    assert first_box(xyxy, cls, 2) is None
+
+
+def test_box_arrays_without_data_defaults_confidence() -> None:
+    xyxy, cls, conf = box_arrays(SimpleNamespace(cls=[2, 3]))
+    assert cls.tolist() == [2, 3]
+    assert conf.tolist() == [1.0, 1.0]
+    assert xyxy.shape == (2, 4)
+
+
+def test_empty_boxes() -> None:
+    xyxy, cls, conf = box_arrays(SimpleNamespace(data=np.empty((0, 6))))
+    assert cls.size == conf.size == 0
+    assert xyxy.shape == (0, 4)
@@ -0,0 +1,61 @@
+import asyncio
+from typing import Any, Callable
+
+from midori_ai_hello.fake_screensaver import FakeScreenSaverBus
+from midori_ai_hello.kde_lock import KDEScreenLocker, PowerInhibitor
+from midori_ai_hello.screen_lock_manager import ScreenLockManager
+
+
+class FakePresence:
+    def __init__(self) -> None:
+        self.listeners: list[Callable[[bool], Any]] = []
+        self.locked: list[bool] = []
+
+    def add_listener(self, cb: Callable[[bool], Any]) -> None:
+        self.listeners.append(cb)
+
+    def set_locked(self, locked: bool) -> None:
+        self.locked.append(locked)
+
+    def emit(self, present: bool) -> None:
+        for cb in self.listeners:
+            cb(present)
+
+
+def test_presence_drives_lock_and_unlock_through_fake_bus() -> None:
+    bus = FakeScreenSaverBus()
+    presence = FakePresence()
+    events: list[tuple[str, Any]] = []
+
+    async def run() -> None:
+        locker = KDEScreenLocker(bus)
+        manager = ScreenLockManager(
+            locker, presence, absent_timeout=0.01, notify=events.append
+        )
+        await manager.start()
+        presence.emit(False)
+        await asyncio.sleep(0.05)
+        assert bus.active
+        presence.emit(True)
+        await asyncio.sleep(0.01)
+
+    asyncio.run(run())
+    assert not bus.active
+    assert bus.calls["Lock"] == 1
+    assert bus.calls["SetActive"] == 1
+    assert presence.locked == [True, False]
+    assert ("lock", True) in events
+    assert events[-1] == ("lock", False)
+
+
+def test_fake_bus_answers_idle_time_and_inhibit() -> None:
+    bus = FakeScreenSaverBus(idle_time=12)
+
+    async def run() -> None:
+        locker = KDEScreenLocker(bus)
+        assert await locker.get_idle_time() == 12
+        async with PowerInhibitor(locker, "testing") as cookie:
+            assert bus.inhibitors == {cookie: "testing"}
+        assert bus.inhibitors == {}
+
+    asyncio.run(run())
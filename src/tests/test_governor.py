@@ -0,0 +1,85 @@
+from midori_ai_hello import governor as governor_module
+from midori_ai_hello.config import Config
+from midori_ai_hello.governor import ResourceGovernor, split_cpus
+
+
+def test_split_cpus() -> None:
+    cpus = list(range(8))
+    assert split_cpus(cpus) == ([0, 1], [2, 3, 4, 5, 6, 7])
+    assert split_cpus(cpus, inference=[6, 7, 42]) == ([6, 7], [0, 1, 2, 3, 4, 5])
+    # Overlap is removed from the training set.
+    assert split_cpus(cpus, [0, 1], [1, 2, 3]) == ([0, 1], [2, 3])
+    assert split_cpus([0]) == ([0], [0])
+
+
+def _config(**overrides) -> Config:
+    return Config(
+        dataset="d", epochs=1, batch=1, idle_threshold=0, model="m.pt", **overrides
+    )
+
+
+def test_training_narrows_inference_cpus(monkeypatch) -> None:
+    pins: list[list[int]] = []
+    threads: list[int] = [8]
+
+    def set_threads(count: int) -> int:
+        previous = threads[-1]
+        threads.append(count)
+        return previous
+
+    monkeypatch.setattr(governor_module, "_pin", lambda cpus: pins.append(list(cpus)))
+    monkeypatch.setattr(governor_module, "_set_torch_threads", set_threads)
+    cv2_threads = [16]
+
+    class DummyCV2:
+        def getNumThreads(self) -> int:  # noqa: N802
+            return cv2_threads[-1]
+
+        def setNumThreads(self, count: int) -> None:  # noqa: N802
+            cv2_threads.append(count)
+
+    monkeypatch.setattr(governor_module, "cv2", DummyCV2())
+
+    gov = ResourceGovernor()
+    gov.cpus = list(range(8))
+    gov.configure(_config(inference_cpus=[0, 1], training_threads=4))
+    assert gov.enabled
+    assert gov.inference_threads == 2 and gov.training_threads == 4
+
+    # Idle scans touch neither affinity nor the process-wide thread pools.
+    gov.pin_inference()
+    assert pins == [] and threads == [8] and cv2_threads == [16]
+    with gov.training():
+        assert gov.training_active
+        assert pins[-1] == [2, 3, 4, 5, 6, 7]
+        assert threads == [8, 4] and cv2_threads == [16, 2]
+        gov.pin_inference()
+        gov.pin_inference()  # already narrowed: no second syscall
+        assert pins[1:] == [[0, 1]]
+        assert threads == [8, 4]
+    assert not gov.training_active
+    assert threads == [8, 4, 8] and cv2_threads == [16, 2, 16]
+    gov.pin_inference()
+    assert pins[-1] == list(range(8))
+    gov.pin_inference()
+    assert pins.count(list(range(8))) == 2  # training exit + one scan undo
+
+
+def test_unconfigured_governor_is_inert(monkeypatch) -> None:
+    pins: list[list[int]] = []
+    threads: list[int] = []
+    monkeypatch.setattr(governor_module, "_pin", lambda cpus: pins.append(list(cpus)))
+    monkeypatch.setattr(governor_module, "_set_torch_threads", threads.append)
+
+    gov = ResourceGovernor()
+    gov.configure(_config())
+    assert not gov.enabled
+    with gov.training():
+        gov.pin_inference()
+    assert pins == [] and threads == []
+
+    # Clearing the options turns a configured governor off again.
+    gov.configure(_config(training_threads=2))
+    assert gov.enabled
+    gov.configure(_config())
+    assert not gov.enabled
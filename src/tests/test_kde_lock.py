@@ -3,7 +3,7 @@ from types import SimpleNamespace
 from unittest.mock import AsyncMock
 
 from dbus_next import Message
-from dbus_next.constants import MessageType
+from dbus_next.constants import MessageFlag, MessageType
 
 from midori_ai_hello.kde_lock import (
     PATH,
@@ -107,3 +107,68 @@ def test_active_changed_handler_async_invoked():
 
     asyncio.run(run())
     assert events == [True]
+
+
+def test_set_active_without_reply_sets_flag():
+    bus = SimpleNamespace(call=AsyncMock())
+    locker = KDEScreenLocker(bus)
+    asyncio.run(locker.set_active(False, reply=False))
+    msg = bus.call.await_args.args[0]
+    assert msg.flags & MessageFlag.NO_REPLY_EXPECTED
+    # The cached template must not inherit the flag.
+    asyncio.run(locker.set_active(False))
+    assert not bus.call.await_args.args[0].flags & MessageFlag.NO_REPLY_EXPECTED
+
+
+def test_messages_are_cached_and_reissued():
+    bus = SimpleNamespace(call=AsyncMock())
+    locker = KDEScreenLocker(bus)
+
+    async def run():
+        await locker.lock()
+        await locker.lock()
+
+    asyncio.run(run())
+    first, second = (c.args[0] for c in bus.call.await_args_list)
+    assert first is not second
+    assert first.member == second.member == "Lock"
+    assert len(locker._messages) == 1
+
+
+def test_reconnects_and_replays_match_rule(monkeypatch):
+    class Bus:
+        def __init__(self):
+            self.connected = True
+            self.calls: list[str] = []
+            self.handlers: list = []
+
+        async def call(self, msg):
+            if not self.connected:
+                raise EOFError()
+            self.calls.append(msg.member)
+
+        def add_message_handler(self, cb):
+            self.handlers.append(cb)
+
+    dropped = Bus()
+    fresh = Bus()
+
+    class FakeMessageBus:
+        def __init__(self, bus_type):
+            pass
+
+        async def connect(self):
+            return fresh
+
+    monkeypatch.setattr("midori_ai_hello.kde_lock.MessageBus", FakeMessageBus)
+
+    async def run():
+        locker = KDEScreenLocker(dropped)
+        await locker.add_active_changed_handler(lambda state: None)
+        dropped.connected = False
+        await locker.lock()
+
+    asyncio.run(run())
+    assert dropped.calls == ["AddMatch"]
+    assert fresh.calls == ["AddMatch", "Lock"]
+    assert len(fresh.handlers) == 1
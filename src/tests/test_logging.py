@@ -2,7 +2,14 @@ from pathlib import Path
 import logging
 import asyncio
 
+import pytest
+
 import midori_ai_hello.__main__ as cli
+from midori_ai_hello.logging_setup import (
+    SamplingFilter,
+    parse_module_levels,
+    shutdown_logging,
+)
 from midori_ai_hello.yolo_train import YOLOTrainingScheduler
 from midori_ai_hello.screen_lock_manager import ScreenLockManager
 
@@ -11,12 +18,63 @@ def test_logging_file_creation(tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
     cli.configure_logging("INFO")
     logging.getLogger(__name__).debug("debug message")
+    shutdown_logging()
     log_file = tmp_path / "midori-ai-hello.log"
     assert log_file.exists()
     contents = log_file.read_text()
     assert "debug message" in contents
 
 
+def test_module_levels_and_rotation(tmp_path):
+    log_path = tmp_path / "app.log"
+    cli.configure_logging(
+        "INFO",
+        log_path=log_path,
+        max_bytes=200,
+        module_levels={"noisy": logging.WARNING},
+    )
+    logging.getLogger("noisy").info("hidden line")
+    for i in range(10):
+        logging.getLogger("quiet").info("visible line %d", i)
+    shutdown_logging()
+    logging.getLogger("noisy").setLevel(logging.NOTSET)
+    contents = "".join(p.read_text() for p in tmp_path.glob("app.log*"))
+    assert "hidden line" not in contents
+    assert "visible line 9" in contents
+    assert (tmp_path / "app.log.1").exists()
+
+
+def test_sampling_filter_caps_debug_lines():
+    sampler = SamplingFilter(limit=2, interval=60.0)
+
+    def record(level: int, msg: str = "Detected %s") -> logging.LogRecord:
+        return logging.LogRecord("presence", level, __file__, 1, msg, ("x",), None)
+
+    assert [sampler.filter(record(logging.DEBUG)) for _ in range(4)] == [
+        True,
+        True,
+        False,
+        False,
+    ]
+    assert sampler.filter(record(logging.DEBUG, "Other %s"))
+    assert sampler.filter(record(logging.INFO))
+
+    sampler.interval = 0.0
+    resumed = record(logging.DEBUG)
+    assert sampler.filter(resumed)
+    assert "2 similar messages suppressed" in resumed.getMessage()
+
+
+def test_parse_module_levels():
+    assert parse_module_levels(["a=debug,b=WARNING", "", "c=ERROR"]) == {
+        "a": logging.DEBUG,
+        "b": logging.WARNING,
+        "c": logging.ERROR,
+    }
+    with pytest.raises(ValueError):
+        parse_module_levels(["a=LOUD"])
+
+
 def test_scheduler_training_logged(tmp_path, caplog):
     async def run() -> bool:
         config_path = tmp_path / "config.yaml"
@@ -48,7 +106,7 @@ def test_screen_lock_manager_logs(caplog):
             async def add_active_changed_handler(self, handler):
                 self.handler = handler
 
-            async def set_active(self, active: bool) -> None:
+            async def set_active(self, active: bool, reply: bool = True) -> None:
                 pass
 
             async def lock(self) -> None:
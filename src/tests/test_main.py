@@ -2,6 +2,7 @@ import subprocess
 import pytest
 import midori_ai_hello.__main__ as cli
 from midori_ai_hello.__main__ import main
+from midori_ai_hello.fake_screensaver import FakeScreenSaverBus
 
 
 def test_main_version(capsys):
@@ -32,31 +33,109 @@ def test_main_inhibits_screensaver(monkeypatch):
     monkeypatch.setattr(cli, "KDEScreenLocker", lambda: DummyLocker())
 
     class DummyScheduler:
-        def __init__(self, locker, config_path):
+        def __init__(self, locker, config_path, store=None):
             pass
 
     monkeypatch.setattr(cli, "YOLOTrainingScheduler", DummyScheduler)
 
     class DummyApp:
-        def __init__(self, config_path, scheduler=None, locker=None, presence_service=None):
+        def __init__(
+            self,
+            config_path,
+            scheduler=None,
+            locker=None,
+            presence_service=None,
+            store=None,
+            control_socket=None,
+        ):
             pass
 
         async def run_async(self) -> None:
             return None
 
-    monkeypatch.setattr(cli, "MidoriApp", DummyApp)
+    monkeypatch.setattr("midori_ai_hello.app.MidoriApp", DummyApp)
 
     class DummyConfig:
         cameras: list[str] = []
         model = "model.pt"
 
-    monkeypatch.setattr(cli, "load_config", lambda path: DummyConfig())
-    monkeypatch.setattr(cli, "WhitelistManager", lambda path: object())
+    class DummyStore:
+        raw = {"device": "cpu", "model_size": "n"}
+        config = DummyConfig()
+
+    monkeypatch.setattr(cli, "get_config_store", lambda path: DummyStore())
     monkeypatch.setattr(
-        cli,
-        "CameraPresenceService",
-        lambda cams, model, wl, device="cpu": object(),
+        cli, "build_presence_service", lambda store, locker=None: object()
     )
 
     cli.main([])
     assert calls == ["in", "out"]
+
+
+def test_daemon_mode_skips_textual(monkeypatch):
+    ran: list[str | None] = []
+    lockers: list[object] = []
+
+    class DummyDaemon:
+        def __init__(
+            self, config_path, socket_path=None, locker=None, metrics_file=None
+        ):
+            ran.append(socket_path)
+            lockers.append(locker)
+
+        async def run(self) -> None:
+            return None
+
+    monkeypatch.setattr(cli, "PresenceDaemon", DummyDaemon)
+    monkeypatch.setattr(
+        "midori_ai_hello.app.MidoriApp",
+        lambda *a, **k: pytest.fail("TUI started in daemon mode"),
+    )
+    assert cli.main(["--daemon", "--socket", "/tmp/test.sock"]) == 0
+    assert ran == ["/tmp/test.sock"]
+    assert lockers == [None]
+
+    assert cli.main(["--daemon", "--fake-dbus"]) == 0
+    assert isinstance(lockers[-1]._bus, FakeScreenSaverBus)
+
+
+@pytest.mark.parametrize(
+    ("model", "expected"),
+    [
+        ("yolo11n.pt", {"model_size": "s"}),
+        ("runs/best.pt", {"model_size": "s", "model": "runs/best.pt"}),
+    ],
+)
+def test_calibrate_saves_model_size(monkeypatch, capsys, model, expected):
+    import sys
+    import types
+
+    from midori_ai_hello.calibration import Measurement
+
+    monkeypatch.setitem(sys.modules, "ultralytics", types.SimpleNamespace(YOLO=object))
+    updates: list[dict] = []
+
+    class DummyStore:
+        config = types.SimpleNamespace(device="cpu", model_size="n", model=model)
+        path = "config.yaml"
+
+        def update(self, **kwargs):
+            updates.append(kwargs)
+
+    seen: dict = {}
+
+    def fake_calibrate(factory, **kwargs):
+        seen.update(kwargs)
+        return Measurement("s", 0.05, 0.05, True), [
+            Measurement("n", 0.01, 0.01, True),
+            Measurement("s", 0.05, 0.05, True),
+        ]
+
+    monkeypatch.setattr(cli, "get_config_store", lambda path: DummyStore())
+    monkeypatch.setattr(cli, "calibrate", fake_calibrate)
+    # capsys swaps stderr; keep the logging pipeline off it.
+    monkeypatch.setattr(cli, "configure_logging", lambda *a, **k: None)
+    assert cli.main(["--calibrate", "--target-latency", "80"]) == 0
+    assert updates == [expected]
+    assert seen["target_latency"] == 0.08
+    assert "model_size=s" in capsys.readouterr().out
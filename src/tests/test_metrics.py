@@ -0,0 +1,57 @@
+from midori_ai_hello.metrics import Histogram, MetricsRegistry
+
+
+def test_histogram_quantiles_and_snapshot() -> None:
+    hist = Histogram(buckets=(0.01, 0.1, 1.0))
+    assert hist.quantile(0.5) is None
+    for value in (0.005, 0.05, 0.05, 0.5):
+        hist.observe(value)
+    assert hist.count == 4
+    assert hist.quantile(0.5) == 0.1
+    assert hist.quantile(0.99) == 1.0
+    snap = hist.snapshot()
+    assert snap["buckets"] == {"0.01": 1, "0.1": 3, "1.0": 4, "inf": 4}
+
+
+def test_disabled_registry_records_nothing() -> None:
+    registry = MetricsRegistry()
+    with registry.timer("op_seconds"):
+        pass
+    registry.inc("ops_total")
+    assert registry.render_prometheus() == ""
+
+
+def test_prometheus_rendering(tmp_path) -> None:
+    registry = MetricsRegistry(enabled=True)
+    registry.describe("op_seconds", "Time per op")
+    with registry.timer("op_seconds", member="Lock"):
+        pass
+    registry.inc("ops_total", camera="0")
+    registry.inc("ops_total", camera="0")
+    text = registry.render_prometheus()
+    assert "# HELP op_seconds Time per op" in text
+    assert "# TYPE op_seconds histogram" in text
+    assert 'op_seconds_bucket{member="Lock",le="+Inf"} 1' in text
+    assert 'op_seconds_count{member="Lock"} 1' in text
+    assert 'ops_total{camera="0"} 2' in text
+
+    out = tmp_path / "midori.prom"
+    registry.write_prometheus(out)
+    assert out.read_text() == text
+
+
+def test_instrumented_whitelist_read(tmp_path) -> None:
+    from midori_ai_hello.metrics import metrics
+    from midori_ai_hello.whitelist import WhitelistManager
+
+    model = tmp_path / "model.pt"
+    model.write_bytes(b"weights")
+    manager = WhitelistManager(model, config_dir=tmp_path)
+    metrics.enabled = True
+    try:
+        manager.users()
+        hist = metrics.histogram("midori_whitelist_read_seconds")
+        assert hist is not None and hist.count == 1
+    finally:
+        metrics.enabled = False
+        metrics.reset()
@@ -0,0 +1,105 @@
+from pathlib import Path
+
+from midori_ai_hello import model_cache
+from midori_ai_hello.model_cache import cache_path, load_model
+
+
+class FakeModel:
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.fused = False
+        self.calls: list[dict] = []
+
+    def fuse(self) -> None:
+        self.fused = True
+
+    def save(self, filename: str) -> None:
+        Path(filename).write_text("fused")
+
+    def to(self, device: str) -> "FakeModel":
+        self.device = device
+        return self
+
+    def __call__(self, frame, **kwargs):
+        self.calls.append(kwargs)
+        return []
+
+
+def test_load_model_caches_fused_weights_and_warms_up(tmp_path: Path) -> None:
+    weights = tmp_path / "best.pt"
+    weights.write_bytes(b"weights-v1")
+    cache_dir = tmp_path / "cache"
+
+    first = load_model(
+        FakeModel, weights, "cpu", warmup_sizes=(320, None), cache_dir=cache_dir
+    )
+    cached = cache_path(weights, cache_dir)
+    assert first.path == str(weights) and first.fused
+    assert cached.read_text() == "fused"
+    assert first.calls == [{"verbose": False, "imgsz": 320}, {"verbose": False}]
+
+    # The next start loads the fused copy instead of the original weights.
+    second = load_model(FakeModel, weights, "cpu", cache_dir=cache_dir)
+    assert second.path == str(cached) and not second.fused
+
+    # New weights get a new cache entry and the stale one is pruned.
+    weights.write_bytes(b"weights-v2")
+    load_model(FakeModel, weights, "cpu", cache_dir=cache_dir)
+    assert cache_path(weights, cache_dir) != cached
+    assert [p.name for p in cache_dir.iterdir()] == [
+        cache_path(weights, cache_dir).name
+    ]
+
+
+def test_load_model_tolerates_plain_models(tmp_path: Path) -> None:
+    class Plain:
+        def to(self, device: str) -> "Plain":
+            return self
+
+    model = load_model(lambda path: Plain(), tmp_path / "missing.pt", "cpu")
+    assert isinstance(model, Plain)
+    assert model_cache.weights_digest(tmp_path / "missing.pt") is None
+
+
+def test_corrupt_cache_falls_back_to_source_weights(tmp_path: Path) -> None:
+    weights = tmp_path / "best.pt"
+    weights.write_bytes(b"weights")
+    cache_dir = tmp_path / "cache"
+    cached = cache_path(weights, cache_dir)
+    cache_dir.mkdir()
+    cached.write_text("truncated")
+
+    def factory(path: str) -> FakeModel:
+        if Path(path).read_text() == "truncated":
+            raise RuntimeError("bad zip file")
+        return FakeModel(path)
+
+    model = load_model(factory, weights, "cpu", cache_dir=cache_dir)
+    assert model.path == str(weights) and model.fused
+    # The cache is rebuilt from the source weights.
+    assert cached.read_text() == "fused"
+
+
+def test_cache_entries_are_keyed_on_source_path(tmp_path: Path) -> None:
+    cache_dir = tmp_path / "cache"
+    saved: list[str] = []
+
+    class Recording(FakeModel):
+        def save(self, filename: str) -> None:
+            saved.append(filename)
+            super().save(filename)
+
+    paths = []
+    for run in ("run1", "run2"):
+        weights = tmp_path / run / "best.pt"
+        weights.parent.mkdir()
+        weights.write_bytes(run.encode())
+        load_model(Recording, weights, "cpu", cache_dir=cache_dir)
+        paths.append(cache_path(weights, cache_dir))
+    # Two best.pt files do not evict each other.
+    assert paths[0] != paths[1]
+    assert sorted(cache_dir.iterdir()) == sorted(paths)
+    # Each write went through its own temporary file, never a shared name.
+    assert len(set(saved)) == 2
+    assert all(Path(name).parent == cache_dir for name in saved)
+    assert not any(name.endswith(".tmp") for name in saved)
@@ -0,0 +1,34 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from midori_ai_hello import prefilter
+from midori_ai_hello.prefilter import HaarPrefilter, build_prefilter
+
+
+def test_disabled_and_unknown_prefilters() -> None:
+    assert build_prefilter("none") is None
+    assert build_prefilter("") is None
+    assert build_prefilter("magic") is None
+
+
+def test_missing_weights_disable_prefilter(tmp_path: Path) -> None:
+    pytest.importorskip("cv2")
+    assert build_prefilter("haar", str(tmp_path)) is None
+    assert build_prefilter("yunet") is None
+    assert build_prefilter("yunet", str(tmp_path / "face.onnx")) is None
+
+
+def test_prefilter_without_opencv(monkeypatch) -> None:
+    monkeypatch.setattr(prefilter, "cv2", None)
+    assert build_prefilter("haar") is None
+
+
+def test_haar_rejects_empty_frame() -> None:
+    cv2 = pytest.importorskip("cv2")
+    cascades = Path(getattr(getattr(cv2, "data", None), "haarcascades", ""))
+    if not (cascades / "haarcascade_frontalface_default.xml").exists():
+        pytest.skip("OpenCV build ships without Haar cascades")
+    detector = HaarPrefilter()
+    assert detector(np.zeros((480, 640, 3), dtype=np.uint8)) is False
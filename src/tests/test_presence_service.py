@@ -1,5 +1,7 @@
 import asyncio
-from typing import List
+from typing import Any, Callable, List
+
+import numpy as np
 
 from midori_ai_hello.presence_service import CameraPresenceService
 
@@ -9,6 +11,48 @@ class DummyWhitelist:
         return ["alice"]
 
 
+class FakeCap:
+    """``cv2.VideoCapture`` stand-in that returns ``"frame"`` by default."""
+
+    def __init__(
+        self,
+        cam: Any,
+        *,
+        opened: bool = True,
+        read: Callable[[], tuple[bool, Any]] | None = None,
+    ) -> None:
+        self.cam = cam
+        self.opened = opened
+        self._read = read
+        self.released = False
+
+    def isOpened(self) -> bool:  # noqa: N802
+        return self.opened
+
+    def read(self) -> tuple[bool, Any]:
+        return self._read() if self._read else (True, "frame")
+
+    def release(self) -> None:
+        self.released = True
+
+
+def _patch_cv2(
+    monkeypatch, factory: Callable[[Any], FakeCap] = FakeCap
+) -> list[FakeCap]:
+    """Route camera opens to *factory*; returns every capture it made."""
+
+    caps: list[FakeCap] = []
+
+    class DummyCV2:
+        def VideoCapture(self, cam):  # noqa: N802
+            cap = factory(cam)
+            caps.append(cap)
+            return cap
+
+    monkeypatch.setattr("midori_ai_hello.camera.cv2", DummyCV2())
+    return caps
+
+
 def test_presence_service_emits_events(monkeypatch):
     async def run() -> list[bool]:
         events: list[bool] = []
@@ -42,3 +86,444 @@ def test_presence_service_emits_events(monkeypatch):
 
     events = asyncio.run(run())
     assert events == [True, False]
+
+
+def test_apply_config_updates_cameras_and_model() -> None:
+    from midori_ai_hello.config import Config
+
+    service = CameraPresenceService(
+        cameras=["0"], model_path="model.pt", whitelist=DummyWhitelist()
+    )
+    service.apply_config(
+        Config(
+            dataset="data",
+            epochs=1,
+            batch=1,
+            idle_threshold=0,
+            model="model.pt",
+            cameras=["0", "1"],
+        )
+    )
+    assert service._cameras == ["0", "1"]
+    assert service._reload_model is False
+
+    service.apply_config(
+        Config(
+            dataset="data",
+            epochs=1,
+            batch=1,
+            idle_threshold=0,
+            model="other.pt",
+            device="cuda",
+            cameras=["0", "1"],
+        )
+    )
+    assert service._reload_model is True
+    assert service._device == "cuda"
+
+
+def test_model_change_rebinds_whitelist(tmp_path) -> None:
+    from midori_ai_hello.config import Config
+    from midori_ai_hello.whitelist import WhitelistManager
+
+    whitelist = WhitelistManager(tmp_path / "old.pt", config_dir=tmp_path)
+    service = CameraPresenceService(
+        cameras=["0"], model_path=str(tmp_path / "old.pt"), whitelist=whitelist
+    )
+    service.apply_config(
+        Config(
+            dataset="data",
+            epochs=1,
+            batch=1,
+            idle_threshold=0,
+            model=str(tmp_path / "new.pt"),
+            cameras=["0"],
+        )
+    )
+    assert service._whitelist is not whitelist
+    assert service._whitelist.model_path == tmp_path / "new.pt"
+    assert service._whitelist.config_dir == tmp_path
+
+
+def test_locked_mode_confirms_fast_pass(monkeypatch) -> None:
+    caps = _patch_cv2(monkeypatch)
+
+    class Result:
+        names = {0: "alice"}
+        boxes = type("Boxes", (), {"cls": [0]})()
+
+    calls: list[int | None] = []
+
+    def model(frame, imgsz=None):
+        calls.append(imgsz)
+        return [Result()]
+
+    service = CameraPresenceService(
+        cameras=["0"], model_path="model.pt", whitelist=DummyWhitelist()
+    )
+    assert service._scan_locked(model) == 1.0
+    assert calls == [320, None]
+    assert service._scan_locked(model) == 1.0
+    # The camera stays warm between locked scans.
+    assert [cap.cam for cap in caps] == [0]
+    service._release_cameras()
+    assert caps[0].released
+
+
+def test_set_locked_wakes_poll_loop(monkeypatch) -> None:
+    async def run() -> list[str]:
+        scans: list[str] = []
+        service = CameraPresenceService(
+            cameras=["0"],
+            model_path="model.pt",
+            whitelist=DummyWhitelist(),
+            absent_interval=60,
+            locked_interval=0.01,
+        )
+
+        class DummyModel:
+            def to(self, device):  # pragma: no cover - simple stub
+                return self
+
+        monkeypatch.setattr(
+            "midori_ai_hello.presence_service.YOLO", lambda path: DummyModel()
+        )
+        monkeypatch.setattr(service, "_scan_once", lambda m: scans.append("idle") or False)
+        monkeypatch.setattr(
+            service, "_scan_locked", lambda m: scans.append("locked") or False
+        )
+        service.add_listener(lambda present: None)
+        await asyncio.sleep(0.01)
+        service.set_locked(True)
+        await asyncio.sleep(0.05)
+        await service.stop()
+        return scans
+
+    scans = asyncio.run(run())
+    assert scans[0] == "idle"
+    assert scans.count("locked") >= 2
+
+
+def test_confidence_listener_and_class_thresholds() -> None:
+    class Boxes:
+        cls = [0, 1]
+        conf = [0.9, 0.4]
+
+    class Result:
+        names = {0: "bob", 1: "alice"}
+        boxes = Boxes()
+
+    service = CameraPresenceService(
+        cameras=["0"],
+        model_path="model.pt",
+        whitelist=DummyWhitelist(),
+        class_thresholds={"alice": 0.5},
+    )
+    score = service._detect(lambda frame: [Result()], "frame", "0", {"alice"})
+    assert score == 0.0
+
+    service._class_thresholds = {}
+    score = service._detect(lambda frame: [Result()], "frame", "0", {"alice"})
+    assert score == 0.4
+
+    events: list[tuple[bool, float]] = []
+
+    async def run() -> None:
+        service._confidence_listeners.append(lambda p, c: events.append((p, c)))
+        await service._emit(True, 0.4)
+
+    asyncio.run(run())
+    assert events == [(True, 0.4)]
+
+
+def test_class_table_cached_per_whitelist_version() -> None:
+    class VersionedWhitelist:
+        def __init__(self) -> None:
+            self.names = ["alice"]
+            self.reads = 0
+
+        def version(self) -> tuple:
+            return tuple(self.names)
+
+        def users(self) -> List[str]:
+            self.reads += 1
+            return list(self.names)
+
+    class Result:
+        names = {0: "bob", 1: "alice", 2: "carol"}
+        boxes = type("Boxes", (), {"cls": [0, 1, 2], "conf": [0.9, 0.6, 0.7]})()
+
+    whitelist = VersionedWhitelist()
+    service = CameraPresenceService(
+        cameras=["0"], model_path="model.pt", whitelist=whitelist
+    )
+    model = lambda frame: [Result()]  # noqa: E731
+    for _ in range(3):
+        assert service._detect(model, "f", "0", service._authorised()) == 0.6
+    assert whitelist.reads == 1
+    table = service._class_table
+
+    whitelist.names = ["alice", "carol"]
+    assert service._detect(model, "f", "0", service._authorised()) == 0.7
+    assert whitelist.reads == 2
+    assert service._class_table is not table
+
+
+def test_model_filtered_to_authorised_classes() -> None:
+    class Result:
+        names = {0: "bob", 1: "alice"}
+        boxes = type("Boxes", (), {"cls": [1, 7], "conf": [0.8, 0.9]})()
+
+    class Model:
+        names = {0: "bob", 1: "alice"}
+
+        def __init__(self) -> None:
+            self.calls: list[dict] = []
+
+        def __call__(self, frame, **kwargs):
+            self.calls.append(kwargs)
+            return [Result()]
+
+    service = CameraPresenceService(
+        cameras=["0"], model_path="model.pt", whitelist=DummyWhitelist()
+    )
+    model = Model()
+    # Class 7 is unknown to the model and never counts as authorised.
+    assert service._detect(model, "f", "0", {"alice"}, imgsz=320) == 0.8
+    assert model.calls == [{"imgsz": 320, "classes": [1]}]
+
+    assert service._detect(model, "f", "0", {"carol"}) == 0.0
+    assert len(model.calls) == 1
+
+
+def test_recent_input_skips_camera_scans(monkeypatch) -> None:
+    idle = {"seconds": 2}
+
+    async def idle_time() -> int:
+        return idle["seconds"]
+
+    async def run() -> tuple[list[str], list[bool]]:
+        scans: list[str] = []
+        events: list[bool] = []
+        service = CameraPresenceService(
+            cameras=["0"],
+            model_path="model.pt",
+            whitelist=DummyWhitelist(),
+            present_interval=0.01,
+            absent_interval=0.01,
+            locked_interval=0.01,
+            idle_time=idle_time,
+            activity_window=30,
+        )
+
+        class DummyModel:
+            def to(self, device):  # pragma: no cover - simple stub
+                return self
+
+        monkeypatch.setattr(
+            "midori_ai_hello.presence_service.YOLO", lambda path: DummyModel()
+        )
+        monkeypatch.setattr(
+            service, "_scan_once", lambda m: scans.append("idle") or 0.0
+        )
+        monkeypatch.setattr(
+            service, "_scan_locked", lambda m: scans.append("locked") or 0.0
+        )
+        service.add_listener(events.append)
+        await asyncio.sleep(0.05)
+        assert scans == []
+        assert service.present
+
+        # Input at the lock screen is not trusted.
+        service.set_locked(True)
+        await asyncio.sleep(0.03)
+        assert "locked" in scans
+        service.set_locked(False)
+
+        idle["seconds"] = 120
+        await asyncio.sleep(0.03)
+        await service.stop()
+        return scans, events
+
+    scans, events = asyncio.run(run())
+    assert "idle" in scans
+    assert events[0] is True
+    assert events[-1] is False
+
+
+def test_prefilter_skips_inference_on_empty_frames(monkeypatch) -> None:
+    _patch_cv2(monkeypatch)
+    service = CameraPresenceService(
+        cameras=["0", "1"], model_path="model.pt", whitelist=DummyWhitelist()
+    )
+    seen: list[str] = []
+    service._prefilter = lambda frame: seen.append(frame) or False
+    inferred: list[object] = []
+    model = lambda frame, **kw: inferred.append(frame) or []  # noqa: E731
+    assert service._scan_once(model) == 0.0
+    assert seen == ["frame", "frame"]
+    assert inferred == []
+
+    service._prefilter = lambda frame: True
+    service._scan_once(model)
+    assert len(inferred) == 2
+
+
+def _frame(value: int) -> np.ndarray:
+    return np.full((48, 64, 3), value, dtype=np.uint8)
+
+
+def _tracking_service(monkeypatch, frames: list) -> CameraPresenceService:
+    """One-camera tracking service reading ``frames[-1]`` on every sample."""
+
+    from midori_ai_hello.camera_broker import CameraBroker
+
+    _patch_cv2(monkeypatch, lambda cam: FakeCap(cam, read=lambda: (True, frames[-1])))
+    return CameraPresenceService(
+        cameras=["0"],
+        model_path="model.pt",
+        whitelist=DummyWhitelist(),
+        tracking=True,
+        reverify_interval=60.0,
+        # Never serve a cached frame: every sample sees frames[-1].
+        broker=CameraBroker(default_fps=1e9),
+    )
+
+
+def _box_model(boxes: dict, calls: list):
+    class Result:
+        names = {0: "alice"}
+
+        @property
+        def boxes(self):
+            return type("Boxes", (), boxes)()
+
+    def model(frame, imgsz=None):
+        calls.append(imgsz)
+        return [Result()]
+
+    return model
+
+
+def test_tracking_mode_identifies_only_when_tracks_change(monkeypatch) -> None:
+    frames = [_frame(0)]
+    boxes = {"data": [[0, 0, 100, 100, 0.9, 0]]}
+    calls: list[int | None] = []
+    model = _box_model(boxes, calls)
+    service = _tracking_service(monkeypatch, frames)
+
+    assert service._scan_tracked(model) == 0.9
+    assert calls == [320, None]
+    for _ in range(3):
+        assert service._scan_tracked(model) == 0.9
+    # A static scene keeps the verified track without any inference.
+    assert calls == [320, None]
+
+    # Movement that keeps the same track only costs the cheap pass.
+    frames.append(_frame(40))
+    service._scan_tracked(model)
+    assert calls == [320, None, 320]
+
+    frames.append(_frame(80))
+    boxes["data"] = [[0, 0, 100, 100, 0.9, 0], [300, 300, 400, 400, 0.8, 0]]
+    service._scan_tracked(model)
+    assert calls[-2:] == [320, None]
+
+    service.set_locked(True)
+    service.set_locked(False)
+    calls.clear()
+    service._scan_tracked(model)
+    assert calls == [320, None]
+    service._release_cameras()
+
+
+def test_tracking_mode_runs_fewer_inferences_than_normal_mode(monkeypatch) -> None:
+    frames = [_frame(0)]
+    boxes = {"data": [[0, 0, 100, 100, 0.9, 0]]}
+    service = _tracking_service(monkeypatch, frames)
+
+    # A minute with someone seated: tracking samples every tracking_interval
+    # (1 s), normal mode scans every present_interval (10 s).
+    seconds = 60
+    tracked: list[int | None] = []
+    model = _box_model(boxes, tracked)
+    for _ in range(seconds):
+        service._scan_tracked(model)
+    service._release_cameras()
+
+    normal: list[int | None] = []
+    model = _box_model(boxes, normal)
+    for _ in range(seconds // 10):
+        service._scan_once(model)
+
+    assert len(normal) == 6
+    assert len(tracked) == 2
+
+
+def test_dead_camera_is_skipped_until_backoff_expires(monkeypatch) -> None:
+    from midori_ai_hello.camera_health import CameraHealth
+
+    plugged = [False]
+    now = [0.0]
+    caps = _patch_cv2(
+        monkeypatch, lambda cam: FakeCap(cam, opened=cam != 1 or plugged[0])
+    )
+    service = CameraPresenceService(
+        cameras=["0", "1"],
+        model_path="model.pt",
+        whitelist=DummyWhitelist(),
+        health=CameraHealth(failure_threshold=2, clock=lambda: now[0]),
+    )
+    for _ in range(4):
+        assert service._read_frame("1") is None
+    # Two failures open the breaker; later polls do not touch the device.
+    assert [cap.cam for cap in caps] == [1, 1]
+    assert service.stats()["cameras"]["1"]["health"]["available"] is False
+    assert service._read_frame("0") == "frame"
+
+    plugged[0] = True
+    now[0] = 5.0
+    assert service._read_frame("1") == "frame"
+    assert service.stats()["cameras"]["1"]["health"]["failures"] == 0
+
+
+def test_hung_camera_read_times_out(monkeypatch) -> None:
+    import threading
+
+    release = threading.Event()
+
+    def hang() -> tuple[bool, None]:
+        release.wait()
+        return False, None
+
+    _patch_cv2(monkeypatch, lambda cam: FakeCap(cam, read=hang))
+    service = CameraPresenceService(
+        cameras=["0"],
+        model_path="model.pt",
+        whitelist=DummyWhitelist(),
+        camera_timeout=0.05,
+    )
+    try:
+        assert service._read_frame("0", keep_open=True) is None
+        assert service._warm == {}
+        assert service.stats()["cameras"]["0"]["health"]["last_error"] == "timeout"
+        # The stuck worker is dropped; the next read starts a fresh one.
+        assert service._workers == {}
+    finally:
+        release.set()
+
+
+def test_camera_exception_counts_as_failure(monkeypatch) -> None:
+    def broken() -> tuple[bool, None]:
+        raise RuntimeError("device unplugged")
+
+    caps = _patch_cv2(monkeypatch, lambda cam: FakeCap(cam, read=broken))
+    service = CameraPresenceService(
+        cameras=["0"], model_path="model.pt", whitelist=DummyWhitelist()
+    )
+    model = lambda frame, **kw: []  # noqa: E731
+    assert service._scan_once(model) == 0.0
+    assert service._scan_tracked(model) == 0.0
+    health = service.stats()["cameras"]["0"]["health"]
+    assert health["failures"] == 2 and health["last_error"] == "error"
+    assert all(cap.released for cap in caps)
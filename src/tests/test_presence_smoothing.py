@@ -0,0 +1,41 @@
+import pytest
+
+from midori_ai_hello.presence_smoothing import PresenceSmoother
+
+
+def test_default_smoother_follows_each_scan() -> None:
+    smoother = PresenceSmoother()
+    assert smoother.update(1.0) == (True, 1.0)
+    assert smoother.update(0.0) == (False, 0.0)
+
+
+def test_votes_and_thresholds_suppress_flaps() -> None:
+    smoother = PresenceSmoother(
+        window=3,
+        enter_votes=2,
+        exit_votes=2,
+        enter_threshold=0.6,
+        exit_threshold=0.3,
+    )
+    assert smoother.update(0.9)[0] is False  # one hit is not enough
+    present, confidence = smoother.update(0.8)
+    assert present is True
+    assert confidence == pytest.approx(0.8)
+    # A single miss, or a weak-but-above-exit score, keeps presence.
+    assert smoother.update(0.0)[0] is True
+    assert smoother.update(0.4)[0] is True
+    assert smoother.update(0.1)[0] is False
+
+
+def test_invalid_settings_rejected() -> None:
+    with pytest.raises(ValueError):
+        PresenceSmoother(window=2, enter_votes=3)
+    with pytest.raises(ValueError):
+        PresenceSmoother(enter_threshold=0.2, exit_threshold=0.5)
+
+
+def test_force_restarts_window() -> None:
+    smoother = PresenceSmoother(window=3, enter_votes=3, exit_votes=2)
+    assert smoother.force(True, 1.0) == (True, 1.0)
+    assert smoother.update(0.0) == (True, 0.5)
+    assert smoother.update(0.0)[0] is False
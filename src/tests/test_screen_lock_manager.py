@@ -17,7 +17,7 @@ class FakeLocker:
         if self._handler:
             await asyncio.create_task(self._handler(True))
 
-    async def set_active(self, active: bool) -> None:
+    async def set_active(self, active: bool, reply: bool = True) -> None:
         self.events.append(f"set_active:{active}")
         if self._handler:
             await asyncio.create_task(self._handler(active))
@@ -56,7 +56,10 @@ def test_lock_and_unlock() -> None:
     assert "lock" in locker.events
     assert "set_active:False" in locker.events
     assert ("presence", False) in messages
-    assert any(kind == "countdown" and value is None for kind, value in messages)
+    deadlines = [value for kind, value in messages if kind == "deadline"]
+    assert len(deadlines) == 2
+    assert isinstance(deadlines[0], float)
+    assert deadlines[1] is None
     assert messages[-1] == ("lock", False)
 
 
@@ -74,3 +77,51 @@ def test_presence_cancels_lock() -> None:
 
     asyncio.run(run())
     assert locker.events == []
+
+
+def test_lock_state_forwarded_to_presence() -> None:
+    locker = FakeLocker()
+    states: list[bool] = []
+
+    class LockAwarePresence(FakePresence):
+        def set_locked(self, locked: bool) -> None:
+            states.append(locked)
+
+    presence = LockAwarePresence()
+
+    async def run() -> None:
+        mgr = ScreenLockManager(locker, presence, absent_timeout=0.01)
+        await mgr.start()
+        presence.emit(False)
+        await asyncio.sleep(0.02)
+        presence.emit(True)
+        await asyncio.sleep(0.01)
+
+    asyncio.run(run())
+    assert states == [True, False]
+
+
+def test_deadline_emitted_once_without_ticks() -> None:
+    messages: list[tuple[str, Any]] = []
+    locker = FakeLocker()
+    presence = FakePresence()
+
+    async def run() -> None:
+        mgr = ScreenLockManager(
+            locker, presence, absent_timeout=1.5, notify=messages.append
+        )
+        await mgr.start()
+        presence.emit(False)
+        await asyncio.sleep(0.05)
+        presence.emit(True)
+        await asyncio.sleep(0)
+
+    asyncio.run(run())
+    assert locker.events == []
+    assert [kind for kind, _ in messages] == [
+        "presence",
+        "deadline",
+        "presence",
+        "deadline",
+    ]
+    assert messages[-1] == ("deadline", None)
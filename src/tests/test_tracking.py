@@ -0,0 +1,63 @@
+import numpy as np
+
+from midori_ai_hello.tracking import IoUTracker, iou_matrix
+
+
+def test_iou_matrix() -> None:
+    a = np.array([[0, 0, 10, 10]])
+    b = np.array([[0, 0, 10, 10], [5, 0, 15, 10], [20, 20, 30, 30]])
+    assert np.allclose(iou_matrix(a, b), [[1.0, 1 / 3, 0.0]])
+    assert iou_matrix(a, np.empty((0, 4))).shape == (1, 0)
+
+
+def test_tracks_follow_boxes_and_request_verification() -> None:
+    tracker = IoUTracker(max_misses=1, reverify_interval=10.0)
+    box = np.array([[0, 0, 100, 100]])
+
+    assert tracker.update(box, now=0.0) is True  # new track
+    tracker.verify(box, np.array([0.9]), ["alice"], now=0.0)
+    assert tracker.confidence() == 0.9
+
+    # Small movement keeps the same verified track.
+    assert tracker.update(box + 5, now=1.0) is False
+    assert tracker.confidence() == 0.9
+    assert len(tracker.tracks) == 1
+
+    # Due for re-verification once the interval passes.
+    assert tracker.update(box + 5, now=11.0) is True
+
+
+def test_lost_track_is_dropped_after_misses() -> None:
+    tracker = IoUTracker(max_misses=1)
+    box = np.array([[0, 0, 100, 100]])
+    tracker.update(box, now=0.0)
+    tracker.verify(box, np.array([0.8]), ["alice"], now=0.0)
+
+    assert tracker.update(np.empty((0, 4)), now=1.0) is False
+    assert tracker.confidence() == 0.0  # not seen in this frame
+    assert tracker.update(np.empty((0, 4)), now=2.0) is True  # lost
+    assert tracker.tracks == []
+
+
+def test_verify_clears_unmatched_identity() -> None:
+    tracker = IoUTracker()
+    tracker.update(np.array([[0, 0, 10, 10], [50, 50, 60, 60]]), now=0.0)
+    tracker.verify(np.array([[50, 50, 60, 60]]), np.array([0.7]), ["bob"], now=0.0)
+    assert [t.label for t in tracker.tracks] == [None, "bob"]
+    assert tracker.confidence() == 0.7
+
+
+def test_scene_change_ignores_noise() -> None:
+    from midori_ai_hello.tracking import SceneChange
+
+    scene = SceneChange()
+    rng = np.random.default_rng(0)
+    base = rng.integers(0, 200, (480, 640, 3)).astype(np.uint8)
+    assert scene(base) is True  # no reference yet
+    assert scene(base + 2) is False  # sensor noise / lighting flicker
+    moved = base.copy()
+    moved[:, :320] = 255  # someone steps into half the view
+    assert scene(moved) is True
+    assert scene(moved) is False
+    scene.reset()
+    assert scene(moved) is True
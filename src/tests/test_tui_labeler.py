@@ -49,3 +49,55 @@ def test_capture_screen_handles_empty_camera_list(tmp_path: Path):
 def test_capture_screen_converts_numeric_camera_ids(tmp_path: Path) -> None:
     screen = CaptureScreen(tmp_path, cameras=["1"])
     assert screen.cameras == [1]
+
+
+@pytest.mark.skipif(cv2 is None, reason="opencv not available")
+def test_capture_reads_reacquire_reset_and_hung_cameras(
+    tmp_path: Path, monkeypatch
+) -> None:
+    import asyncio
+    import threading
+
+    from midori_ai_hello import camera_broker
+    from midori_ai_hello.camera_broker import CameraBroker
+
+    hang = threading.Event()
+    release = threading.Event()
+
+    class Source:
+        def isOpened(self) -> bool:  # noqa: N802
+            return True
+
+        def read(self):
+            if hang.is_set():
+                release.wait()
+            return True, np.zeros((4, 4, 3), dtype=np.uint8)
+
+        def release(self) -> None:
+            pass
+
+    monkeypatch.setattr(
+        camera_broker, "open_camera", lambda spec, profile=None: Source()
+    )
+    broker = CameraBroker(default_fps=1e9)  # no frame reuse between reads
+    screen = CaptureScreen(
+        tmp_path, cameras=["0"], broker=broker, camera_timeout=0.05
+    )
+    screen._open_camera()
+    first = screen._cap
+
+    async def run() -> list[bool]:
+        results = [(await screen._read_frame())[0]]
+        # Presence discarded the device: the capture handle is reacquired.
+        broker.discard(0)
+        results.append((await screen._read_frame())[0])
+        hang.set()
+        results.append((await screen._read_frame())[0])
+        return results
+
+    try:
+        assert asyncio.run(run()) == [True, True, False]
+        assert screen._cap is None
+        assert first is not None and not first.isOpened()
+    finally:
+        release.set()
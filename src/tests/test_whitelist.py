@@ -107,3 +107,29 @@ def test_host_secret_change_breaks_decryption(tmp_path: Path):
     manager2 = WhitelistManager(model_path=model, config_dir=config_dir)
     with pytest.raises(InvalidToken):
         manager2.users()
+
+
+def test_users_cached_until_files_change(tmp_path: Path, monkeypatch):
+    model = tmp_path / "model.pt"
+    model.write_bytes(b"model-weights")
+    manager = WhitelistManager(model_path=model, config_dir=tmp_path / "config")
+    manager.add_user("alice")
+
+    reads: list[int] = []
+    original = manager._decrypt
+
+    def counting_decrypt():
+        reads.append(1)
+        return original()
+
+    monkeypatch.setattr(manager, "_decrypt", counting_decrypt)
+    version = manager.version()
+    assert manager.users() == ["alice"]
+    assert manager.users() == ["alice"]
+    assert len(reads) == 1
+
+    other = WhitelistManager(model_path=model, config_dir=tmp_path / "config")
+    other.add_user("bob")
+    assert manager.version() != version
+    assert manager.users() == ["alice", "bob"]
+    assert len(reads) == 2